@@ -0,0 +1,362 @@
+#!/usr/bin/env bash
+# Agent Prompt Size Profiler
+# Feature: 003-agent-refactoring
+# Created: 2026-10-18
+#
+# Measures the fully expanded prompt of every agent in .claude/agents - the
+# agent file, the skills listed in its `skills:` frontmatter
+# (.claude/skills/<name>/SKILL.md or .claude/skills/<name>.md) and every
+# file either of them @-imports - and replaces the hand counts in
+# specs/003-agent-refactoring/baseline-metrics.md with tokens that are
+# tracked over time and checked against a budget.
+#
+# Imports are followed with .claude/lib/memory/resolve-imports.sh; a file
+# reached from several places is counted once. Tokens are estimated as
+# bytes / 4, rounded up, the same estimate the resolver uses.
+#
+# Baseline (append-only, one row per agent per saved run):
+#   <date>\t<kit_version>\t<agent>\t<lines>\t<tokens>
+#   Rows seeded from baseline-metrics.md carry lines only (tokens "-").
+#
+# Budgets (optional file, '#' comments allowed; "*" sets the default):
+#   <agent|*>\t<max_tokens>
+#   Falls back to PROMPT_BUDGET_TOKENS (default 10000).
+#
+# Usage (standalone, run from anywhere; paths are relative to PROMPT_ROOT):
+#   prompt-profile.sh report [AGENT...]        # sizes, budget use, baseline delta
+#   prompt-profile.sh sections AGENT [--top N] # where an agent's tokens go
+#   prompt-profile.sh check [AGENT...]         # exit 1 if any agent is over budget
+#   prompt-profile.sh baseline                 # append current sizes to the baseline
+#   prompt-profile.sh history [AGENT]          # baseline rows over time
+#   prompt-profile.sh seed [METRICS_MD]        # import a baseline-metrics.md table
+#
+# Usage (sourced; safe to source from scripts that do not use set -e):
+#   source .claude/lib/agents/prompt-profile.sh
+#   profile_agent .claude/agents/architect.md   # agent, files, lines, tokens
+
+PROFILE_DIR="$(cd "$(dirname "${BASH_SOURCE[0]}")" && pwd)"
+
+source "${PROFILE_DIR}/../memory/resolve-imports.sh"
+source "${PROFILE_DIR}/../version/kit-version.sh"
+
+PROMPT_ROOT="${PROMPT_ROOT:-$(cd "${PROFILE_DIR}/../../.." && pwd)}"
+PROMPT_AGENTS_DIR="${PROMPT_AGENTS_DIR:-.claude/agents}"
+PROMPT_SKILLS_DIR="${PROMPT_SKILLS_DIR:-.claude/skills}"
+PROMPT_BASELINE_FILE="${PROMPT_BASELINE_FILE:-.claude/metrics/prompt-baseline.tsv}"
+PROMPT_BUDGET_FILE="${PROMPT_BUDGET_FILE:-.claude/metrics/prompt-budgets.tsv}"
+PROMPT_BUDGET_TOKENS="${PROMPT_BUDGET_TOKENS:-10000}"
+
+# ============================================================================
+# Expansion
+# ============================================================================
+
+# Skill names from an agent's frontmatter: "skills: a, b", "skills: [a, b]"
+# or a YAML list under "skills:"
+agent_skills() {
+    awk '
+    NR == 1 && !/^---[ \t]*$/ { exit }
+    NR == 1 { next }
+    /^---[ \t]*$/ { exit }
+    /^skills:/ {
+        list = $0; sub(/^skills:[ \t]*/, "", list); gsub(/[][]/, "", list)
+        n = split(list, names, ",")
+        for (i = 1; i <= n; i++) { gsub(/^[ \t"\047]+|[ \t"\047]+$/, "", names[i]); if (names[i] != "") print names[i] }
+        in_list = 1; next
+    }
+    in_list && /^[ \t]+-[ \t]*/ { s = $0; sub(/^[ \t]+-[ \t]*/, "", s); gsub(/[ \t"\047]+$|^["\047]/, "", s); if (s != "") print s; next }
+    { in_list = 0 }
+    ' "$1"
+}
+
+# Path of a skill's prompt file (empty if it does not exist)
+skill_file() {
+    if [[ -f "${PROMPT_SKILLS_DIR}/$1/SKILL.md" ]]; then
+        echo "${PROMPT_SKILLS_DIR}/$1/SKILL.md"
+    elif [[ -f "${PROMPT_SKILLS_DIR}/$1.md" ]]; then
+        echo "${PROMPT_SKILLS_DIR}/$1.md"
+    fi
+}
+
+# Every file in an agent's expanded prompt, each once, in load order:
+#   <kind>\t<path>\t<lines>\t<tokens>
+#   kind: agent | skill | import | missing (skills and imports not found)
+agent_components() {
+    local agent_file="$1"
+    local roots=("$agent_file") skill path
+
+    while IFS= read -r skill; do
+        path=$(skill_file "$skill")
+        if [[ -n "$path" ]]; then
+            roots+=("$path")
+        else
+            printf 'missing\t%s/%s\t-\t-\n' "$PROMPT_SKILLS_DIR" "$skill"
+        fi
+    done < <(agent_skills "$agent_file")
+
+    { IMPORTS_ROOT="." resolve_imports "${roots[@]}" || true; } | awk -F'\t' '
+    $1 == "OK" && !($3 in seen) {
+        seen[$3] = 1
+        kind = ($2 > 0) ? "import" : (++roots == 1 ? "agent" : "skill")
+        printf "%s\t%s\t%s\t%s\n", kind, $3, $5, $6
+        next
+    }
+    $1 == "OK" && $2 == 0 { roots++ }
+    $1 == "MISSING" && !($3 in missing) { missing[$3] = 1; printf "missing\t%s\t-\t-\n", $3 }
+    '
+}
+
+# One summary line per agent: <agent>\t<files>\t<lines>\t<tokens>\t<missing>
+profile_agent() {
+    local agent_file="$1"
+
+    agent_components "$agent_file" | awk -F'\t' -v agent="$(basename "$agent_file" .md)" '
+    $1 == "missing" { m++; next }
+    { files++; lines += $3; tokens += $4 }
+    END { printf "%s\t%d\t%d\t%d\t%d\n", agent, files, lines, tokens, m }
+    '
+}
+
+# Token attribution by section across the expanded prompt, largest first:
+#   <tokens>\t<lines>\t<path>\t<section>
+# Sections start at "#" / "##" headings outside code fences; frontmatter
+# and text before the first heading are their own sections; blank-only
+# sections are dropped.
+agent_sections() {
+    local files=()
+    local path
+
+    while IFS=$'\t' read -r _ path _ _; do
+        files+=("$path")
+    done < <(agent_components "$1" | awk -F'\t' '$1 != "missing"')
+
+    LC_ALL=C awk '
+    function flush() {
+        if (text) printf "%d\t%d\t%s\t%s\n", int((bytes + 3) / 4), lines, FILENAME_PREV, name
+        bytes = 0; lines = 0; text = 0
+    }
+    FNR == 1 {
+        if (NR > 1) flush()
+        FILENAME_PREV = FILENAME
+        fence = 0; in_fm = /^---[ \t]*$/
+        name = in_fm ? "(frontmatter)" : "(preamble)"
+    }
+    FNR > 1 && in_fm && /^---[ \t]*$/ { bytes += length($0) + 1; lines++; flush(); in_fm = 0; name = "(preamble)"; next }
+    !in_fm && /^[ \t]*(```|~~~)/ { fence = !fence }
+    !in_fm && !fence && /^##?[ \t]/ { flush(); name = $0; sub(/^#+[ \t]+/, "", name); sub(/[ \t]+$/, "", name) }
+    { bytes += length($0) + 1; lines++ }
+    /[^ \t]/ { text = 1 }
+    END { if (NR > 0) flush() }
+    ' "${files[@]}" | sort -t$'\t' -k1,1nr -k3,3 -k4,4
+}
+
+# ============================================================================
+# Budgets and baseline
+# ============================================================================
+
+agent_budget() {
+    local agent="$1"
+    local budget=""
+
+    if [[ -f "$PROMPT_BUDGET_FILE" ]]; then
+        budget=$(awk -F'\t' -v a="$agent" '
+            /^#/ || NF < 2 { next }
+            $1 == a { own = $2 } $1 == "*" { def = $2 }
+            END { print (own != "") ? own : def }' "$PROMPT_BUDGET_FILE")
+    fi
+    echo "${budget:-$PROMPT_BUDGET_TOKENS}"
+}
+
+# Latest baseline tokens for an agent ("-" if none)
+baseline_tokens() {
+    local agent="$1"
+
+    if [[ ! -f "$PROMPT_BASELINE_FILE" ]]; then
+        echo "-"
+        return
+    fi
+    awk -F'\t' -v a="$agent" '$3 == a && $5 != "-" { t = $5 } END { print (t != "") ? t : "-" }' "$PROMPT_BASELINE_FILE"
+}
+
+# Agent files for the given names/paths (all agents if none)
+agent_files() {
+    local agent
+
+    if [[ $# -eq 0 ]]; then
+        if [[ -d "$PROMPT_AGENTS_DIR" ]]; then
+            find "$PROMPT_AGENTS_DIR" -maxdepth 1 -name '*.md' | sort
+        fi
+        return
+    fi
+
+    for agent in "$@"; do
+        if [[ -f "$agent" ]]; then
+            echo "$agent"
+        elif [[ -f "${PROMPT_AGENTS_DIR}/${agent%.md}.md" ]]; then
+            echo "${PROMPT_AGENTS_DIR}/${agent%.md}.md"
+        else
+            echo "Error: agent not found: $agent" >&2
+            return 1
+        fi
+    done
+}
+
+# ============================================================================
+# Commands
+# ============================================================================
+
+# Args: [--quiet] [AGENT...]; exit 1 if any agent is over budget.
+# --quiet prints only over-budget agents and the summary line.
+profile_report() {
+    local quiet=false
+
+    if [[ "${1:-}" == "--quiet" ]]; then
+        quiet=true
+        shift
+    fi
+
+    local files
+    files=$(agent_files "$@") || return 2
+    if [[ -z "$files" ]]; then
+        echo "No agents found in ${PROMPT_AGENTS_DIR}"
+        return 0
+    fi
+
+    local agent_file agent count lines tokens missing budget base delta pct mark
+    local over=0 total=0
+
+    if [[ "$quiet" == "false" ]]; then
+        printf '%-28s %5s %7s %8s %8s %5s %9s\n' "agent" "files" "lines" "tokens" "budget" "use" "vs base"
+    fi
+
+    while IFS= read -r agent_file; do
+        IFS=$'\t' read -r agent count lines tokens missing < <(profile_agent "$agent_file")
+        budget=$(agent_budget "$agent")
+        base=$(baseline_tokens "$agent")
+        pct=$((tokens * 100 / (budget > 0 ? budget : 1)))
+        delta="-"
+        if [[ "$base" != "-" ]]; then
+            delta=$(printf '%+d' $((tokens - base)))
+        fi
+
+        mark="✅"
+        if [[ $tokens -gt $budget ]]; then
+            mark="❌"
+            over=$((over + 1))
+        fi
+        total=$((total + 1))
+
+        if [[ "$quiet" == "false" || "$mark" == "❌" ]]; then
+            printf '%-28s %5d %7d %8d %8d %4d%% %9s %s%s\n' "$agent" "$count" "$lines" "$tokens" "$budget" "$pct" "$delta" "$mark" \
+                "$([[ $missing -gt 0 ]] && echo " (${missing} missing)")"
+        fi
+    done <<< "$files"
+
+    if [[ $over -gt 0 ]]; then
+        echo "❌ ${over} of ${total} agent(s) over prompt budget"
+        return 1
+    fi
+    echo "✅ ${total} agent(s) within prompt budget"
+}
+
+# Args: AGENT [--top N]
+profile_sections() {
+    local agent="${1:-}"
+    local top=0
+
+    if [[ -z "$agent" ]]; then
+        echo "Usage: prompt-profile.sh sections AGENT [--top N]" >&2
+        return 2
+    fi
+    if [[ "${2:-}" == "--top" ]]; then
+        top="${3:-0}"
+    fi
+
+    local agent_file
+    agent_file=$(agent_files "$agent") || return 2
+
+    agent_sections "$agent_file" | awk -F'\t' -v top="$top" '
+    { row[++n] = $0; total += $1 }
+    END {
+        printf "%8s %6s %6s  %s\n", "tokens", "share", "lines", "section"
+        for (i = 1; i <= n && (top == 0 || i <= top); i++) {
+            split(row[i], f, "\t")
+            printf "%8d %5.1f%% %6d  %s#%s\n", f[1], (total > 0 ? f[1] * 100 / total : 0), f[2], f[3], f[4]
+        }
+        printf "%8d %5.1f%%         total (%d sections)\n", total, 100, n
+    }'
+}
+
+profile_save_baseline() {
+    local files agent_file agent lines tokens today version
+    files=$(agent_files) || return 2
+    today=$(date +%Y-%m-%d)
+    version=$(kit_version "${PROMPT_ROOT}/CHANGELOG.md")
+
+    mkdir -p "$(dirname "$PROMPT_BASELINE_FILE")"
+    while IFS= read -r agent_file; do
+        [[ -n "$agent_file" ]] || continue
+        IFS=$'\t' read -r agent _ lines tokens _ < <(profile_agent "$agent_file")
+        printf '%s\t%s\t%s\t%s\t%s\n' "$today" "$version" "$agent" "$lines" "$tokens" >> "$PROMPT_BASELINE_FILE"
+    done <<< "$files"
+
+    echo "Baseline saved to ${PROMPT_BASELINE_FILE}"
+}
+
+# Import the "Agent Line Counts" table of a baseline-metrics.md file
+profile_seed() {
+    local metrics="${1:-specs/003-agent-refactoring/baseline-metrics.md}"
+
+    if [[ ! -f "$metrics" ]]; then
+        echo "Error: metrics file not found: $metrics" >&2
+        return 2
+    fi
+
+    mkdir -p "$(dirname "$PROMPT_BASELINE_FILE")"
+    awk -F'|' '
+    /^\*\*Date\*\*:/ { date = $0; sub(/^\*\*Date\*\*:[ \t]*/, "", date) }
+    /^## / { in_counts = ($0 ~ /Agent Line Counts/) }
+    in_counts && /\.md[ \t]*\|/ {
+        agent = $2; gsub(/^[ \t]+|[ \t]+$/, "", agent); sub(/\.md$/, "", agent)
+        lines = $3; gsub(/[^0-9]/, "", lines)
+        if (lines != "") printf "%s\tseed\t%s\t%s\t-\n", (date != "" ? date : "-"), agent, lines
+    }
+    ' "$metrics" >> "$PROMPT_BASELINE_FILE"
+
+    echo "Seeded ${PROMPT_BASELINE_FILE} from ${metrics}"
+}
+
+profile_history() {
+    local agent="${1:-}"
+
+    if [[ ! -f "$PROMPT_BASELINE_FILE" ]]; then
+        echo "No baseline yet (prompt-profile.sh baseline)"
+        return 0
+    fi
+
+    awk -F'\t' -v a="$agent" '
+    BEGIN { printf "%-10s %-8s %-28s %7s %8s\n", "date", "version", "agent", "lines", "tokens" }
+    a == "" || $3 == a { printf "%-10s %-8s %-28s %7s %8s\n", $1, $2, $3, $4, $5 }
+    ' "$PROMPT_BASELINE_FILE"
+}
+
+# ============================================================================
+# CLI
+# ============================================================================
+
+if [[ "${BASH_SOURCE[0]}" == "${0}" ]]; then
+    set -euo pipefail
+    cd "$PROMPT_ROOT"
+
+    case "${1:-report}" in
+        report) shift || true; profile_report "$@" ;;
+        check) shift; profile_report --quiet "$@" ;;
+        sections) shift; profile_sections "$@" ;;
+        baseline) profile_save_baseline ;;
+        history) shift; profile_history "$@" ;;
+        seed) shift; profile_seed "$@" ;;
+        *)
+            echo "Usage: prompt-profile.sh report|check [AGENT...] | sections AGENT [--top N] | baseline | history [AGENT] | seed [MD]" >&2
+            exit 2
+            ;;
+    esac
+fi
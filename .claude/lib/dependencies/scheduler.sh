@@ -0,0 +1,508 @@
+#!/usr/bin/env bash
+# Parallel Task Scheduler
+# Feature: 002-anthropic-updates-integration
+# Created: 2026-10-18
+#
+# Builds a dependency DAG from tasks.md and computes a wave schedule:
+# topologically ordered batches of tasks that can run concurrently, the
+# critical path, and the maximum concurrency.
+#
+# Implements the DependencyResolver contract from
+# specs/002-anthropic-updates-integration/contracts/integration-contracts.md:
+#   canStart(taskId)          -> schedule_can_start TASK
+#   getBlockers(taskId)       -> schedule_get_blockers TASK
+#   getReadyTasks()           -> schedule_ready_tasks
+#   validateDependencyGraph() -> schedule_validate
+#
+# Edges come from three sources:
+#   - inline references:  (Depends on: T001, T002) / depends_on: [T001]
+#   - "| Task | Depends On |" tables, including ranges such as T005-T009
+#   - document order (unless SCHEDULER_IMPLICIT_ORDER=false): tasks run in
+#     the order listed, except consecutive [P] tasks, which share the same
+#     predecessor and are all awaited by the next non-[P] task
+#
+# Parsing and scheduling are single awk passes; cycle detection uses Kahn's
+# algorithm, so the whole schedule is O(tasks + dependencies).
+#
+# Usage (standalone):
+#   scheduler.sh [--pending] [--json] [--explicit-only] <tasks.md> [command] [TASK]
+#   Commands: report (default), waves, ready, validate, can-start TASK, blockers TASK
+#
+# Usage (sourced):
+#   source .claude/lib/dependencies/scheduler.sh
+#   schedule_load specs/005-product-discovery-lifecycle/tasks.md
+#   schedule_waves
+#
+# Sourcing changes no shell options or traps: the loaded graph is kept in a
+# variable, so there is no temp file to clean up.
+
+# ============================================================================
+# State
+# ============================================================================
+
+SCHEDULER_IMPLICIT_ORDER="${SCHEDULER_IMPLICIT_ORDER:-true}"
+SCHEDULER_SOURCE_FILE="${SCHEDULER_SOURCE_FILE:-}"
+SCHEDULER_GRAPH=""
+SCHEDULER_LOADED=false
+
+# ============================================================================
+# Parsing
+# ============================================================================
+
+# Parse a tasks.md file into graph records on stdout:
+#   <task_id>\t<phase>\t<parallel 0|1>\t<pending|completed>\t<dep,dep,...>
+parse_task_graph() {
+    local tasks_file="$1"
+    local implicit=1
+
+    if [[ ! -f "$tasks_file" ]]; then
+        echo "Error: tasks file not found: $tasks_file" >&2
+        return 1
+    fi
+
+    [[ "$SCHEDULER_IMPLICIT_ORDER" == "false" ]] && implicit=0
+
+    awk -v implicit="$implicit" '
+    # Expand "T001, T003-T005" into "T001 T003 T004 T005"
+    function expand_ids(text,    out, tok, lo, hi, width, k, dash) {
+        out = ""
+        while (match(text, /T[0-9]+([ ]*-[ ]*T?[0-9]+)?/)) {
+            tok = substr(text, RSTART, RLENGTH)
+            text = substr(text, RSTART + RLENGTH)
+            dash = index(tok, "-")
+            if (dash) {
+                lo = substr(tok, 2, dash - 2)
+                hi = substr(tok, dash + 1)
+                gsub(/[^0-9]/, "", lo)
+                gsub(/[^0-9]/, "", hi)
+                width = length(lo)
+                for (k = lo + 0; k <= hi + 0; k++) out = out " " sprintf("T%0" width "d", k)
+            } else {
+                out = out " " tok
+            }
+        }
+        return out
+    }
+
+    function add_deps(task, list,    n, parts, i) {
+        n = split(list, parts, " ")
+        for (i = 1; i <= n; i++) {
+            if (parts[i] == "" || ((task, parts[i]) in has_dep)) continue
+            has_dep[task, parts[i]] = 1
+            deps[task] = (deps[task] == "") ? parts[i] : deps[task] "," parts[i]
+        }
+    }
+
+    BEGIN { in_front = 0; in_fence = 0; in_table = 0; phase = "-"; prev = ""; group = "" }
+
+    NR == 1 && /^---[ \t]*$/ { in_front = 1; next }
+    in_front { if (/^---[ \t]*$/) in_front = 0; next }
+
+    /^[ \t]*```/ { in_fence = !in_fence; next }
+    in_fence { next }
+
+    /^##+ / {
+        in_table = 0
+        if (group != "") { prev = group; group = "" }
+        if (/^## /) { phase = substr($0, 4); gsub(/\t/, " ", phase) }
+        next
+    }
+
+    # Dependency tables: | Task | Depends On | ... |
+    /^[ \t]*\|/ {
+        lower = tolower($0)
+        if (!in_table && lower ~ /\|[ \t]*task[ \t]*\|/ && lower ~ /depends[ _]on/) { in_table = 1; next }
+        if (in_table && $0 !~ /^[ \t]*\|[ \t:-]*\|/) {
+            n = split($0, cols, "|")
+            split(expand_ids(cols[2]), owners, " ")
+            dep_list = expand_ids(cols[3])
+            for (o in owners) if (owners[o] != "") table_deps[owners[o]] = table_deps[owners[o]] " " dep_list
+        }
+        next
+    }
+    { in_table = 0 }
+
+    /^[ \t]*[-*] \[[ xX]\] T[0-9]+/ {
+        match($0, /T[0-9]+/)
+        id = substr($0, RSTART, RLENGTH)
+        if (id in seen) next
+        seen[id] = 1
+        order[++count] = id
+
+        status[id] = ($0 ~ /^[ \t]*[-*] \[[xX]\]/) ? "completed" : "pending"
+        parallel[id] = ($0 ~ /\[P\]/) ? 1 : 0
+        task_phase[id] = phase
+
+        lower = tolower($0)
+        if (match(lower, /depends[ _]on:?/)) {
+            rest = substr($0, RSTART + RLENGTH)
+            if (match(rest, /[])]/)) rest = substr(rest, 1, RSTART - 1)
+            add_deps(id, expand_ids(rest))
+        }
+
+        if (implicit) {
+            if (parallel[id]) {
+                add_deps(id, prev)
+                group = group " " id
+            } else {
+                add_deps(id, (group != "") ? group : prev)
+                prev = id
+                group = ""
+            }
+        }
+        next
+    }
+
+    END {
+        for (id in table_deps) add_deps(id, table_deps[id])
+        for (i = 1; i <= count; i++) {
+            id = order[i]
+            printf "%s\t%s\t%d\t%s\t%s\n", id, task_phase[id], parallel[id], status[id], deps[id]
+        }
+    }
+    ' "$tasks_file"
+}
+
+# Parse tasks.md into the session graph used by the schedule_* functions
+schedule_load() {
+    local tasks_file="$1"
+    local graph
+
+    graph=$(parse_task_graph "$tasks_file") || return 1
+    SCHEDULER_GRAPH="$graph"
+    SCHEDULER_SOURCE_FILE="$tasks_file"
+    SCHEDULER_LOADED=true
+}
+
+require_schedule_loaded() {
+    if [[ "$SCHEDULER_LOADED" != "true" ]]; then
+        echo "Error: no task graph loaded (call schedule_load first)" >&2
+        return 1
+    fi
+}
+
+# Loaded graph records on stdout (nothing for a file without tasks)
+scheduler_graph() {
+    if [[ -n "$SCHEDULER_GRAPH" ]]; then
+        printf '%s\n' "$SCHEDULER_GRAPH"
+    fi
+}
+
+# ============================================================================
+# Scheduling
+# ============================================================================
+
+# Run the scheduler over the loaded graph.
+# Args: mode (validate|waves|ready|report|json), pending (0|1)
+run_schedule() {
+    local mode="$1"
+    local pending="${2:-0}"
+
+    require_schedule_loaded || return 1
+
+    scheduler_graph | awk -F'\t' -v mode="$mode" -v pending="$pending" -v source_file="$SCHEDULER_SOURCE_FILE" '
+    function json_list(from, to,    s, i) {
+        s = ""
+        for (i = from; i <= to; i++) s = s (i > from ? ", " : "") "\"" path[i] "\""
+        return s
+    }
+
+    {
+        n++
+        id[n] = $1; idx[$1] = n; par[n] = $3; st[n] = $4; dep_list[n] = $5
+    }
+
+    END {
+        errors = 0
+        live = 0
+        parallel_count = 0
+
+        for (i = 1; i <= n; i++) {
+            if (pending && st[i] == "completed") { skip[i] = 1; continue }
+            live++
+            if (par[i]) parallel_count++
+        }
+
+        # Build adjacency; self and missing references are reported, not scheduled
+        for (i = 1; i <= n; i++) {
+            if (skip[i]) continue
+            m = split(dep_list[i], d, ",")
+            for (j = 1; j <= m; j++) {
+                if (d[j] == "") continue
+                if (d[j] == id[i]) {
+                    err[++errors] = "SELF_DEPENDENCY\t" id[i] "\t" id[i] " depends on itself"
+                    continue
+                }
+                if (!(d[j] in idx)) {
+                    err[++errors] = "MISSING_TASK\t" id[i] "\t" id[i] " depends on unknown task " d[j]
+                    missing[i] = 1
+                    continue
+                }
+                k = idx[d[j]]
+                if (skip[k]) continue
+                indeg[i]++
+                succ[k, ++nsucc[k]] = i
+                pred[i, ++npred[i]] = k
+            }
+        }
+
+        # Kahn: FIFO topological order; level = longest dependency chain
+        head = 1; tail = 0
+        for (i = 1; i <= n; i++) {
+            if (!skip[i] && indeg[i] == 0) { queue[++tail] = i; level[i] = 1; ready[i] = 1 }
+        }
+        waves = 0
+        while (head <= tail) {
+            u = queue[head++]
+            if (level[u] > waves) waves = level[u]
+            for (j = 1; j <= nsucc[u]; j++) {
+                v = succ[u, j]
+                if (level[u] + 1 > level[v]) { level[v] = level[u] + 1; via[v] = u }
+                if (--indeg[v] == 0) queue[++tail] = v
+            }
+        }
+        scheduled = tail
+
+        # Anything left unscheduled sits on or behind a cycle; walk back
+        # through unscheduled predecessors until a task repeats
+        if (scheduled < live) {
+            for (i = 1; i <= n; i++) if (!skip[i] && indeg[i] > 0) break
+            steps = 0
+            cur = i
+            while (!(cur in step)) {
+                step[cur] = ++steps
+                walk[steps] = cur
+                for (j = 1; j <= npred[cur]; j++) if (indeg[pred[cur, j]] > 0) break
+                cur = pred[cur, j]
+            }
+            cycle = id[cur]
+            for (j = step[cur] + 1; j <= steps; j++) cycle = cycle " -> " id[walk[j]]
+            cycle = cycle " -> " id[cur]
+            err[++errors] = "CIRCULAR\t" id[cur] "\t" cycle " (" live - scheduled " task(s) unschedulable)"
+        }
+
+        if (mode == "validate") {
+            for (e = 1; e <= errors; e++) print err[e]
+            exit (errors > 0) ? 1 : 0
+        }
+
+        # An unknown dependency is a blocker (as in schedule_get_blockers)
+        if (mode == "ready") {
+            for (i = 1; i <= n; i++) if (ready[i] && !missing[i]) print id[i]
+            exit 0
+        }
+
+        # Group by wave in topological (FIFO) order
+        max_width = 0; max_wave = 0
+        for (q = 1; q <= scheduled; q++) {
+            u = queue[q]
+            w = level[u]
+            members[w] = (members[w] == "") ? id[u] : members[w] " " id[u]
+            width[w]++
+        }
+        for (w = 1; w <= waves; w++) if (width[w] > max_width) { max_width = width[w]; max_wave = w }
+
+        # Critical path: follow "via" back from the first task on the last wave
+        plen = 0
+        for (q = scheduled; q >= 1; q--) if (level[queue[q]] == waves) end_node = queue[q]
+        if (scheduled > 0) {
+            for (u = end_node; u != ""; u = via[u]) rev[++plen] = id[u]
+            for (j = 1; j <= plen; j++) path[j] = rev[plen - j + 1]
+        }
+
+        pct = (live > 0) ? int(parallel_count * 100 / live + 0.5) : 0
+
+        if (mode == "waves") {
+            for (w = 1; w <= waves; w++) printf "%d\t%s\n", w, members[w]
+            exit (errors > 0) ? 1 : 0
+        }
+
+        if (mode == "json") {
+            printf "{\n"
+            printf "  \"source\": \"%s\",\n", source_file
+            printf "  \"pending_only\": %s,\n", pending ? "true" : "false"
+            printf "  \"tasks\": %d,\n", live
+            printf "  \"parallel_marked\": %d,\n", parallel_count
+            printf "  \"critical_path_length\": %d,\n", plen
+            printf "  \"critical_path\": [%s],\n", json_list(1, plen)
+            printf "  \"max_concurrency\": %d,\n", max_width
+            printf "  \"waves\": ["
+            for (w = 1; w <= waves; w++) {
+                m = split(members[w], wm, " ")
+                s = ""
+                for (j = 1; j <= m; j++) s = s (j > 1 ? ", " : "") "\"" wm[j] "\""
+                printf "%s\n    [%s]", (w > 1 ? "," : ""), s
+            }
+            printf "%s],\n", (waves > 0 ? "\n  " : "")
+            printf "  \"errors\": ["
+            for (e = 1; e <= errors; e++) {
+                split(err[e], ef, "\t")
+                printf "%s\n    {\"type\": \"%s\", \"taskId\": \"%s\", \"details\": \"%s\"}", (e > 1 ? "," : ""), ef[1], ef[2], ef[3]
+            }
+            printf "%s]\n}\n", (errors > 0 ? "\n  " : "")
+            exit (errors > 0) ? 1 : 0
+        }
+
+        # report
+        if (source_file != "") print "Schedule: " source_file (pending ? " (pending tasks only)" : "")
+        printf "  Tasks:            %d (%d [P], %d%% parallelizable)\n", live, parallel_count, pct
+        printf "  Waves:            %d\n", waves
+        printf "  Critical path:    %d task(s)\n", plen
+        printf "  Max concurrency:  %d (wave %d)\n", max_width, max_wave
+        print ""
+        for (w = 1; w <= waves; w++) printf "  Wave %d (%d): %s\n", w, width[w], members[w]
+        if (plen > 0) {
+            s = path[1]
+            for (j = 2; j <= plen; j++) s = s " → " path[j]
+            print ""
+            print "  Critical path: " s
+        }
+        if (errors > 0) {
+            print ""
+            for (e = 1; e <= errors; e++) {
+                split(err[e], ef, "\t")
+                printf "  ❌ %s: %s\n", ef[1], ef[3]
+            }
+            exit 1
+        }
+    }
+    '
+}
+
+# ============================================================================
+# DependencyResolver contract
+# ============================================================================
+
+# canStart: task is pending and every dependency is completed
+schedule_can_start() {
+    local task_id="$1"
+    local blockers
+
+    require_schedule_loaded || return 1
+
+    if ! scheduler_graph | awk -F'\t' -v t="$task_id" '$1 == t && $4 == "pending" { found = 1 } END { exit !found }'; then
+        return 1
+    fi
+
+    blockers=$(schedule_get_blockers "$task_id")
+    [[ -z "$blockers" ]]
+}
+
+# getBlockers: dependencies of TASK that are not completed (or do not exist)
+schedule_get_blockers() {
+    local task_id="$1"
+
+    require_schedule_loaded || return 1
+
+    scheduler_graph | awk -F'\t' -v t="$task_id" '
+        { status[$1] = $4 }
+        $1 == t { deps = $5 }
+        END {
+            n = split(deps, d, ",")
+            for (i = 1; i <= n; i++) if (d[i] != "" && d[i] != t && status[d[i]] != "completed") print d[i]
+        }
+    '
+}
+
+# getReadyTasks: pending tasks whose dependencies are all completed (and exist)
+schedule_ready_tasks() {
+    run_schedule ready 1
+}
+
+# validateDependencyGraph: one "<TYPE>\t<taskId>\t<details>" line per error;
+# returns 1 when the graph is invalid
+schedule_validate() {
+    run_schedule validate 0
+}
+
+# ============================================================================
+# Schedule views
+# ============================================================================
+
+# Waves as "<wave>\t<task task ...>"; pass 1 to schedule pending tasks only
+schedule_waves() {
+    run_schedule waves "${1:-0}"
+}
+
+# Human-readable summary, or JSON with --json; pass --pending to skip completed tasks
+schedule_report() {
+    local mode="report"
+    local pending=0
+    local arg
+
+    for arg in "$@"; do
+        case "$arg" in
+            --json) mode="json" ;;
+            --pending) pending=1 ;;
+        esac
+    done
+
+    run_schedule "$mode" "$pending"
+}
+
+# ============================================================================
+# CLI
+# ============================================================================
+
+scheduler_usage() {
+    cat <<'EOF'
+Usage: scheduler.sh [--pending] [--json] [--explicit-only] <tasks.md> [command] [TASK]
+
+Commands:
+  report          Waves, critical path and max concurrency (default)
+  waves           One line per wave: <wave>\t<task ids>
+  ready           Pending tasks whose dependencies are complete
+  validate        Report SELF_DEPENDENCY / MISSING_TASK / CIRCULAR errors
+  can-start TASK  Exit 0 if TASK can start now
+  blockers TASK   Incomplete dependencies of TASK
+
+Options:
+  --pending        Schedule only tasks not yet marked [x]
+  --json           Machine-readable report
+  --explicit-only  Ignore document order; use only declared dependencies
+EOF
+}
+
+scheduler_main() {
+    local pending=0 json=""
+    local args=()
+
+    while [[ $# -gt 0 ]]; do
+        case "$1" in
+            --pending) pending=1 ;;
+            --json) json="--json" ;;
+            --explicit-only) SCHEDULER_IMPLICIT_ORDER=false ;;
+            -h|--help) scheduler_usage; return 0 ;;
+            *) args+=("$1") ;;
+        esac
+        shift
+    done
+
+    if [[ ${#args[@]} -lt 1 ]]; then
+        scheduler_usage >&2
+        return 1
+    fi
+
+    schedule_load "${args[0]}"
+
+    case "${args[1]:-report}" in
+        report)
+            if [[ $pending -eq 1 ]]; then
+                schedule_report $json --pending
+            else
+                schedule_report $json
+            fi
+            ;;
+        waves) schedule_waves "$pending" ;;
+        ready) schedule_ready_tasks ;;
+        validate) schedule_validate ;;
+        can-start) schedule_can_start "${args[2]:?task id required}" ;;
+        blockers) schedule_get_blockers "${args[2]:?task id required}" ;;
+        *) scheduler_usage >&2; return 1 ;;
+    esac
+}
+
+if [[ "${BASH_SOURCE[0]}" == "${0}" ]]; then
+    set -euo pipefail
+    scheduler_main "$@"
+fi
@@ -0,0 +1,280 @@
+#!/usr/bin/env bash
+# @-reference Import Resolver
+# Feature: 001-claude-code-memory
+# Created: 2026-10-18
+#
+# Walks the @-import graph of CLAUDE.md (or any agent/rule file) the way
+# Claude Code assembles context, and reports what each file contributes.
+#
+# Follows the @-reference rules in specs/001-claude-code-memory/data-model.md
+# and contracts/file-contracts.md:
+#   - @relative/path.md, @/absolute/path.md and @~/home/path.md; only
+#     .md targets or explicit ./, ../, / and ~/ paths count as imports, so
+#     prose such as `npm i -g @anthropic-ai/claude-code` is not an import
+#   - references inside fenced code blocks and `inline code` are ignored
+#   - nesting depth <= 5 hops (--max-depth), no circular references
+#
+# Relative references resolve against the importing file's directory first,
+# then against the repository root (--root, default "."), so both styles
+# used in this repo work.
+#
+# The traversal is one depth-first pass in a single awk process: a file is
+# read only when first reached, parsed once per distinct content, and
+# records stream out as files are visited. Cycle, depth and missing-file
+# errors are all found in that same pass.
+#
+# Records (tsv mode):
+#   <status>\t<depth>\t<path>\t<parent>\t<lines>\t<tokens>\t<detail>
+#   status: OK | SEEN (already loaded) | MISSING | CIRCULAR | MAX_DEPTH
+# Tokens are estimated as bytes / 4, rounded up.
+#
+# Usage (standalone):
+#   resolve-imports.sh [--max-depth N] [--root DIR] [report|tree|tsv|expand] FILE...
+#   Exits 1 if any MISSING, CIRCULAR or MAX_DEPTH error is found.
+#
+# Usage (sourced; safe to source from scripts that do not use set -e):
+#   source .claude/lib/memory/resolve-imports.sh
+#   resolve_imports CLAUDE.md | awk -F'\t' '$1 == "OK" { t += $6 } END { print t }'
+
+IMPORTS_MAX_DEPTH="${IMPORTS_MAX_DEPTH:-5}"
+IMPORTS_ROOT="${IMPORTS_ROOT:-.}"
+
+# ============================================================================
+# Traversal
+# ============================================================================
+
+# Stream import records for one or more root files (see header for format)
+resolve_imports() {
+    LC_ALL=C awk -v max_depth="$IMPORTS_MAX_DEPTH" -v root_dir="$IMPORTS_ROOT" -v home="${HOME:-}" '
+    function normalize(p,    n, parts, out, i, k, abs) {
+        abs = (substr(p, 1, 1) == "/")
+        n = split(p, parts, "/")
+        k = 0
+        for (i = 1; i <= n; i++) {
+            if (parts[i] == "" || parts[i] == ".") continue
+            if (parts[i] == ".." && k > 0 && out[k] != "..") { k--; continue }
+            if (parts[i] == ".." && abs) continue
+            out[++k] = parts[i]
+        }
+        p = ""
+        for (i = 1; i <= k; i++) p = p (i > 1 ? "/" : "") out[i]
+        if (abs) return "/" p
+        return (p == "") ? "." : p
+    }
+
+    function dirname(p) {
+        if (match(p, /\/[^\/]*$/)) return (RSTART == 1) ? "/" : substr(p, 1, RSTART - 1)
+        return "."
+    }
+
+    # @-references in a file body, one per line
+    function extract(content,    n, body, i, line, fence, refs, ref) {
+        n = split(content, body, "\n")
+        fence = 0
+        refs = ""
+        for (i = 1; i <= n; i++) {
+            line = body[i]
+            if (line ~ /^[ \t]*(```|~~~)/) { fence = !fence; continue }
+            if (fence) continue
+            gsub(/`[^`]*`/, "", line)
+            while (match(line, /(^|[ \t(\[])@[~.\/A-Za-z0-9_][^ \t)\]`]*/)) {
+                ref = substr(line, RSTART, RLENGTH)
+                line = substr(line, RSTART + RLENGTH)
+                sub(/^[^@]*@/, "", ref)
+                sub(/[.,;:!?]+$/, "", ref)
+                # Markdown files, or explicit paths; not npm scopes like @org/pkg
+                if (ref ~ /\.md$/ || ref ~ /^(\.\.?|~)?\//) refs = refs ref "\n"
+            }
+        }
+        return refs
+    }
+
+    # Read a file once; 0 if it cannot be read. Non-.md targets are checked
+    # with test -f first, since reading a directory is fatal in some awks.
+    function load(p,    line, rc, n, content, quoted) {
+        if (p in readable) return readable[p]
+        if (p !~ /\.md$/) {
+            quoted = p
+            gsub(/\047/, "\047\\\047\047", quoted)
+            if (system("test -f \047" quoted "\047") != 0) { readable[p] = 0; return 0 }
+        }
+        n = 0
+        content = ""
+        while ((rc = (getline line < p)) > 0) {
+            n++
+            content = content line "\n"
+        }
+        close(p)
+        if (rc < 0) { readable[p] = 0; return 0 }
+        readable[p] = 1
+        lines[p] = n
+        tokens[p] = int((length(content) + 3) / 4)
+        if (!(content in parsed)) parsed[content] = extract(content)
+        refs[p] = parsed[content]
+        return 1
+    }
+
+    function resolve(ref, from,    cand) {
+        if (ref ~ /^~\//) return normalize(home substr(ref, 2))
+        if (ref ~ /^\//) return normalize(ref)
+        cand = normalize(dirname(from) "/" ref)
+        if (load(cand)) return cand
+        return normalize(root_dir "/" ref)
+    }
+
+    function emit(status, depth, p, parent, detail) {
+        printf "%s\t%d\t%s\t%s\t%s\t%s\t%s\n", status, depth, p, parent, \
+            (status == "OK" || status == "SEEN") ? lines[p] : "-", \
+            (status == "OK" || status == "SEEN") ? tokens[p] : "-", detail
+        fflush()
+    }
+
+    function visit(p, depth, parent, chain,    n, list, i, child) {
+        seen[p] = 1
+        on_stack[p] = 1
+        emit("OK", depth, p, parent, chain)
+
+        n = split(refs[p], list, "\n")
+        for (i = 1; i <= n; i++) {
+            if (list[i] == "") continue
+            child = resolve(list[i], p)
+            if (!load(child)) {
+                emit("MISSING", depth + 1, child, p, "@" list[i])
+                errors++
+            } else if (on_stack[child]) {
+                emit("CIRCULAR", depth + 1, child, p, chain " -> " child)
+                errors++
+            } else if (child in seen) {
+                emit("SEEN", depth + 1, child, p, chain " -> " child)
+            } else if (depth + 1 > max_depth) {
+                emit("MAX_DEPTH", depth + 1, child, p, chain " -> " child)
+                errors++
+            } else {
+                visit(child, depth + 1, p, chain " -> " child)
+            }
+        }
+        on_stack[p] = 0
+    }
+
+    BEGIN {
+        for (a = 1; a < ARGC; a++) {
+            start = normalize(ARGV[a])
+            for (p in seen) delete seen[p]
+            if (!load(start)) {
+                emit("MISSING", 0, start, "-", "root file")
+                errors++
+                continue
+            }
+            visit(start, 0, "-", start)
+        }
+        exit (errors > 0)
+    }
+    ' "$@"
+}
+
+# ============================================================================
+# Reports
+# ============================================================================
+
+# Per-file line/token budget: own size plus everything it pulls in
+imports_report() {
+    local records status=0
+    records=$(resolve_imports "$@") || status=$?
+
+    echo "$records" | awk -F'\t' '
+    $1 == "OK" {
+        if ($2 == 0) root = $3
+        key = root SUBSEP $3
+        order[++n] = key
+        depth[key] = $2
+        parent[key] = $4
+        self_lines[key] = $5
+        self_tokens[key] = $6
+        # Roll this file into every ancestor on its first-inclusion path
+        for (p = $3; p != "-" && p != ""; p = parent[root SUBSEP p]) {
+            total_lines[root SUBSEP p] += $5
+            total_tokens[root SUBSEP p] += $6
+        }
+    }
+    $1 != "OK" && $1 != "SEEN" { problems[++m] = $1 "\t" $3 "\t" $7 }
+
+    END {
+        printf "%-56s %5s %7s %7s %10s %10s\n", "file", "depth", "lines", "tokens", "tot lines", "tot tokens"
+        for (i = 1; i <= n; i++) {
+            key = order[i]
+            split(key, parts, SUBSEP)
+            if (depth[key] == 0 && i > 1) print ""
+            printf "%-56s %5d %7d %7d %10d %10d\n", sprintf("%*s%s", depth[key] * 2, "", parts[2]), \
+                depth[key], self_lines[key], self_tokens[key], total_lines[key], total_tokens[key]
+        }
+        if (m > 0) {
+            print ""
+            for (i = 1; i <= m; i++) {
+                split(problems[i], f, "\t")
+                printf "  %s: %s (%s)\n", f[1], f[2], f[3]
+            }
+        }
+    }'
+
+    return "$status"
+}
+
+# Indented import tree with status markers
+imports_tree() {
+    local records status=0
+    records=$(resolve_imports "$@") || status=$?
+
+    echo "$records" | awk -F'\t' '{
+        mark = ($1 == "OK") ? "" : "  [" $1 "]"
+        size = ($5 != "-") ? sprintf("  (%s lines, ~%s tokens)", $5, $6) : ""
+        printf "%*s%s%s%s\n", $2 * 2, "", ($2 > 0 ? "@" : ""), $3, ($1 == "OK" ? size : "") mark
+    }'
+
+    return "$status"
+}
+
+# Fully expanded context: every file once, in load order
+imports_expand() {
+    local records status=0 file
+    records=$(resolve_imports "$@") || status=$?
+
+    while IFS= read -r file; do
+        echo "<!-- @${file} -->"
+        cat "$file"
+    done < <(echo "$records" | awk -F'\t' '$1 == "OK" { print $3 }')
+
+    return "$status"
+}
+
+# ============================================================================
+# CLI
+# ============================================================================
+
+if [[ "${BASH_SOURCE[0]}" == "${0}" ]]; then
+    set -euo pipefail
+    usage() {
+        echo "Usage: resolve-imports.sh [--max-depth N] [--root DIR] [report|tree|tsv|expand] FILE..." >&2
+        exit 2
+    }
+
+    mode="report"
+    while [[ $# -gt 0 ]]; do
+        case "$1" in
+            --max-depth) IMPORTS_MAX_DEPTH="$2"; shift ;;
+            --root) IMPORTS_ROOT="$2"; shift ;;
+            report|tree|tsv|expand) mode="$1" ;;
+            -h|--help) usage ;;
+            *) break ;;
+        esac
+        shift
+    done
+
+    [[ $# -gt 0 ]] || usage
+
+    case "$mode" in
+        report) imports_report "$@" ;;
+        tree) imports_tree "$@" ;;
+        tsv) resolve_imports "$@" ;;
+        expand) imports_expand "$@" ;;
+    esac
+fi
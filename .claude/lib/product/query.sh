@@ -0,0 +1,380 @@
+#!/usr/bin/env bash
+# Product Artifact Index and Query
+# Feature: 005-product-discovery-lifecycle
+# Created: 2026-10-18
+#
+# Builds a compact index of the product tables and triad sign-offs, and
+# answers questions about them without re-reading every markdown file:
+#   - docs/product/02_PRD/INDEX.md          PRD registry
+#   - docs/product/_backlog/01_IDEAS.md     ideas with ICE scores
+#   - docs/product/_backlog/02_USER_STORIES.md
+#   - specs/*/{spec,plan,tasks}.md          pm/architect/techlead sign-offs,
+#     from `triad:` frontmatter or the older `- **pm_signoff**:` metadata list
+#
+# The index is rebuilt incrementally: sources are stat'ed in one call and
+# only files whose mtime or size changed are re-parsed (in a single awk
+# pass); records of unchanged files are kept as-is.
+#
+# Index: ${PRODUCT_INDEX_FILE:-.claude/cache/product-index.tsv}, one record
+# per line, tab-separated, first two columns <type> and <source>:
+#   prd      id title status created owner prd_file spec
+#   idea     id title origin date status ice impact confidence effort
+#   story    id title priority ice origin status
+#   signoff  feature artifact role agent date status notes
+# Statuses are normalized ("✅ Delivered" -> "Delivered"); a null sign-off
+# is recorded as PENDING. ICE "24 (I:6 C:9 E:9)" is split into its parts.
+#
+# Usage:
+#   query.sh build [--force]
+#   query.sh prds|ideas|stories|signoffs [--status S] [--min-ice N]
+#            [--role pm|architect|techlead] [--artifact spec|plan|tasks] [--feature ID]
+#   query.sh approved-not-delivered
+#
+# Examples:
+#   query.sh ideas --min-ice 20
+#   query.sh signoffs --role architect --status CHANGES_REQUESTED
+
+PRODUCT_ROOT="${PRODUCT_ROOT:-$(cd "$(dirname "${BASH_SOURCE[0]}")/../../.." && pwd)}"
+PRODUCT_INDEX_FILE="${PRODUCT_INDEX_FILE:-${PRODUCT_ROOT}/.claude/cache/product-index.tsv}"
+PRODUCT_INDEX_SOURCES="${PRODUCT_INDEX_FILE%.tsv}.sources"
+
+# Column names per record type (after <type> and <source>)
+PRODUCT_COLUMNS_prd="id title status created owner prd_file spec"
+PRODUCT_COLUMNS_idea="id title origin date status ice impact confidence effort"
+PRODUCT_COLUMNS_story="id title priority ice origin status"
+PRODUCT_COLUMNS_signoff="feature artifact role agent date status notes"
+
+# ============================================================================
+# Sources
+# ============================================================================
+
+# Source files that exist, relative to PRODUCT_ROOT
+product_sources() {
+    local f
+
+    for f in docs/product/02_PRD/INDEX.md \
+             docs/product/_backlog/01_IDEAS.md \
+             docs/product/_backlog/02_USER_STORIES.md \
+             specs/*/spec.md specs/*/plan.md specs/*/tasks.md; do
+        [[ -f "${PRODUCT_ROOT}/${f}" ]] && echo "$f"
+    done
+    return 0
+}
+
+# "<file>\t<mtime>:<size>" for each file argument, in one stat call
+product_stamps() {
+    [[ $# -gt 0 ]] || return 0
+    stat -c $'%n\t%Y:%s' "$@" 2>/dev/null || stat -f $'%N\t%m:%z' "$@"
+}
+
+# ============================================================================
+# Parsing
+# ============================================================================
+
+# Parse source files (relative paths) into index records on stdout
+product_parse() {
+    [[ $# -gt 0 ]] || return 0
+
+    awk '
+    function trim(s) { gsub(/^[ \t]+|[ \t]+$/, "", s); return s }
+    function clean(s) { gsub(/\t/, " ", s); return trim(s) }
+
+    # "✅ Delivered" -> "Delivered"
+    function status(s) { s = trim(s); sub(/^[^A-Za-z]+/, "", s); return s }
+
+    # [text](target) -> text
+    function link_text(s,    t) {
+        while (match(s, /\[[^\]]*\]\([^)]*\)/)) {
+            t = substr(s, RSTART + 1, RLENGTH - 2)
+            sub(/\]\(.*$/, "", t)
+            s = substr(s, 1, RSTART - 1) t substr(s, RSTART + RLENGTH)
+        }
+        return trim(s)
+    }
+
+    # First link target resolved against dir, else the plain text (or "-")
+    function link_target(s, dir, plain,    t, n, parts, out, i, k) {
+        if (!match(s, /\]\([^)]*\)/)) return plain ? trim(s) : "-"
+        t = substr(s, RSTART + 2, RLENGTH - 3)
+        n = split(dir "/" t, parts, "/")
+        k = 0
+        for (i = 1; i <= n; i++) {
+            if (parts[i] == "" || parts[i] == ".") continue
+            if (parts[i] == ".." && k > 0) { k--; continue }
+            out[++k] = parts[i]
+        }
+        t = ""
+        for (i = 1; i <= k; i++) t = t (i > 1 ? "/" : "") out[i]
+        return t
+    }
+
+    function cell(name) { return (name in col) ? cells[col[name]] : "" }
+
+    # "24 (I:6 C:9 E:9)" -> ice, impact, confidence, effort
+    function ice(s,    v) {
+        ice_total = "-"; ice_i = "-"; ice_c = "-"; ice_e = "-"
+        if (match(s, /[0-9]+(\.[0-9]+)?/)) ice_total = substr(s, RSTART, RLENGTH)
+        if (match(s, /I:[ ]*[0-9]+/)) { v = substr(s, RSTART, RLENGTH); sub(/I:[ ]*/, "", v); ice_i = v }
+        if (match(s, /C:[ ]*[0-9]+/)) { v = substr(s, RSTART, RLENGTH); sub(/C:[ ]*/, "", v); ice_c = v }
+        if (match(s, /E:[ ]*[0-9]+/)) { v = substr(s, RSTART, RLENGTH); sub(/E:[ ]*/, "", v); ice_e = v }
+    }
+
+    function out(type, fields) { print type "\t" FILENAME "\t" fields }
+
+    function flush_signoff() {
+        if (role == "") return
+        in_frontmatter[FILENAME, role] = 1
+        out("signoff", feature "\t" artifact "\t" role "\t" (agent == "" ? "-" : agent) "\t" \
+            (date == "" ? "-" : date) "\t" (st == "" ? "PENDING" : st) "\t" (notes == "" ? "-" : clean(notes)))
+        role = ""; agent = ""; date = ""; st = ""; notes = ""
+    }
+
+    function role_name(r) { return (r == "teamlead") ? "techlead" : r }
+
+    function unquote(s) {
+        s = trim(s)
+        if (s ~ /^".*"$/ || s ~ /^\047.*\047$/) s = substr(s, 2, length(s) - 2)
+        return s
+    }
+
+    FNR == 1 {
+        flush_signoff()
+        in_table = 0; in_fm = 0; in_triad = 0; fence = 0
+        kind = ""
+        if (FILENAME ~ /02_PRD\/INDEX\.md$/) kind = "prd"
+        else if (FILENAME ~ /01_IDEAS\.md$/) kind = "idea"
+        else if (FILENAME ~ /02_USER_STORIES\.md$/) kind = "story"
+        else if (FILENAME ~ /^specs\//) {
+            kind = "signoff"
+            n = split(FILENAME, p, "/")
+            feature = p[n - 1]
+            artifact = p[n]; sub(/\.md$/, "", artifact)
+        }
+        dir = FILENAME; sub(/\/[^\/]*$/, "", dir)
+        if (kind == "signoff" && $0 ~ /^---[ \t]*$/) { in_fm = 1; next }
+    }
+
+    # ---- Markdown tables (prd / idea / story) ----
+    kind != "signoff" && /^[ \t]*```/ { fence = !fence; in_table = 0; next }
+    kind != "signoff" && !fence && /^[ \t]*\|/ {
+        line = $0
+        gsub(/\\\|/, "\001", line)
+        sub(/^[ \t]*\|/, "", line); sub(/\|[ \t]*$/, "", line)
+        n = split(line, cells, "|")
+        for (i = 1; i <= n; i++) { gsub(/\001/, "|", cells[i]); cells[i] = trim(cells[i]) }
+
+        if (!in_table) {
+            for (c in col) delete col[c]
+            for (i = 1; i <= n; i++) col[tolower(cells[i])] = i
+            in_table = 1
+            next
+        }
+        if (cells[1] ~ /^:?-+:?$/) next
+
+        if (kind == "prd" && ("id" in col) && ("title" in col)) {
+            out("prd", cell("id") "\t" clean(link_text(cell("title"))) "\t" status(cell("status")) "\t" \
+                cell("created") "\t" cell("owner") "\t" link_target(cell("title"), dir, 0) "\t" \
+                link_target(cell("related spec"), dir, 1))
+        } else if (kind == "idea" && ("id" in col)) {
+            ice(cell("ice score"))
+            out("idea", cell("id") "\t" clean(cell("idea")) "\t" cell("source") "\t" cell("date") "\t" \
+                status(cell("status")) "\t" ice_total "\t" ice_i "\t" ice_c "\t" ice_e)
+        } else if (kind == "story" && ("story id" in col)) {
+            ice(cell("ice score"))
+            out("story", cell("story id") "\t" clean(cell("story")) "\t" cell("priority") "\t" \
+                ice_total "\t" cell("source") "\t" status(cell("status")))
+        }
+        next
+    }
+    kind != "signoff" { in_table = 0; next }
+
+    # ---- triad: frontmatter ----
+    in_fm && /^---[ \t]*$/ { flush_signoff(); in_fm = 0; in_triad = 0; next }
+    in_fm && /^triad:/ { in_triad = 1; next }
+    in_fm && /^[^ #]/ { flush_signoff(); in_triad = 0; next }
+    in_triad && /^  [a-z]+_signoff:/ {
+        flush_signoff()
+        r = $0; sub(/^  /, "", r); sub(/_signoff:.*$/, "", r)
+        role = role_name(r)
+        rest = $0; sub(/^[^:]*:/, "", rest); sub(/#.*$/, "", rest); rest = trim(rest)
+        if (rest == "null" || rest == "~") { flush_signoff() ; next }
+        next
+    }
+    in_triad && role != "" && /^    [a-z_]+:/ {
+        key = $0; sub(/^    /, "", key); sub(/:.*$/, "", key)
+        val = $0; sub(/^[^:]*:/, "", val); val = unquote(val)
+        if (key == "agent") agent = val
+        else if (key == "date") date = val
+        else if (key == "status") st = val
+        else if (key == "notes") notes = val
+        next
+    }
+
+    # ---- Older metadata list: - **pm_signoff**: APPROVED ----
+    # (ignored for roles that also have a triad: frontmatter entry)
+    !in_fm && /^- \*\*[a-z]+_signoff(_date|_notes)?\*\*:/ {
+        key = $0; sub(/^- \*\*/, "", key); sub(/\*\*:.*$/, "", key)
+        val = $0; sub(/^[^:]*:/, "", val); val = trim(val)
+        r = key; sub(/_signoff.*$/, "", r); r = role_name(r)
+        if (key ~ /_date$/) flat_date[FILENAME, r] = val
+        else if (key ~ /_notes$/) flat_notes[FILENAME, r] = val
+        else {
+            if (!((FILENAME, r) in flat_status)) flat_order[++flat_n] = FILENAME SUBSEP r
+            flat_status[FILENAME, r] = val
+            flat_feature[FILENAME, r] = feature
+            flat_artifact[FILENAME, r] = artifact
+        }
+        next
+    }
+
+    END {
+        flush_signoff()
+        for (i = 1; i <= flat_n; i++) {
+            k = flat_order[i]
+            if (k in in_frontmatter) continue
+            split(k, kp, SUBSEP)
+            d = (k in flat_date) ? flat_date[k] : "-"
+            nt = (k in flat_notes) ? clean(flat_notes[k]) : "-"
+            s = flat_status[k]; if (s == "" || s == "null") s = "PENDING"
+            print "signoff\t" kp[1] "\t" flat_feature[k] "\t" flat_artifact[k] "\t" kp[2] "\t-\t" d "\t" s "\t" nt
+        }
+    }
+    ' "$@"
+}
+
+# ============================================================================
+# Index
+# ============================================================================
+
+# Bring the index up to date; re-parses only changed sources.
+# Runs in a subshell so the cd to PRODUCT_ROOT does not leak to callers.
+# Args: [--force]
+product_index_build() (
+    local force="${1:-}"
+    local stamps changed
+
+    cd "$PRODUCT_ROOT"
+    mkdir -p "$(dirname "$PRODUCT_INDEX_FILE")"
+
+    if [[ "$force" == "--force" ]]; then
+        rm -f "$PRODUCT_INDEX_FILE" "$PRODUCT_INDEX_SOURCES"
+    fi
+    if [[ ! -f "$PRODUCT_INDEX_FILE" || ! -f "$PRODUCT_INDEX_SOURCES" ]]; then
+        : > "$PRODUCT_INDEX_FILE"
+        : > "$PRODUCT_INDEX_SOURCES"
+    fi
+
+    # shellcheck disable=SC2046
+    stamps=$(product_stamps $(product_sources))
+
+    # Sources that are new, modified or deleted since the last build
+    changed=$(echo "$stamps" | awk -F'\t' '
+        FILENAME == ARGV[1] { old[$1] = $2; next }
+        $1 != "" { now[$1] = 1; if (old[$1] != $2) print $1 }
+        END { for (f in old) if (!(f in now)) print f }
+    ' "$PRODUCT_INDEX_SOURCES" -)
+
+    [[ -z "$changed" ]] && return 0
+
+    local tmp="${PRODUCT_INDEX_FILE}.$$"
+    {
+        echo "$changed" | awk -F'\t' 'FILENAME == ARGV[1] { drop[$1] = 1; next } !($2 in drop)' - "$PRODUCT_INDEX_FILE"
+        # shellcheck disable=SC2046
+        product_parse $(echo "$changed" | while IFS= read -r f; do [[ -f "$f" ]] && echo "$f"; done)
+    } > "$tmp"
+    mv -f "$tmp" "$PRODUCT_INDEX_FILE"
+
+    echo "$stamps" > "${PRODUCT_INDEX_SOURCES}.$$"
+    mv -f "${PRODUCT_INDEX_SOURCES}.$$" "$PRODUCT_INDEX_SOURCES"
+)
+
+# ============================================================================
+# Queries
+# ============================================================================
+
+# Filter records of one type; prints a header and tab-separated rows.
+# Args: type, [--status S] [--min-ice N] [--role R] [--artifact A] [--feature F]
+product_query() {
+    local type="$1"
+    shift
+    local status="" min_ice="" role="" artifact="" feature=""
+
+    while [[ $# -gt 0 ]]; do
+        case "$1" in
+            --status) status="$2"; shift ;;
+            --min-ice) min_ice="$2"; shift ;;
+            --role) role="$2"; shift ;;
+            --artifact) artifact="$2"; shift ;;
+            --feature) feature="$2"; shift ;;
+            *)
+                echo "Error: unknown filter: $1" >&2
+                return 1
+                ;;
+        esac
+        shift
+    done
+
+    local columns_var="PRODUCT_COLUMNS_${type}"
+    local columns="${!columns_var:-}"
+    if [[ -z "$columns" ]]; then
+        echo "Error: unknown record type: $type" >&2
+        return 1
+    fi
+
+    product_index_build
+
+    awk -F'\t' -v type="$type" -v cols="$columns" -v status="$status" -v min_ice="$min_ice" \
+        -v role="$role" -v artifact="$artifact" -v feature="$feature" '
+    BEGIN {
+        n = split(cols, name, " ")
+        for (i = 1; i <= n; i++) { idx[name[i]] = i + 2; printf "%s%s", (i > 1 ? "\t" : ""), name[i] }
+        print ""
+        feature_col = ("feature" in idx) ? idx["feature"] : idx["id"]
+    }
+    $1 != type { next }
+    status != "" && tolower($(idx["status"])) != tolower(status) { next }
+    min_ice != "" && (!("ice" in idx) || $(idx["ice"]) == "-" || $(idx["ice"]) + 0 < min_ice + 0) { next }
+    role != "" && $(idx["role"]) != role { next }
+    artifact != "" && $(idx["artifact"]) != artifact { next }
+    feature != "" && index($feature_col, feature) != 1 { next }
+    {
+        line = $3
+        for (i = 4; i <= NF; i++) line = line "\t" $i
+        print line
+    }
+    ' "$PRODUCT_INDEX_FILE"
+}
+
+# PRDs approved (or in progress) but not yet delivered
+product_approved_not_delivered() {
+    product_index_build
+
+    awk -F'\t' '
+    BEGIN { print "id\ttitle\tstatus\tspec" }
+    $1 == "prd" && tolower($5) ~ /^(approved|in progress)/ { print $3 "\t" $4 "\t" $5 "\t" $9 }
+    ' "$PRODUCT_INDEX_FILE"
+}
+
+# ============================================================================
+# CLI
+# ============================================================================
+
+if [[ "${BASH_SOURCE[0]}" == "${0}" ]]; then
+    set -euo pipefail
+    command="${1:-}"
+    [[ $# -gt 0 ]] && shift
+
+    case "$command" in
+        build) product_index_build "$@" ;;
+        prds) product_query prd "$@" ;;
+        ideas) product_query idea "$@" ;;
+        stories) product_query story "$@" ;;
+        signoffs) product_query signoff "$@" ;;
+        approved-not-delivered) product_approved_not_delivered ;;
+        *)
+            echo "Usage: query.sh build [--force] | prds|ideas|stories|signoffs [filters] | approved-not-delivered" >&2
+            echo "Filters: --status S --min-ice N --role pm|architect|techlead --artifact spec|plan|tasks --feature ID" >&2
+            exit 1
+            ;;
+    esac
+fi
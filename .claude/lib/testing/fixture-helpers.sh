@@ -0,0 +1,110 @@
+#!/usr/bin/env bash
+# Test Fixture Helpers
+# Feature: 002-anthropic-updates-integration
+# Created: 2026-10-18
+#
+# Shared pass/fail/skip/section utilities for specs/*/test-fixtures/*-test.sh.
+# Output format is unchanged from the per-fixture copies these replace.
+#
+# When FIXTURE_RESULTS_FILE is set (scripts/test-fixtures.sh does this), each
+# result is also appended as a machine-readable record with the time spent
+# since the previous result:
+#   <PASS|FAIL|SKIP>\t<section>\t<test name>\t<duration_ms>\t<message>
+#
+# Usage:
+#   source "${PROJECT_ROOT}/.claude/lib/testing/fixture-helpers.sh"
+
+# Test counters
+TESTS_RUN=0
+TESTS_PASSED=0
+TESTS_FAILED=0
+TESTS_SKIPPED=0
+
+FIXTURE_SECTION=""
+FIXTURE_RESULTS_FILE="${FIXTURE_RESULTS_FILE:-}"
+
+fixture_now_ms() {
+    local ns
+    ns=$(date +%s%N 2>/dev/null || true)
+
+    if [[ "$ns" =~ ^[0-9]+$ ]]; then
+        echo $((ns / 1000000))
+    else
+        echo $(($(date +%s) * 1000))
+    fi
+}
+
+FIXTURE_LAST_MS=$(fixture_now_ms)
+
+# Append a result record when running under the fixture runner
+fixture_record() {
+    local status="$1"
+    local test_name="$2"
+    local message="${3:-}"
+    local now
+
+    now=$(fixture_now_ms)
+    if [[ -n "$FIXTURE_RESULTS_FILE" ]]; then
+        printf '%s\t%s\t%s\t%s\t%s\n' "$status" "$FIXTURE_SECTION" "$test_name" \
+            "$((now - FIXTURE_LAST_MS))" "${message//$'\t'/ }" >> "$FIXTURE_RESULTS_FILE"
+    fi
+    FIXTURE_LAST_MS="$now"
+}
+
+# ============================================================================
+# Test Utilities
+# ============================================================================
+
+pass() {
+    local test_name="$1"
+    TESTS_PASSED=$((TESTS_PASSED + 1))
+    TESTS_RUN=$((TESTS_RUN + 1))
+    echo "  ✅ PASS: $test_name"
+    fixture_record "PASS" "$test_name"
+}
+
+fail() {
+    local test_name="$1"
+    local message="${2:-}"
+    TESTS_FAILED=$((TESTS_FAILED + 1))
+    TESTS_RUN=$((TESTS_RUN + 1))
+    echo "  ❌ FAIL: $test_name"
+    if [[ -n "$message" ]]; then
+        echo "     Reason: $message"
+    fi
+    fixture_record "FAIL" "$test_name" "$message"
+}
+
+skip() {
+    local test_name="$1"
+    TESTS_SKIPPED=$((TESTS_SKIPPED + 1))
+    echo "  ⏭️ SKIP: $test_name"
+    fixture_record "SKIP" "$test_name"
+}
+
+section() {
+    FIXTURE_SECTION="$1"
+    FIXTURE_LAST_MS=$(fixture_now_ms)
+    echo ""
+    echo "=== $1 ==="
+}
+
+# Print the summary block and exit 0 (all passed) or 1
+fixture_summary() {
+    echo ""
+    echo "========================================"
+    echo "  Test Summary"
+    echo "========================================"
+    echo "  Tests Run:    ${TESTS_RUN}"
+    echo "  Tests Passed: ${TESTS_PASSED}"
+    echo "  Tests Failed: ${TESTS_FAILED}"
+    echo ""
+
+    if [[ ${TESTS_FAILED} -eq 0 ]]; then
+        echo "✅ All tests passed!"
+        exit 0
+    else
+        echo "❌ Some tests failed!"
+        exit 1
+    fi
+}
@@ -0,0 +1,235 @@
+#!/usr/bin/env bash
+# Triad Review Benchmark Harness
+# Feature: 002-anthropic-updates-integration
+# Created: 2026-10-18
+#
+# Replays review workloads against the local stub agent in sequential and
+# parallel mode, records every fork in the timing store, and reports
+# wall-clock p50/p95 per mode with regression detection against a stored
+# baseline. Used to verify the "~40-45%" parallel review savings claimed in
+# contracts/integration-contracts.md and to track it across kit releases.
+#
+# Workload format (tab-separated, '#' comments allowed):
+#   <workload_id>\t<agent>\t<run_ms>
+#
+# Baseline format (append-only, one row per mode per saved run):
+#   <mode>\t<p50_ms>\t<p95_ms>\t<kit_version>\t<date>\t<scale>
+#
+# Usage:
+#   benchmark.sh run [--workload FILE] [--iterations N] [--scale F]
+#                    [--baseline FILE] [--threshold PCT] [--save-baseline]
+#   benchmark.sh extract [STORE]     # recorded forks -> workload file
+
+set -euo pipefail
+
+BENCHMARK_DIR="$(cd "$(dirname "${BASH_SOURCE[0]}")" && pwd)"
+BENCHMARK_PROJECT_ROOT="$(cd "${BENCHMARK_DIR}/../../.." && pwd)"
+
+source "${BENCHMARK_DIR}/timing-store.sh"
+source "${BENCHMARK_DIR}/../version/kit-version.sh"
+
+BENCHMARK_WORKLOAD="${BENCHMARK_DIR}/workloads/triad-reviews.tsv"
+BENCHMARK_BASELINE="${BENCHMARK_PROJECT_ROOT}/.claude/metrics/benchmark-baseline.tsv"
+BENCHMARK_STUB_AGENT="${BENCHMARK_STUB_AGENT:-${BENCHMARK_DIR}/stub-agent.sh}"
+
+# ============================================================================
+# Helpers
+# ============================================================================
+
+# Workload rows without comments or blank lines
+workload_rows() {
+    grep -v -e '^#' -e '^[[:space:]]*$' "$1"
+}
+
+# Run one reviewer fork through its full lifecycle against the stub agent.
+# Args: agent, run_ms, scale, parent_id
+replay_fork() {
+    local agent="$1"
+    local run_ms="$2"
+    local scale="$3"
+    local parent_id="$4"
+    local fork_id scaled_ms
+
+    scaled_ms=$(awk -v ms="$run_ms" -v s="$scale" 'BEGIN { printf "%d", ms * s }')
+    fork_id=$(fork_create "$agent" "$parent_id")
+    fork_start "$fork_id"
+
+    if "$BENCHMARK_STUB_AGENT" --agent "$agent" --duration-ms "$scaled_ms" >/dev/null; then
+        fork_complete "$fork_id" "stub"
+    else
+        fork_fail "$fork_id" "stub exited $?"
+    fi
+
+    fork_destroy "$fork_id"
+}
+
+# Replay one workload in the given mode; prints wall-clock ms.
+# Args: mode (sequential|parallel), workload_id, workload_file, scale
+replay_workload() {
+    local mode="$1"
+    local workload_id="$2"
+    local workload_file="$3"
+    local scale="$4"
+    local started agent run_ms pids=()
+
+    started=$(timing_now_ms)
+
+    while IFS=$'\t' read -r _ agent run_ms; do
+        if [[ "$mode" == "parallel" ]]; then
+            replay_fork "$agent" "$run_ms" "$scale" "$workload_id" &
+            pids+=("$!")
+        else
+            replay_fork "$agent" "$run_ms" "$scale" "$workload_id"
+        fi
+    done < <(workload_rows "$workload_file" | awk -F'\t' -v w="$workload_id" '$1 == w')
+
+    if [[ ${#pids[@]} -gt 0 ]]; then
+        wait "${pids[@]}"
+    fi
+
+    echo $(( $(timing_now_ms) - started ))
+}
+
+# ============================================================================
+# Commands
+# ============================================================================
+
+# Convert recorded forks into a workload file (completed forks only)
+benchmark_extract() {
+    local store="${1:-$TIMING_STORE_FILE}"
+
+    echo "# workload_id	agent	run_ms"
+    fork_durations "$store" | awk -F'\t' '$4 == "completed" && $6 != "-" { printf "%s\t%s\t%s\n", $1, $3, $6 }'
+}
+
+benchmark_run() {
+    local workload="$BENCHMARK_WORKLOAD"
+    local baseline="$BENCHMARK_BASELINE"
+    local iterations=5
+    local scale="0.001"
+    local threshold=20
+    local save_baseline=false
+
+    while [[ $# -gt 0 ]]; do
+        case "$1" in
+            --workload) workload="$2"; shift ;;
+            --iterations) iterations="$2"; shift ;;
+            --scale) scale="$2"; shift ;;
+            --baseline) baseline="$2"; shift ;;
+            --threshold) threshold="$2"; shift ;;
+            --save-baseline) save_baseline=true ;;
+            *) echo "Error: unknown option: $1" >&2; return 1 ;;
+        esac
+        shift
+    done
+
+    if [[ ! -f "$workload" ]]; then
+        echo "Error: workload file not found: $workload" >&2
+        return 1
+    fi
+
+    local results_dir
+    results_dir=$(mktemp -d)
+    # shellcheck disable=SC2064
+    trap "rm -rf '${results_dir}'" EXIT
+
+    TIMING_STORE_FILE="${results_dir}/timing-events.tsv"
+
+    local workload_ids mode workload_id i wall
+    workload_ids=$(workload_rows "$workload" | cut -f1 | awk '!seen[$0]++')
+
+    echo "========================================"
+    echo "  Triad Review Benchmark"
+    echo "========================================"
+    echo "  Workload:   ${workload#"${BENCHMARK_PROJECT_ROOT}/"}"
+    echo "  Iterations: ${iterations}   Scale: ${scale}   Kit: $(kit_version)"
+    echo ""
+
+    for ((i = 1; i <= iterations; i++)); do
+        for workload_id in $workload_ids; do
+            for mode in sequential parallel; do
+                TIMING_SESSION_ID="${mode}-${workload_id}-${i}"
+                wall=$(replay_workload "$mode" "$workload_id" "$workload" "$scale")
+                printf '%s\t%s\t%s\t%s\n' "$mode" "$workload_id" "$i" "$wall" >> "${results_dir}/results.tsv"
+            done
+        done
+    done
+
+    # Per-iteration pipeline cost: sum of all workloads in that iteration
+    local summary
+    summary=$(awk -F'\t' '{ total[$1 "\t" $3] += $4 } END { for (k in total) print k "\t" total[k] }' \
+        "${results_dir}/results.tsv")
+
+    local seq_p50 seq_p95 par_p50 par_p95
+    seq_p50=$(echo "$summary" | awk -F'\t' '$1 == "sequential" { print $3 }' | timing_percentile 50)
+    seq_p95=$(echo "$summary" | awk -F'\t' '$1 == "sequential" { print $3 }' | timing_percentile 95)
+    par_p50=$(echo "$summary" | awk -F'\t' '$1 == "parallel" { print $3 }' | timing_percentile 50)
+    par_p95=$(echo "$summary" | awk -F'\t' '$1 == "parallel" { print $3 }' | timing_percentile 95)
+
+    printf '  %-12s %12s %12s %16s\n' "mode" "p50 ms" "p95 ms" "projected p50"
+    printf '  %-12s %12s %12s %14ss\n' "sequential" "$seq_p50" "$seq_p95" \
+        "$(awk -v v="$seq_p50" -v s="$scale" 'BEGIN { printf "%.0f", v / s / 1000 }')"
+    printf '  %-12s %12s %12s %14ss\n' "parallel" "$par_p50" "$par_p95" \
+        "$(awk -v v="$par_p50" -v s="$scale" 'BEGIN { printf "%.0f", v / s / 1000 }')"
+    echo ""
+    echo "  Parallel savings (p50): $(awk -v a="$seq_p50" -v b="$par_p50" 'BEGIN { printf "%.1f", (a > 0) ? (a - b) * 100 / a : 0 }')%"
+    echo ""
+    timing_report --by agent "$TIMING_STORE_FILE" | sed 's/^/  /'
+
+    local regressions=0 row_mode row_p50 row_p95 base_p50 base_p95
+    if [[ -f "$baseline" ]]; then
+        echo ""
+        echo "  Baseline: ${baseline#"${BENCHMARK_PROJECT_ROOT}/"} (threshold ${threshold}%)"
+        for row_mode in sequential parallel; do
+            if [[ "$row_mode" == "sequential" ]]; then
+                row_p50="$seq_p50"; row_p95="$seq_p95"
+            else
+                row_p50="$par_p50"; row_p95="$par_p95"
+            fi
+
+            # Latest baseline row recorded at the same scale
+            read -r base_p50 base_p95 < <(awk -F'\t' -v m="$row_mode" -v s="$scale" \
+                '$1 == m && $6 == s { p50 = $2; p95 = $3 } END { print p50, p95 }' "$baseline")
+
+            if [[ -z "$base_p50" ]]; then
+                echo "  ⏭️ ${row_mode}: no baseline at scale ${scale}"
+            elif awk -v c="$row_p50" -v b="$base_p50" -v t="$threshold" 'BEGIN { exit !(c > b * (1 + t / 100)) }' ||
+                 awk -v c="$row_p95" -v b="$base_p95" -v t="$threshold" 'BEGIN { exit !(c > b * (1 + t / 100)) }'; then
+                echo "  ❌ ${row_mode}: p50 ${row_p50} ms / p95 ${row_p95} ms vs baseline ${base_p50} / ${base_p95} ms"
+                regressions=$((regressions + 1))
+            else
+                echo "  ✅ ${row_mode}: p50 ${row_p50} ms / p95 ${row_p95} ms vs baseline ${base_p50} / ${base_p95} ms"
+            fi
+        done
+    fi
+
+    if [[ "$save_baseline" == "true" ]]; then
+        mkdir -p "$(dirname "$baseline")"
+        printf '%s\t%s\t%s\t%s\t%s\t%s\n' \
+            "sequential" "$seq_p50" "$seq_p95" "$(kit_version)" "$(date +%Y-%m-%d)" "$scale" \
+            "parallel" "$par_p50" "$par_p95" "$(kit_version)" "$(date +%Y-%m-%d)" "$scale" >> "$baseline"
+        echo ""
+        echo "  Baseline saved to ${baseline#"${BENCHMARK_PROJECT_ROOT}/"}"
+    fi
+
+    if [[ $regressions -gt 0 ]]; then
+        echo ""
+        echo "❌ ${regressions} regression(s) detected"
+        return 1
+    fi
+}
+
+# ============================================================================
+# CLI
+# ============================================================================
+
+if [[ "${BASH_SOURCE[0]}" == "${0}" ]]; then
+    case "${1:-run}" in
+        run) shift || true; benchmark_run "$@" ;;
+        extract) shift; benchmark_extract "$@" ;;
+        *)
+            echo "Usage: benchmark.sh run [options] | extract [STORE]" >&2
+            exit 1
+            ;;
+    esac
+fi
@@ -0,0 +1,245 @@
+#!/usr/bin/env bash
+# Review Result Merger
+# Feature: 002-anthropic-updates-integration
+# Created: 2026-10-18
+#
+# Implements the ReviewResultMerger contract from
+# specs/002-anthropic-updates-integration/contracts/integration-contracts.md,
+# generalized from PM + Architect to any number of reviewers:
+#   - status severity and most-severe-wins merging
+#   - parsing reviewer output into status / findings / recommendations
+#   - de-duplicating findings reported by several reviewers
+#   - writing sign-offs into an artifact's `triad:` frontmatter atomically
+#
+# Severity: APPROVED (0) < APPROVED_WITH_CONCERNS (1) < CHANGES_REQUESTED (2)
+#           < BLOCKED / NOT_FEASIBLE (3). Unknown statuses rank as 2.
+#
+# Reviewer output format (as emitted by the review skills and stub-agent.sh):
+#   Finding: BLOCKING | <text>        (severity BLOCKING, CONCERN or INFO)
+#   Recommendation: <text>
+#   Status: <verdict>
+#
+# Usage (sourced; safe to source from scripts that do not use set -e):
+#   source .claude/lib/triad/merge-results.sh
+#   merge_review_statuses APPROVED APPROVED_WITH_CONCERNS   # -> APPROVED_WITH_CONCERNS
+#   create_merged_result PM=APPROVED Architect=CHANGES_REQUESTED Security=APPROVED
+
+# ============================================================================
+# Statuses
+# ============================================================================
+
+get_status_severity() {
+    case "$1" in
+        APPROVED) echo 0 ;;
+        APPROVED_WITH_CONCERNS) echo 1 ;;
+        CHANGES_REQUESTED) echo 2 ;;
+        BLOCKED|NOT_FEASIBLE) echo 3 ;;
+        *) echo 2 ;;
+    esac
+}
+
+# More severe of two statuses (the first wins a tie)
+merge_two_statuses() {
+    if (( $(get_status_severity "$2") > $(get_status_severity "$1") )); then
+        echo "$2"
+    else
+        echo "$1"
+    fi
+}
+
+# Most severe of any number of statuses
+merge_review_statuses() {
+    local merged="APPROVED" status
+
+    for status in "$@"; do
+        merged=$(merge_two_statuses "$merged" "$status")
+    done
+    echo "$merged"
+}
+
+is_approved() {
+    [[ "$1" == "APPROVED" || "$1" == "APPROVED_WITH_CONCERNS" ]]
+}
+
+is_blocked() {
+    [[ "$1" == "BLOCKED" || "$1" == "NOT_FEASIBLE" ]]
+}
+
+# Markdown summary of a merged review.
+# Args: either bare statuses in PM, Architect, Team-Lead order, or
+#       Role=STATUS pairs for any set of reviewers.
+create_merged_result() {
+    local default_roles=(PM Architect Team-Lead)
+    local i=0 arg role status statuses=() rows=""
+
+    for arg in "$@"; do
+        if [[ "$arg" == *=* ]]; then
+            role="${arg%%=*}"
+            status="${arg#*=}"
+        else
+            role="${default_roles[$i]:-Reviewer $((i + 1))}"
+            status="$arg"
+        fi
+        statuses+=("$status")
+        rows="${rows}| ${role} | ${status} |"$'\n'
+        i=$((i + 1))
+    done
+
+    if [[ $i -eq 0 ]]; then
+        echo "Error: create_merged_result needs at least one status" >&2
+        return 1
+    fi
+
+    echo "## Merged Review Result"
+    echo ""
+    echo "**Final Status**: $(merge_review_statuses "${statuses[@]}")"
+    echo ""
+    echo "| Reviewer | Status |"
+    echo "|----------|--------|"
+    printf '%s' "$rows"
+}
+
+# ============================================================================
+# Reviewer output
+# ============================================================================
+
+# Parse one reviewer's output into records:
+#   status\t<role>\t<STATUS>              (last Status: line; absent if none)
+#   finding\t<role>\t<SEVERITY>\t<text>
+#   recommendation\t<role>\t<text>
+# Args: output_file, role
+parse_review_output() {
+    local file="$1"
+    local role="$2"
+
+    awk -v role="$role" '
+    function trim(s) { gsub(/^[ \t*]+|[ \t*]+$/, "", s); gsub(/\t/, " ", s); return s }
+
+    /^[ \t*]*Status[*]*:/ {
+        s = $0; sub(/^[^:]*:/, "", s); s = trim(s)
+        sub(/[^A-Z_].*$/, "", s)
+        if (s != "") status = s
+        next
+    }
+    /^[ \t-]*Finding:/ {
+        s = $0; sub(/^[^:]*:/, "", s)
+        sev = s; sub(/\|.*$/, "", sev); sev = toupper(trim(sev))
+        text = s; if (!sub(/^[^|]*\|/, "", text)) { text = sev; sev = "CONCERN" }
+        if (sev != "BLOCKING" && sev != "CONCERN" && sev != "INFO") sev = "CONCERN"
+        printf "finding\t%s\t%s\t%s\n", role, sev, trim(text)
+        next
+    }
+    /^[ \t-]*Recommendation:/ {
+        s = $0; sub(/^[^:]*:/, "", s)
+        printf "recommendation\t%s\t%s\n", role, trim(s)
+        next
+    }
+    END { if (status != "") printf "status\t%s\t%s\n", role, status }
+    ' "$file"
+}
+
+# True if a reviewer output file already contains a blocking finding or a
+# blocking verdict (used to short-circuit the fan-out)
+has_blocking_result() {
+    grep -qE '^[ 	-]*Finding:[ 	]*BLOCKING|^[ 	*]*Status[*]*:[ 	]*(CHANGES_REQUESTED|BLOCKED|NOT_FEASIBLE)' "$1" 2>/dev/null
+}
+
+# Collapse findings reported by several reviewers.
+# Input (stdin):  finding\t<role>\t<SEVERITY>\t<text>  (other records ignored)
+# Output:         <SEVERITY>\t<role,role>\t<text>, most severe first, then
+#                 in first-reported order. Texts match case-, whitespace- and
+#                 punctuation-insensitively; the highest severity is kept.
+dedupe_findings() {
+    awk -F'\t' '
+    function rank(s) { return s == "BLOCKING" ? 3 : (s == "CONCERN" ? 2 : 1) }
+
+    $1 == "finding" {
+        key = tolower($4)
+        gsub(/[^a-z0-9 ]/, "", key)
+        gsub(/ +/, " ", key); gsub(/^ | $/, "", key)
+        if (!(key in sev)) { order[++n] = key; sev[key] = $3; text[key] = $4; roles[key] = $2; next }
+        if (rank($3) > rank(sev[key])) sev[key] = $3
+        if (index("," roles[key] ",", "," $2 ",") == 0) roles[key] = roles[key] "," $2
+    }
+
+    END {
+        for (r = 3; r >= 1; r--)
+            for (i = 1; i <= n; i++)
+                if (rank(sev[order[i]]) == r) printf "%s\t%s\t%s\n", sev[order[i]], roles[order[i]], text[order[i]]
+    }
+    '
+}
+
+# ============================================================================
+# triad: frontmatter
+# ============================================================================
+
+# Replace (or add) sign-off entries in an artifact's triad: frontmatter in
+# one atomic rewrite (temp file in the same directory + mv).
+# Args: artifact, signoffs_file with lines:
+#   <key e.g. architect_signoff>\t<agent>\t<date>\t<status>\t<notes>
+write_triad_signoffs() {
+    local artifact="$1"
+    local signoffs="$2"
+    local tmp="${artifact}.tmp.$$"
+
+    if [[ ! -f "$artifact" ]]; then
+        echo "Error: artifact not found: $artifact" >&2
+        return 1
+    fi
+
+    awk -F'\t' '
+    function block(key,    notes) {
+        notes = note[key]
+        gsub(/\\/, "\\\\", notes); gsub(/"/, "\\\"", notes)
+        return "  " key ":\n    agent: " agent[key] "\n    date: " date[key] "\n    status: " st[key] "\n    notes: \"" notes "\""
+    }
+    function emit_missing(    i) {
+        for (i = 1; i <= n; i++) if (!(keys[i] in written)) { print block(keys[i]); written[keys[i]] = 1 }
+    }
+
+    FILENAME == ARGV[1] {
+        keys[++n] = $1; agent[$1] = $2; date[$1] = $3; st[$1] = $4; note[$1] = $5
+        next
+    }
+
+    FNR == 1 && !/^---[ \t]*$/ {
+        # No frontmatter yet
+        print "---"; print "triad:"; emit_missing(); print "---"; print ""
+        in_fm = 0; done_fm = 1
+    }
+    FNR == 1 && /^---[ \t]*$/ { in_fm = 1; print; next }
+
+    in_fm && /^---[ \t]*$/ {
+        if (!seen_triad) print "triad:"
+        if (in_triad || !seen_triad) emit_missing()
+        in_fm = 0; in_triad = 0; skipping = 0
+        print; next
+    }
+    in_fm && /^triad:/ { seen_triad = 1; in_triad = 1; print; next }
+    in_fm && in_triad && /^[^ #]/ { emit_missing(); in_triad = 0; skipping = 0 }
+    in_fm && in_triad && /^  [A-Za-z_]+:/ {
+        key = $0; sub(/^  /, "", key); sub(/:.*$/, "", key)
+        if (key in agent) { print block(key); written[key] = 1; skipping = 1; next }
+        skipping = 0
+    }
+    in_fm && in_triad && skipping && /^    / { next }
+    { print }
+    ' "$signoffs" "$artifact" > "$tmp" && mv -f "$tmp" "$artifact"
+}
+
+# ============================================================================
+# CLI
+# ============================================================================
+
+if [[ "${BASH_SOURCE[0]}" == "${0}" ]]; then
+    set -euo pipefail
+    case "${1:-}" in
+        merge) shift; merge_review_statuses "$@" ;;
+        result) shift; create_merged_result "$@" ;;
+        *)
+            echo "Usage: merge-results.sh merge STATUS... | result [Role=]STATUS..." >&2
+            exit 1
+            ;;
+    esac
+fi
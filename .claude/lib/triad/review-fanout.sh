@@ -0,0 +1,358 @@
+#!/usr/bin/env bash
+# Triad Review Fan-out
+# Feature: 002-anthropic-updates-integration
+# Created: 2026-10-18
+#
+# ParallelReviewInvocation for any number of reviewers. Launches every
+# reviewer concurrently, enforces a per-reviewer deadline, stops early on
+# the first blocking result, merges and de-duplicates what came back, and
+# optionally writes the sign-offs into the artifact's `triad:` frontmatter
+# in one atomic update. Review latency is bounded by the slowest required
+# reviewer: optional reviewers still running at that point are cancelled and
+# listed as missing. With no required reviewer, every reviewer is waited on.
+#
+# Reviewers file (tab-separated, '#' comments allowed):
+#   <agent>\t<required|optional>\t<timeout_ms>\t<command>
+# The command runs under `bash -c` with REVIEW_ARTIFACT and REVIEW_AGENT set
+# and must print the reviewer output format described in merge-results.sh.
+#
+# Outcomes per reviewer: completed | failed | timeout | cancelled
+#   - required reviewer failed or timed out  -> CHANGES_REQUESTED
+#   - optional reviewer failed, timed out or cancelled -> listed, verdict
+#     unaffected
+#   - no reviewer returned a verdict         -> CHANGES_REQUESTED
+#   - any BLOCKING finding or CHANGES_REQUESTED/BLOCKED verdict, even from a
+#     reviewer still running, cancels the rest (unless --no-short-circuit)
+#
+# Usage:
+#   review-fanout.sh --reviewers FILE [--artifact FILE] [--poll-ms N]
+#                    [--no-short-circuit]
+#
+# Every reviewer is recorded as a fork in the timing store (TIMING_STORE_FILE,
+# default .claude/cache/timing-events.tsv under the project root).
+#
+# Exit: 0 approved (with or without concerns), 1 not approved, 2 usage error
+
+set -euo pipefail
+
+FANOUT_DIR="$(cd "$(dirname "${BASH_SOURCE[0]}")" && pwd)"
+
+source "${FANOUT_DIR}/timing-store.sh"
+source "${FANOUT_DIR}/merge-results.sh"
+
+# ============================================================================
+# Helpers
+# ============================================================================
+
+# triad: frontmatter key for a reviewer agent ("" if it has none)
+signoff_key_for_agent() {
+    case "$1" in
+        pm|product-manager) echo "pm_signoff" ;;
+        architect) echo "architect_signoff" ;;
+        techlead|teamlead|team-lead) echo "techlead_signoff" ;;
+        *) echo "" ;;
+    esac
+}
+
+# Kill a process and everything it started. Children are listed before the
+# parent is killed (they are reparented afterwards) and the parent goes
+# first, so a reviewer cannot print a verdict once its sleep/child dies.
+kill_tree() {
+    local pid="$1" children="" child
+
+    if command -v pgrep &>/dev/null; then
+        children=$(pgrep -P "$pid" 2>/dev/null || true)
+    fi
+    kill "$pid" 2>/dev/null || true
+    for child in $children; do
+        kill_tree "$child"
+    done
+}
+
+fanout_usage() {
+    echo "Usage: review-fanout.sh --reviewers FILE [--artifact FILE] [--poll-ms N] [--no-short-circuit]" >&2
+    exit 2
+}
+
+# ============================================================================
+# Fan-out / fan-in
+# ============================================================================
+
+review_fanout() {
+    local reviewers_file="" artifact="" poll_ms=50 short_circuit=true
+
+    while [[ $# -gt 0 ]]; do
+        case "$1" in
+            --reviewers) reviewers_file="${2:-}"; shift ;;
+            --artifact) artifact="${2:-}"; shift ;;
+            --poll-ms) poll_ms="${2:-}"; shift ;;
+            --no-short-circuit) short_circuit=false ;;
+            *) fanout_usage ;;
+        esac
+        shift
+    done
+
+    if [[ -z "$reviewers_file" ]]; then
+        fanout_usage
+    fi
+    if [[ ! -f "$reviewers_file" ]]; then
+        echo "Error: reviewers file not found: $reviewers_file" >&2
+        exit 2
+    fi
+    if [[ -n "$artifact" && ! -f "$artifact" ]]; then
+        echo "Error: artifact not found: $artifact" >&2
+        exit 2
+    fi
+
+    local agents=() required=() timeouts=() commands=()
+    local agent need timeout_ms cmd
+
+    while IFS=$'\t' read -r agent need timeout_ms cmd; do
+        if [[ "$need" != "required" && "$need" != "optional" ]] || ! [[ "$timeout_ms" =~ ^[0-9]+$ ]] || [[ -z "$cmd" ]]; then
+            echo "Error: malformed reviewer row for '${agent}' in $reviewers_file" >&2
+            exit 2
+        fi
+        agents+=("$agent")
+        required+=("$need")
+        timeouts+=("$timeout_ms")
+        commands+=("$cmd")
+    done < <(grep -v -e '^#' -e '^[[:space:]]*$' "$reviewers_file")
+
+    local count=${#agents[@]}
+    if [[ $count -eq 0 ]]; then
+        echo "Error: no reviewers in $reviewers_file" >&2
+        exit 2
+    fi
+
+    # Reviewers the poll loop waits for: the required ones, or all of them
+    local awaited="required"
+    if [[ " ${required[*]} " != *" required "* ]]; then
+        awaited="optional"
+    fi
+
+    local work_dir
+    work_dir=$(mktemp -d)
+    # shellcheck disable=SC2064
+    trap "rm -rf '${work_dir}'" EXIT
+
+    # ---- Fan-out: start every reviewer at once ----
+
+    local parent_id="review-$(timing_now_ms)-$$"
+    local pids=() forks=() outcomes=() exit_codes=() durations=() starts=()
+    local i
+
+    for ((i = 0; i < count; i++)); do
+        forks[i]=$(fork_create "${agents[i]}" "$parent_id")
+        fork_start "${forks[i]}"
+        starts[i]=$(timing_now_ms)
+        REVIEW_ARTIFACT="$artifact" REVIEW_AGENT="${agents[i]}" \
+            bash -c "${commands[i]}" > "${work_dir}/${i}.out" 2> "${work_dir}/${i}.err" &
+        pids[i]=$!
+        outcomes[i]="running"
+        exit_codes[i]="-"
+        durations[i]="-"
+    done
+
+    # ---- Poll until every awaited reviewer is done or one blocks ----
+
+    local poll_s now rc running_awaited short_by=""
+    poll_s=$(awk -v ms="$poll_ms" 'BEGIN { printf "%.3f", ms / 1000 }')
+
+    while true; do
+        now=$(timing_now_ms)
+        running_awaited=0
+
+        for ((i = 0; i < count; i++)); do
+            [[ "${outcomes[i]}" == "running" ]] || continue
+
+            if ! kill -0 "${pids[i]}" 2>/dev/null; then
+                rc=0
+                wait "${pids[i]}" || rc=$?
+                exit_codes[i]=$rc
+                durations[i]=$((now - starts[i]))
+                if [[ $rc -eq 0 ]]; then
+                    outcomes[i]="completed"
+                    fork_complete "${forks[i]}" "exit 0"
+                else
+                    outcomes[i]="failed"
+                    fork_fail "${forks[i]}" "exit ${rc}"
+                fi
+            elif (( now - starts[i] >= timeouts[i] )); then
+                kill_tree "${pids[i]}"
+                wait "${pids[i]}" 2>/dev/null || true
+                outcomes[i]="timeout"
+                durations[i]=$((now - starts[i]))
+                fork_fail "${forks[i]}" "timeout after ${timeouts[i]} ms"
+            elif [[ "${required[i]}" == "required" || "$awaited" == "optional" ]]; then
+                running_awaited=$((running_awaited + 1))
+            fi
+
+            if [[ "$short_circuit" == "true" && -z "$short_by" ]] && has_blocking_result "${work_dir}/${i}.out"; then
+                short_by="${agents[i]}"
+            fi
+        done
+
+        if [[ -n "$short_by" || $running_awaited -eq 0 ]]; then
+            break
+        fi
+        sleep "$poll_s"
+    done
+
+    # Cancel whatever is still running (short-circuit, or optional stragglers)
+    now=$(timing_now_ms)
+    for ((i = 0; i < count; i++)); do
+        if [[ "${outcomes[i]}" == "running" ]]; then
+            kill_tree "${pids[i]}"
+            wait "${pids[i]}" 2>/dev/null || true
+            outcomes[i]="cancelled"
+            durations[i]=$((now - starts[i]))
+            fork_fail "${forks[i]}" "cancelled"
+        fi
+        fork_destroy "${forks[i]}"
+    done
+
+    # ---- Fan-in: merge statuses, findings and recommendations ----
+
+    local records="${work_dir}/records.tsv"
+    local statuses=() reviewer_status=() issues=() missing=()
+    local status issue
+
+    : > "$records"
+    for ((i = 0; i < count; i++)); do
+        # Partial output from cancelled/timed-out reviewers still counts
+        parse_review_output "${work_dir}/${i}.out" "${agents[i]}" >> "$records"
+        status=$(awk -F'\t' -v a="${agents[i]}" '$1 == "status" && $2 == a { s = $3 } END { print s }' "$records")
+
+        if [[ "${outcomes[i]}" == "completed" && -n "$status" ]]; then
+            reviewer_status[i]="$status"
+            statuses+=("$status")
+        elif [[ "${outcomes[i]}" == "completed" ]]; then
+            reviewer_status[i]="-"
+            if [[ "${required[i]}" == "required" ]]; then
+                issues+=("${agents[i]} returned no Status")
+            else
+                missing+=("${agents[i]} (no status)")
+            fi
+        else
+            reviewer_status[i]="-"
+            # A required reviewer is only cancelled by a short-circuit
+            if [[ "${outcomes[i]}" == "cancelled" && "${required[i]}" == "required" ]]; then
+                continue
+            fi
+            local what="${outcomes[i]}"
+            [[ "$what" == "timeout" ]] && what="timed out after ${timeouts[i]} ms"
+            [[ "$what" == "failed" ]] && what="failed (exit ${exit_codes[i]})"
+            if [[ "${required[i]}" == "required" ]]; then
+                issues+=("${agents[i]} ${what}")
+            else
+                missing+=("${agents[i]} ${what}")
+            fi
+        fi
+    done
+
+    local findings="${work_dir}/findings.tsv"
+    dedupe_findings < "$records" > "$findings"
+
+    if [[ ${#statuses[@]} -eq 0 && -z "$short_by" ]]; then
+        issues+=("no reviewer returned a verdict")
+    fi
+
+    if [[ -n "$short_by" || ${#issues[@]} -gt 0 ]] || grep -q '^BLOCKING' "$findings"; then
+        statuses+=("CHANGES_REQUESTED")
+    fi
+
+    local merged
+    merged=$(merge_review_statuses ${statuses[@]+"${statuses[@]}"})
+
+    # ---- Report ----
+
+    echo "## Merged Review Result"
+    echo ""
+    echo "**Final Status**: ${merged}"
+    if [[ -n "$short_by" ]]; then
+        echo "**Short-circuited**: blocking result from ${short_by}"
+    fi
+    echo ""
+    echo "| Reviewer | Required | Outcome | Status | Duration (ms) |"
+    echo "|----------|----------|---------|--------|---------------|"
+    for ((i = 0; i < count; i++)); do
+        echo "| ${agents[i]} | ${required[i]} | ${outcomes[i]} | ${reviewer_status[i]} | ${durations[i]} |"
+    done
+
+    echo ""
+    echo "### Blocking Issues"
+    echo ""
+    if [[ ${#issues[@]} -eq 0 ]] && ! grep -q '^BLOCKING' "$findings"; then
+        echo "None"
+    else
+        for issue in ${issues[@]+"${issues[@]}"}; do
+            echo "- ${issue}"
+        done
+        awk -F'\t' '$1 == "BLOCKING" { printf "- %s (%s)\n", $3, $2 }' "$findings"
+    fi
+
+    if grep -qv '^BLOCKING' "$findings"; then
+        echo ""
+        echo "### Concerns"
+        echo ""
+        awk -F'\t' '$1 != "BLOCKING" { printf "- %s%s (%s)\n", ($1 == "INFO" ? "[info] " : ""), $3, $2 }' "$findings"
+    fi
+
+    local recommendations
+    recommendations=$(awk -F'\t' '$1 == "recommendation" { print "finding\t" $2 "\tINFO\t" $3 }' "$records" | dedupe_findings)
+    if [[ -n "$recommendations" ]]; then
+        echo ""
+        echo "### Recommendations"
+        echo ""
+        echo "$recommendations" | awk -F'\t' '{ printf "- %s (%s)\n", $3, $2 }'
+    fi
+
+    if [[ ${#missing[@]} -gt 0 ]]; then
+        echo ""
+        echo "### Missing Optional Reviews"
+        echo ""
+        for issue in "${missing[@]}"; do
+            echo "- ${issue}"
+        done
+    fi
+
+    # ---- Sign-offs: one atomic rewrite of the artifact ----
+
+    if [[ -n "$artifact" ]]; then
+        local signoffs="${work_dir}/signoffs.tsv" key note today
+        today=$(date +%Y-%m-%d)
+        : > "$signoffs"
+
+        for ((i = 0; i < count; i++)); do
+            key=$(signoff_key_for_agent "${agents[i]}")
+            [[ -n "$key" ]] || continue
+
+            status="${reviewer_status[i]}"
+            if [[ "$status" == "-" && "${agents[i]}" == "$short_by" ]]; then
+                status="CHANGES_REQUESTED"
+            fi
+            [[ "$status" != "-" ]] || continue
+
+            note=$(awk -F'\t' -v a="${agents[i]}" \
+                '$1 == "finding" && $2 == a && (n == "" || $3 == "BLOCKING") { n = $4; if ($3 == "BLOCKING") exit } END { print n }' "$records")
+            note="${note:-No findings}; merged verdict ${merged}"
+            printf '%s\t%s\t%s\t%s\t%s\n' "$key" "${agents[i]}" "$today" "$status" "$note" >> "$signoffs"
+        done
+
+        if [[ -s "$signoffs" ]]; then
+            write_triad_signoffs "$artifact" "$signoffs"
+            echo ""
+            echo "Sign-offs written to ${artifact}"
+        fi
+    fi
+
+    is_approved "$merged"
+}
+
+# ============================================================================
+# CLI
+# ============================================================================
+
+if [[ "${BASH_SOURCE[0]}" == "${0}" ]]; then
+    review_fanout "$@"
+fi
@@ -0,0 +1,60 @@
+#!/usr/bin/env bash
+# Stub Review Agent
+# Feature: 002-anthropic-updates-integration
+# Created: 2026-10-18
+#
+# Local stand-in for a forked reviewer (product-manager, architect,
+# team-lead). Sleeps for a given duration and prints a review result in the
+# same "Status:" format the review skills emit, so the triad pipeline can be
+# benchmarked and tested without launching real agents.
+#
+# Findings are printed before the sleep (as a real reviewer streams them)
+# and the verdict after it, so fan-out short-circuiting can be exercised.
+#
+# Usage:
+#   stub-agent.sh --agent architect --duration-ms 1500 [--verdict APPROVED] [--exit-code N]
+#                 [--finding "BLOCKING|text"]... [--recommend "text"]...
+
+set -euo pipefail
+
+agent="stub"
+duration_ms=0
+verdict="APPROVED"
+exit_code=0
+findings=()
+recommendations=()
+
+while [[ $# -gt 0 ]]; do
+    case "$1" in
+        --agent) agent="$2"; shift ;;
+        --duration-ms) duration_ms="$2"; shift ;;
+        --verdict) verdict="$2"; shift ;;
+        --exit-code) exit_code="$2"; shift ;;
+        --finding) findings+=("$2"); shift ;;
+        --recommend) recommendations+=("$2"); shift ;;
+        *)
+            echo "Usage: stub-agent.sh --agent NAME --duration-ms N [--verdict STATUS] [--exit-code N] [--finding SEV|TEXT] [--recommend TEXT]" >&2
+            exit 2
+            ;;
+    esac
+    shift
+done
+
+echo "## ${agent} review (stub)"
+echo ""
+echo "Agent: ${agent}"
+
+for finding in ${findings[@]+"${findings[@]}"}; do
+    echo "Finding: ${finding%%|*} | ${finding#*|}"
+done
+
+if [[ "$duration_ms" -gt 0 ]]; then
+    sleep "$(awk -v ms="$duration_ms" 'BEGIN { printf "%.3f", ms / 1000 }')"
+fi
+
+for recommendation in ${recommendations[@]+"${recommendations[@]}"}; do
+    echo "Recommendation: ${recommendation}"
+done
+echo "Status: ${verdict}"
+
+exit "$exit_code"
@@ -0,0 +1,82 @@
+#!/usr/bin/env bash
+# Triad Timing Metrics
+# Feature: 002-anthropic-updates-integration
+# Created: 2026-10-18
+#
+# T017 timing API (start_timer / stop_timer / calculate_time_savings /
+# generate_timing_summary) for parallel vs sequential comparison. A thin
+# facade over timing-store.sh: each timed operation is recorded as a fork
+# lifecycle, so it shows up in `timing-store.sh report` and can be replayed
+# by benchmark.sh.
+#
+# Usage (sourced; safe to source from scripts that do not use set -e):
+#   source .claude/lib/triad/timing-metrics.sh
+#   start_timer "triad.plan" "parallel" [parent_id]
+#   ...
+#   duration=$(stop_timer)                      # seconds, e.g. 42.17
+#   calculate_time_savings 100 60               # -> 40.0
+#   generate_timing_summary "triad.plan" "parallel" "$duration" [sequential_s]
+
+TIMING_METRICS_DIR="$(cd "$(dirname "${BASH_SOURCE[0]}")" && pwd)"
+
+source "${TIMING_METRICS_DIR}/timing-store.sh"
+
+TIMER_OPERATION=""
+TIMER_MODE=""
+TIMER_START_MS=""
+TIMER_FORK_ID=""
+
+# The mode is recorded as the fork's detail ("mode=parallel").
+# Args: operation, [mode: parallel|sequential], [parent_id]
+start_timer() {
+    TIMER_OPERATION="$1"
+    TIMER_MODE="${2:-sequential}"
+    TIMER_FORK_ID=$(fork_create "$TIMER_OPERATION" "${3:--}" "mode=${TIMER_MODE}")
+    fork_start "$TIMER_FORK_ID"
+    TIMER_START_MS=$(timing_now_ms)
+}
+
+# Prints the elapsed seconds since start_timer (two decimals)
+stop_timer() {
+    local elapsed_ms
+
+    if [[ -z "$TIMER_START_MS" ]]; then
+        echo "Error: stop_timer called without start_timer" >&2
+        return 1
+    fi
+
+    elapsed_ms=$(( $(timing_now_ms) - TIMER_START_MS ))
+    fork_complete "$TIMER_FORK_ID"
+    fork_destroy "$TIMER_FORK_ID"
+    TIMER_START_MS=""
+
+    awk -v ms="$elapsed_ms" 'BEGIN { printf "%.2f\n", ms / 1000 }'
+}
+
+# Percent saved by the parallel run. Args: sequential_time, parallel_time
+calculate_time_savings() {
+    awk -v s="$1" -v p="$2" 'BEGIN {
+        if (s <= 0) exit 1
+        printf "%.1f\n", (s - p) * 100 / s
+    }'
+}
+
+# Markdown summary. Args: command, mode, duration_s, [sequential_s]
+generate_timing_summary() {
+    local command="$1"
+    local mode="$2"
+    local duration="$3"
+    local sequential="${4:-}"
+
+    echo "## Timing Summary"
+    echo ""
+    echo "| Metric | Value |"
+    echo "|--------|-------|"
+    echo "| Command | ${command} |"
+    echo "| Mode | ${mode} |"
+    echo "| Duration | ${duration}s |"
+    if [[ -n "$sequential" ]]; then
+        echo "| Sequential baseline | ${sequential}s |"
+        echo "| Time saved | $(calculate_time_savings "$sequential" "$duration")% |"
+    fi
+}
@@ -0,0 +1,235 @@
+#!/usr/bin/env bash
+# Fork Timing Store
+# Feature: 002-anthropic-updates-integration
+# Created: 2026-10-18
+#
+# Append-only, machine-readable record of ContextFork lifecycle events
+# (FORK_CREATED / FORK_STARTED / FORK_COMPLETED / FORK_FAILED /
+# FORK_DESTROYED) with per-fork duration and percentile reporting.
+#
+# Store format (one tab-separated event per line, never rewritten):
+#   <epoch_ms>\t<session_id>\t<fork_id>\t<event>\t<agent>\t<parent_id>\t<detail>
+#
+# Each event is written with a single append, so concurrent forks can
+# record into the same store without locking.
+#
+# Usage (sourced; safe to source from scripts that do not use set -e):
+#   source .claude/lib/triad/timing-store.sh
+#   fork_id=$(fork_create "architect" "$parent_id")
+#   fork_start "$fork_id"
+#   fork_complete "$fork_id" "APPROVED"
+#   fork_destroy "$fork_id"
+#   timing_report
+#
+# Usage (standalone):
+#   timing-store.sh report [--by agent|session] [STORE]
+#   timing-store.sh durations [STORE]
+
+# Local, unbounded event log: kept under the (gitignored) project cache and
+# anchored to the project root, not the caller's working directory
+TIMING_PROJECT_ROOT="$(cd "$(dirname "${BASH_SOURCE[0]}")/../../.." && pwd)"
+TIMING_STORE_FILE="${TIMING_STORE_FILE:-${TIMING_PROJECT_ROOT}/.claude/cache/timing-events.tsv}"
+TIMING_SESSION_ID="${TIMING_SESSION_ID:-session-$(date +%Y%m%d%H%M%S)-$$}"
+
+TIMING_EVENTS="FORK_CREATED FORK_STARTED FORK_COMPLETED FORK_FAILED FORK_DESTROYED"
+
+# ============================================================================
+# Clock
+# ============================================================================
+
+# Milliseconds since the epoch (GNU date, then perl, then whole seconds)
+timing_now_ms() {
+    local ns
+    ns=$(date +%s%N 2>/dev/null || true)
+
+    if [[ "$ns" =~ ^[0-9]+$ ]]; then
+        echo $((ns / 1000000))
+    elif command -v perl &>/dev/null; then
+        perl -MTime::HiRes=time -e 'printf "%d\n", time() * 1000'
+    else
+        echo $(($(date +%s) * 1000))
+    fi
+}
+
+# ============================================================================
+# Recording
+# ============================================================================
+
+# Append one lifecycle event to the store.
+# Args: event, fork_id, [agent], [parent_id], [detail]
+record_fork_event() {
+    local event="$1"
+    local fork_id="$2"
+    local agent="${3:--}"
+    local parent_id="${4:--}"
+    local detail="${5:--}"
+
+    case " ${TIMING_EVENTS} " in
+        *" ${event} "*) ;;
+        *)
+            echo "Error: unknown fork event: $event" >&2
+            return 1
+            ;;
+    esac
+
+    mkdir -p "$(dirname "$TIMING_STORE_FILE")"
+
+    # Tabs and newlines would break the record format
+    detail="${detail//$'\t'/ }"
+    detail="${detail//$'\n'/ }"
+
+    printf '%s\t%s\t%s\t%s\t%s\t%s\t%s\n' \
+        "$(timing_now_ms)" "$TIMING_SESSION_ID" "$fork_id" "$event" "$agent" "$parent_id" "$detail" \
+        >> "$TIMING_STORE_FILE"
+}
+
+# Create a fork record and print its id.
+# Args: agent, [parent_id], [detail]
+fork_create() {
+    local agent="$1"
+    local parent_id="${2:--}"
+    local fork_id="fork-${agent}-$(timing_now_ms)-$$-${RANDOM}"
+
+    record_fork_event "FORK_CREATED" "$fork_id" "$agent" "$parent_id" "${3:-}"
+    echo "$fork_id"
+}
+
+fork_start() {
+    record_fork_event "FORK_STARTED" "$1"
+}
+
+# Args: fork_id, [result]
+fork_complete() {
+    record_fork_event "FORK_COMPLETED" "$1" "-" "-" "${2:-}"
+}
+
+# Args: fork_id, [error]
+fork_fail() {
+    record_fork_event "FORK_FAILED" "$1" "-" "-" "${2:-}"
+}
+
+fork_destroy() {
+    record_fork_event "FORK_DESTROYED" "$1"
+}
+
+# ============================================================================
+# Reporting
+# ============================================================================
+
+# One line per fork:
+#   <session>\t<fork_id>\t<agent>\t<outcome>\t<queue_ms>\t<run_ms>\t<total_ms>
+# queue = created->started, run = started->completed/failed,
+# total = created->destroyed (or ->completed/failed if never destroyed).
+# Missing phases are reported as "-".
+fork_durations() {
+    local store="${1:-$TIMING_STORE_FILE}"
+
+    if [[ ! -f "$store" ]]; then
+        echo "Error: timing store not found: $store" >&2
+        return 1
+    fi
+
+    awk -F'\t' '
+    function span(from, to) { return (from != "" && to != "") ? to - from : "-" }
+
+    {
+        f = $3
+        if (!(f in session)) { order[++n] = f; session[f] = $2 }
+        if ($4 == "FORK_CREATED") { created[f] = $1; agent[f] = $5 }
+        else if ($4 == "FORK_STARTED") started[f] = $1
+        else if ($4 == "FORK_COMPLETED") { ended[f] = $1; outcome[f] = "completed" }
+        else if ($4 == "FORK_FAILED") { ended[f] = $1; outcome[f] = "failed" }
+        else if ($4 == "FORK_DESTROYED") destroyed[f] = $1
+    }
+
+    END {
+        for (i = 1; i <= n; i++) {
+            f = order[i]
+            last = (destroyed[f] != "") ? destroyed[f] : ended[f]
+            printf "%s\t%s\t%s\t%s\t%s\t%s\t%s\n", session[f], f, \
+                (agent[f] != "" ? agent[f] : "-"), (outcome[f] != "" ? outcome[f] : "running"), \
+                span(created[f], started[f]), span(started[f], ended[f]), span(created[f], last)
+        }
+    }
+    ' "$store"
+}
+
+# Nearest-rank percentile of numbers on stdin.
+# Args: percentile (0-100)
+timing_percentile() {
+    local pct="$1"
+
+    sort -n | awk -v p="$pct" '
+        { v[++n] = $1 }
+        END {
+            if (n == 0) { print "-"; exit }
+            rank = int((p / 100) * n + 0.999999)
+            if (rank < 1) rank = 1
+            if (rank > n) rank = n
+            print v[rank]
+        }
+    '
+}
+
+# Per-group p50/p95 of fork run time and per-session wall clock.
+# Args: [--by agent|session], [store]
+timing_report() {
+    local by="agent"
+    local store="$TIMING_STORE_FILE"
+
+    while [[ $# -gt 0 ]]; do
+        case "$1" in
+            --by) by="$2"; shift ;;
+            *) store="$1" ;;
+        esac
+        shift
+    done
+
+    local durations
+    durations=$(fork_durations "$store") || return 1
+
+    local column=3
+    [[ "$by" == "session" ]] && column=1
+
+    echo "Fork Timing Report ($(basename "$store"))"
+    echo ""
+    printf '  %-32s %6s %10s %10s %10s\n' "${by}" "forks" "p50 ms" "p95 ms" "failed"
+
+    local group group_rows runs
+    for group in $(echo "$durations" | cut -f"$column" | sort -u); do
+        group_rows=$(echo "$durations" | awk -F'\t' -v c="$column" -v g="$group" '$c == g')
+        runs=$(echo "$group_rows" | awk -F'\t' '$6 != "-" { print $6 }')
+        printf '  %-32s %6s %10s %10s %10s\n' "$group" \
+            "$(echo "$group_rows" | grep -c . || true)" \
+            "$(echo "$runs" | grep . | timing_percentile 50 || true)" \
+            "$(echo "$runs" | grep . | timing_percentile 95 || true)" \
+            "$(echo "$group_rows" | awk -F'\t' '$4 == "failed"' | grep -c . || true)"
+    done
+
+    # Wall clock per session: first CREATED to last COMPLETED/FAILED/DESTROYED
+    local walls
+    walls=$(awk -F'\t' '
+        !($2 in first) || $1 < first[$2] { first[$2] = $1 }
+        $1 > last[$2] { last[$2] = $1 }
+        END { for (s in first) print last[s] - first[s] }
+    ' "$store")
+
+    echo ""
+    echo "  Sessions: $(echo "$walls" | grep -c . || true)  wall-clock p50: $(echo "$walls" | grep . | timing_percentile 50 || true) ms  p95: $(echo "$walls" | grep . | timing_percentile 95 || true) ms"
+}
+
+# ============================================================================
+# CLI
+# ============================================================================
+
+if [[ "${BASH_SOURCE[0]}" == "${0}" ]]; then
+    set -euo pipefail
+    case "${1:-report}" in
+        report) shift || true; timing_report "$@" ;;
+        durations) shift; fork_durations "$@" ;;
+        *)
+            echo "Usage: timing-store.sh report [--by agent|session] [STORE] | durations [STORE]" >&2
+            exit 1
+            ;;
+    esac
+fi
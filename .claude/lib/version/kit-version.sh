@@ -0,0 +1,37 @@
+#!/usr/bin/env bash
+# Kit Version
+# Feature: 002-anthropic-updates-integration
+# Created: 2026-10-18
+#
+# Latest released kit version, taken from the first "## [X.Y.Z]" heading
+# of CHANGELOG.md. Baselines (benchmark.sh, prompt-profile.sh) tag their
+# rows with it so measurements can be compared across releases.
+#
+# Usage (sourced; safe to source from scripts that do not use set -e):
+#   source .claude/lib/version/kit-version.sh
+#   kit_version                          # e.g. 3.0.0, or "unknown"
+#   kit_version path/to/CHANGELOG.md
+#
+# Usage (standalone):
+#   kit-version.sh [CHANGELOG]
+
+KIT_PROJECT_ROOT="$(cd "$(dirname "${BASH_SOURCE[0]}")/../../.." && pwd)"
+
+# Latest released version ("unknown" if none). Args: [changelog]
+kit_version() {
+    local changelog="${1:-${KIT_PROJECT_ROOT}/CHANGELOG.md}"
+    local version
+
+    version=$(awk '/^## \[[0-9]+\.[0-9]+\.[0-9]+\]/ { v = $2; gsub(/[][]/, "", v); print v; exit }' \
+        "$changelog" 2>/dev/null || true)
+    echo "${version:-unknown}"
+}
+
+# ============================================================================
+# CLI
+# ============================================================================
+
+if [[ "${BASH_SOURCE[0]}" == "${0}" ]]; then
+    set -euo pipefail
+    kit_version "$@"
+fi
@@ -0,0 +1,311 @@
+#!/usr/bin/env bash
+# Cached Version and Feature Detection
+# Feature: 002-anthropic-updates-integration
+# Created: 2026-10-18
+#
+# Probes each tool (claude, node, git, ...) at most once and persists the
+# result, so version checks and feature-flag lookups across a multi-agent
+# session stop spawning `<tool> --version` every time.
+#
+# Implements the FeatureDetector contract from
+# specs/002-anthropic-updates-integration/contracts/integration-contracts.md:
+#   detectVersion()   -> get_version_info        (VersionInfo as JSON)
+#   hasFeature(name)  -> has_feature NAME        (exit status)
+#   getFeatureFlags() -> get_feature_flags       (FeatureFlags as JSON)
+#
+# Cache: ${SPEC_KIT_CACHE_DIR:-<project root>/.claude/cache}/tool-probes.tsv, one row per tool:
+#   <tool>\t<binary path>\t<mtime:size>\t<version>\t<raw version line>\t<detected_at>
+# A row is valid while the binary resolves to the same path with the same
+# mtime and size; upgrading or moving the tool invalidates it automatically.
+# After the first lookup, results are served from shell memory.
+#
+# Overrides (see Configuration Contract):
+#   SPEC_KIT_CLAUDE_VERSION=2.1.16         skip probing claude
+#   SPEC_KIT_FORCE_CONTEXT_FORK=true       SPEC_KIT_DISABLE_CONTEXT_FORK=true
+#   SPEC_KIT_FORCE_PARALLEL=true           SPEC_KIT_DISABLE_PARALLEL=true
+#
+# Usage (sourced; safe to source from scripts that do not use set -e):
+#   source .claude/lib/version/probe-cache.sh
+#   has_feature context_forking && echo "forking available"
+#   tool_version node
+#
+# Usage (standalone):
+#   probe-cache.sh version|flags|probe TOOL|clear
+
+# Anchored to the project root, not the caller's working directory
+PROBE_PROJECT_ROOT="$(cd "$(dirname "${BASH_SOURCE[0]}")/../../.." && pwd)"
+PROBE_CACHE_DIR="${SPEC_KIT_CACHE_DIR:-${PROBE_PROJECT_ROOT}/.claude/cache}"
+PROBE_CACHE_FILE="${PROBE_CACHE_DIR}/tool-probes.tsv"
+
+# Minimum Claude Code version per feature
+PROBE_FEATURES="context_forking:2.1.0 parallel_execution_fixes:2.1.16 task_dependency_tracking:2.1.16 env_var_detection:0.2.47"
+
+# In-memory results for this shell: "<tool>\t<path>\t<version>\t<raw>\t<detected_at>" lines
+# (empty fields are stored as "-", see probe_unfield)
+PROBE_MEMORY="${PROBE_MEMORY:-}"
+PROBE_DISK_LOADED="${PROBE_DISK_LOADED:-false}"
+PROBE_DISK_ROWS="${PROBE_DISK_ROWS:-}"
+
+# ============================================================================
+# Helpers
+# ============================================================================
+
+# "<mtime>:<size>" of the file a binary resolves to (GNU stat, then BSD)
+probe_stamp() {
+    stat -L -c '%Y:%s' "$1" 2>/dev/null || stat -L -f '%m:%z' "$1" 2>/dev/null
+}
+
+# Rows store empty fields as "-": `read` with a tab IFS merges consecutive
+# tabs and would shift every later field left. Map "-" back to empty after
+# a row has been read into the PROBE_* variables.
+probe_unfield() {
+    [[ "$PROBE_PATH" == "-" ]] && PROBE_PATH=""
+    [[ "$PROBE_VERSION" == "-" ]] && PROBE_VERSION=""
+    [[ "$PROBE_RAW" == "-" ]] && PROBE_RAW=""
+    [[ "$PROBE_DETECTED_AT" == "-" ]] && PROBE_DETECTED_AT=""
+    return 0
+}
+
+# Extract the first x.y.z from a version line
+probe_parse_version() {
+    local line="$1"
+
+    if [[ "$line" =~ ([0-9]+\.[0-9]+\.[0-9]+) ]]; then
+        echo "${BASH_REMATCH[1]}"
+    elif [[ "$line" =~ ([0-9]+\.[0-9]+) ]]; then
+        echo "${BASH_REMATCH[1]}.0"
+    fi
+}
+
+# True if version $1 >= version $2 (no subprocesses)
+probe_version_at_least() {
+    local a1 a2 a3 b1 b2 b3
+    [[ "$1" =~ ^[0-9]+(\.[0-9]+)*$ && "$2" =~ ^[0-9]+(\.[0-9]+)*$ ]] || return 1
+    IFS=. read -r a1 a2 a3 <<< "$1"
+    IFS=. read -r b1 b2 b3 <<< "$2"
+
+    (( ${a1:-0} != ${b1:-0} )) && { (( ${a1:-0} > ${b1:-0} )); return; }
+    (( ${a2:-0} != ${b2:-0} )) && { (( ${a2:-0} > ${b2:-0} )); return; }
+    (( ${a3:-0} >= ${b3:-0} ))
+}
+
+# Find the memory line for a tool; sets PROBE_LINE
+probe_memory_lookup() {
+    local tool="$1" line
+    PROBE_LINE=""
+
+    while IFS= read -r line; do
+        if [[ "${line%%$'\t'*}" == "$tool" ]]; then
+            PROBE_LINE="$line"
+            return 0
+        fi
+    done <<< "$PROBE_MEMORY"
+
+    return 1
+}
+
+probe_load_disk() {
+    if [[ "$PROBE_DISK_LOADED" != "true" ]]; then
+        PROBE_DISK_ROWS=""
+        if [[ -f "$PROBE_CACHE_FILE" ]]; then
+            PROBE_DISK_ROWS=$(< "$PROBE_CACHE_FILE")
+        fi
+        PROBE_DISK_LOADED=true
+    fi
+}
+
+# Replace a tool's row in the cache file (temp file + mv)
+probe_save_disk() {
+    local tool="$1" row="$2" line rows=""
+
+    mkdir -p "$PROBE_CACHE_DIR" 2>/dev/null || return 0
+
+    probe_load_disk
+    while IFS= read -r line; do
+        [[ -z "$line" || "${line%%$'\t'*}" == "$tool" ]] && continue
+        rows="${rows}${line}"$'\n'
+    done <<< "$PROBE_DISK_ROWS"
+    rows="${rows}${row}"$'\n'
+
+    if printf '%s' "$rows" > "${PROBE_CACHE_FILE}.$$" 2>/dev/null; then
+        mv -f "${PROBE_CACHE_FILE}.$$" "$PROBE_CACHE_FILE"
+    fi
+    PROBE_DISK_ROWS="${rows%$'\n'}"
+}
+
+# ============================================================================
+# Probing
+# ============================================================================
+
+# Probe a tool once, from memory, disk, or by running `<tool> --version`.
+# Sets PROBE_PATH, PROBE_VERSION, PROBE_RAW, PROBE_DETECTED_AT.
+# Returns 1 if the tool is not installed.
+probe_tool() {
+    local tool="$1"
+    local path stamp line c_tool c_path c_stamp c_version c_raw c_at
+
+    PROBE_PATH=""; PROBE_VERSION=""; PROBE_RAW=""; PROBE_DETECTED_AT=""
+
+    if probe_memory_lookup "$tool"; then
+        IFS=$'\t' read -r _ PROBE_PATH PROBE_VERSION PROBE_RAW PROBE_DETECTED_AT <<< "$PROBE_LINE"
+        probe_unfield
+        [[ -n "$PROBE_PATH" ]]
+        return
+    fi
+
+    path=$(command -v "$tool" 2>/dev/null || true)
+    if [[ -z "$path" ]]; then
+        PROBE_MEMORY="${PROBE_MEMORY}${tool}"$'\t-\t-\t-\t-\n'
+        return 1
+    fi
+    stamp=$(probe_stamp "$path")
+
+    probe_load_disk
+    while IFS=$'\t' read -r c_tool c_path c_stamp c_version c_raw c_at; do
+        if [[ "$c_tool" == "$tool" && "$c_path" == "$path" && -n "$stamp" && "$c_stamp" == "$stamp" ]]; then
+            PROBE_PATH="$c_path"; PROBE_VERSION="$c_version"; PROBE_RAW="$c_raw"; PROBE_DETECTED_AT="$c_at"
+            probe_unfield
+            break
+        fi
+    done <<< "$PROBE_DISK_ROWS"
+
+    if [[ -z "$PROBE_PATH" ]]; then
+        PROBE_PATH="$path"
+        PROBE_RAW=$("$path" --version 2>/dev/null | head -1 || true)
+        PROBE_RAW="${PROBE_RAW//$'\t'/ }"
+        PROBE_VERSION=$(probe_parse_version "$PROBE_RAW")
+        PROBE_DETECTED_AT=$(date -u +%Y-%m-%dT%H:%M:%SZ)
+        if [[ -n "$stamp" ]]; then
+            probe_save_disk "$tool" "${tool}"$'\t'"${path}"$'\t'"${stamp}"$'\t'"${PROBE_VERSION:--}"$'\t'"${PROBE_RAW:--}"$'\t'"${PROBE_DETECTED_AT}"
+        fi
+    fi
+
+    PROBE_MEMORY="${PROBE_MEMORY}${tool}"$'\t'"${PROBE_PATH}"$'\t'"${PROBE_VERSION:--}"$'\t'"${PROBE_RAW:--}"$'\t'"${PROBE_DETECTED_AT}"$'\n'
+}
+
+# Parsed x.y.z version of a tool (empty if missing/unparseable)
+tool_version() {
+    probe_tool "$1" || return 1
+    echo "$PROBE_VERSION"
+}
+
+# First line of `<tool> --version` (e.g. "git version 2.43.0")
+tool_version_line() {
+    probe_tool "$1" || return 1
+    echo "$PROBE_RAW"
+}
+
+# Drop cached probes (memory and disk)
+clear_probe_cache() {
+    PROBE_MEMORY=""
+    PROBE_DISK_ROWS=""
+    PROBE_DISK_LOADED=false
+    rm -f "$PROBE_CACHE_FILE"
+}
+
+# ============================================================================
+# FeatureDetector contract
+# ============================================================================
+
+# Sets CLAUDE_VERSION and CLAUDE_DETECTION_METHOD (env_var | cli | fallback)
+detect_claude_version() {
+    if [[ -n "${SPEC_KIT_CLAUDE_VERSION:-}" ]]; then
+        CLAUDE_VERSION="$SPEC_KIT_CLAUDE_VERSION"
+        CLAUDE_DETECTION_METHOD="env_var"
+    elif probe_tool claude && [[ -n "$PROBE_VERSION" ]]; then
+        CLAUDE_VERSION="$PROBE_VERSION"
+        CLAUDE_DETECTION_METHOD="cli"
+    else
+        CLAUDE_VERSION=""
+        CLAUDE_DETECTION_METHOD="fallback"
+    fi
+}
+
+# VersionInfo as JSON
+get_version_info() {
+    local major="null" minor="null" patch="null" version="null"
+
+    detect_claude_version
+    if [[ -n "$CLAUDE_VERSION" ]]; then
+        IFS=. read -r major minor patch <<< "$CLAUDE_VERSION"
+        version="\"${CLAUDE_VERSION}\""
+    fi
+
+    printf '{"version": %s, "major": %s, "minor": %s, "patch": %s, "detected_at": "%s", "detection_method": "%s"}\n' \
+        "$version" "${major:-null}" "${minor:-null}" "${patch:-null}" \
+        "${PROBE_DETECTED_AT:-$(date -u +%Y-%m-%dT%H:%M:%SZ)}" "$CLAUDE_DETECTION_METHOD"
+}
+
+# hasFeature: exit 0 when the feature is available
+has_feature() {
+    local feature="$1"
+    local entry minimum=""
+
+    case "$feature" in
+        context_forking)
+            [[ "${SPEC_KIT_DISABLE_CONTEXT_FORK:-false}" == "true" ]] && return 1
+            [[ "${SPEC_KIT_FORCE_CONTEXT_FORK:-false}" == "true" ]] && return 0
+            ;;
+        parallel_execution_fixes)
+            [[ "${SPEC_KIT_DISABLE_PARALLEL:-false}" == "true" ]] && return 1
+            [[ "${SPEC_KIT_FORCE_PARALLEL:-false}" == "true" ]] && return 0
+            ;;
+        env_var_detection)
+            [[ -n "${CLAUDECODE:-}" ]] && return 0
+            ;;
+    esac
+
+    for entry in $PROBE_FEATURES; do
+        [[ "${entry%%:*}" == "$feature" ]] && minimum="${entry#*:}"
+    done
+    if [[ -z "$minimum" ]]; then
+        echo "Error: unknown feature: $feature" >&2
+        return 2
+    fi
+
+    detect_claude_version
+    [[ -n "$CLAUDE_VERSION" ]] && probe_version_at_least "$CLAUDE_VERSION" "$minimum"
+}
+
+# FeatureFlags as JSON
+get_feature_flags() {
+    local entry name sep="" out="{"
+
+    for entry in $PROBE_FEATURES; do
+        name="${entry%%:*}"
+        if has_feature "$name"; then
+            out="${out}${sep}\"${name}\": true"
+        else
+            out="${out}${sep}\"${name}\": false"
+        fi
+        sep=", "
+    done
+
+    echo "${out}}"
+}
+
+# ============================================================================
+# CLI
+# ============================================================================
+
+if [[ "${BASH_SOURCE[0]}" == "${0}" ]]; then
+    set -euo pipefail
+
+    case "${1:-version}" in
+        version) get_version_info ;;
+        flags) get_feature_flags ;;
+        probe)
+            if probe_tool "${2:?tool name required}"; then
+                printf '%s\t%s\t%s\n' "$2" "${PROBE_VERSION:--}" "$PROBE_PATH"
+            else
+                echo "$2: not installed" >&2
+                exit 1
+            fi
+            ;;
+        clear) clear_probe_cache ;;
+        *)
+            echo "Usage: probe-cache.sh version|flags|probe TOOL|clear" >&2
+            exit 1
+            ;;
+    esac
+fi
@@ -13,9 +13,21 @@ echo ""
 
 ERRORS=0
 
+# Tool versions are probed once and cached until the binary changes
+PROBE_LIB=".claude/lib/version/probe-cache.sh"
+if [[ -f "$PROBE_LIB" ]]; then
+  source "$PROBE_LIB"
+else
+  tool_version_line() {
+    command -v "$1" &> /dev/null && "$1" --version 2>/dev/null | head -1
+  }
+  tool_version() {
+    tool_version_line "$1" | grep -oE '[0-9]+\.[0-9]+\.[0-9]+' | head -1
+  }
+fi
+
 # Check Node.js
-if command -v node &> /dev/null; then
-  NODE_VERSION=$(node -v)
+if NODE_VERSION=$(tool_version_line node); then
   echo -e "${GREEN}✓ Node.js: $NODE_VERSION${NC}"
 else
   echo -e "${RED}✗ Node.js: NOT FOUND${NC}"
@@ -23,8 +35,7 @@ else
 fi
 
 # Check Git
-if command -v git &> /dev/null; then
-  GIT_VERSION=$(git --version)
+if GIT_VERSION=$(tool_version_line git); then
   echo -e "${GREEN}✓ Git: $GIT_VERSION${NC}"
 else
   echo -e "${RED}✗ Git: NOT FOUND${NC}"
@@ -33,7 +44,7 @@ fi
 
 # Check Claude Code (if selected)
 if command -v claude &> /dev/null; then
-  echo -e "${GREEN}✓ Claude Code: installed${NC}"
+  echo -e "${GREEN}✓ Claude Code: installed (v$(tool_version claude))${NC}"
 else
   echo -e "${YELLOW}⚠ Claude Code: not found (optional)${NC}"
 fi
@@ -56,6 +67,17 @@ fi
 if [[ -d ".claude/agents" ]]; then
   AGENT_COUNT=$(ls -1 .claude/agents/*.md 2>/dev/null | wc -l | tr -d ' ')
   echo -e "${GREEN}✓ Agents: $AGENT_COUNT found${NC}"
+
+  # Expanded prompt size (agent + skills + @-imports) against the token budget
+  if [[ -x ".claude/lib/agents/prompt-profile.sh" ]]; then
+    if PROMPT_OUTPUT=$(.claude/lib/agents/prompt-profile.sh check 2>&1); then
+      echo -e "${GREEN}✓ Agent prompts: within token budget${NC}"
+    else
+      echo "$PROMPT_OUTPUT" | sed '$d'
+      echo -e "${RED}✗ Agent prompts: over token budget (make prompt-size)${NC}"
+      ERRORS=$((ERRORS + 1))
+    fi
+  fi
 else
   echo -e "${RED}✗ Agents directory: NOT FOUND${NC}"
   ERRORS=$((ERRORS + 1))
@@ -69,6 +91,17 @@ else
   ERRORS=$((ERRORS + 1))
 fi
 
+# Lint spec artifacts changed since the last commit (full run: make lint)
+if [[ -x "scripts/lint-specs.sh" ]]; then
+  if LINT_OUTPUT=$(./scripts/lint-specs.sh --changed 2>&1); then
+    echo -e "${GREEN}✓ Spec lint: changed files clean${NC}"
+  else
+    echo "$LINT_OUTPUT" | sed '$d'
+    echo -e "${RED}✗ Spec lint: errors in changed files (./scripts/lint-specs.sh --changed)${NC}"
+    ERRORS=$((ERRORS + 1))
+  fi
+fi
+
 echo ""
 if [[ $ERRORS -eq 0 ]]; then
   echo -e "${GREEN}🎉 All checks passed! Ready to build.${NC}"
@@ -1,5 +1,16 @@
 #!/bin/bash
 # scripts/init.sh - Product-Led-Spec-Kit Initialization
+#
+# Usage:
+#   ./scripts/init.sh                      # interactive prompts
+#   ./scripts/init.sh --config init.conf   # non-interactive (KEY=VALUE file)
+#   ./scripts/init.sh --config init.conf --jobs 8
+#
+# Template substitution is incremental: the tree is scanned once into an
+# index of files holding {{...}} placeholders, only those files are
+# rewritten (in parallel, via temp file + mv), and every rewritten file is
+# recorded in a manifest under .specify/init/ so an interrupted run resumes
+# where it stopped instead of sweeping the whole tree again.
 
 set -e
 
@@ -10,6 +21,39 @@ BLUE='\033[0;34m'
 YELLOW='\033[1;33m'
 NC='\033[0m' # No Color
 
+# Variables substituted as {{NAME}} across the template
+TEMPLATE_VARS=(PROJECT_NAME PROJECT_DESCRIPTION GITHUB_ORG GITHUB_REPO AI_AGENT TECH_STACK CLOUD_PROVIDER)
+
+# Resumable state: index of placeholder hits, rewritten files, sed script
+INIT_STATE_DIR=".specify/init"
+INIT_INDEX_FILE="${INIT_STATE_DIR}/index"
+INIT_DONE_FILE="${INIT_STATE_DIR}/manifest"
+INIT_SED_FILE="${INIT_STATE_DIR}/substitutions.sed"
+INIT_CONFIG_SUM_FILE="${INIT_STATE_DIR}/config.cksum"
+
+CONFIG_FILE=""
+JOBS=""
+
+usage() {
+  echo "Usage: $0 [--config FILE] [--jobs N]"
+  echo ""
+  echo "  --config FILE  Read PROJECT_NAME, PROJECT_DESCRIPTION, GITHUB_ORG, GITHUB_REPO,"
+  echo "                 AI_AGENT, TECH_STACK, CLOUD_PROVIDER from a KEY=VALUE file"
+  echo "                 instead of prompting"
+  echo "  --jobs N       Number of parallel rewrite workers (default: CPU count)"
+}
+
+while [[ $# -gt 0 ]]; do
+  case "$1" in
+    --config) CONFIG_FILE="$2"; shift 2 ;;
+    --config=*) CONFIG_FILE="${1#--config=}"; shift ;;
+    --jobs) JOBS="$2"; shift 2 ;;
+    --jobs=*) JOBS="${1#--jobs=}"; shift ;;
+    -h|--help) usage; exit 0 ;;
+    *) echo -e "${RED}Unknown option: $1${NC}" >&2; usage >&2; exit 1 ;;
+  esac
+done
+
 echo -e "${BLUE}🚀 Product-Led-Spec-Kit - Project Initialization${NC}"
 echo ""
 
@@ -20,30 +64,86 @@ command -v git >/dev/null 2>&1 || { echo -e "${RED}Git is required but not insta
 echo -e "${GREEN}✓ All prerequisites met${NC}"
 echo ""
 
-# Interactive prompts
-read -p "Project Name: " PROJECT_NAME
-read -p "Project Description: " PROJECT_DESCRIPTION
-read -p "GitHub Organization: " GITHUB_ORG
-read -p "GitHub Repository [$PROJECT_NAME]: " GITHUB_REPO
-GITHUB_REPO=${GITHUB_REPO:-$PROJECT_NAME}
+# Read KEY=VALUE pairs for known template variables (the file is never sourced)
+load_config() {
+  local file="$1" line key value var
 
-echo ""
-echo "Select AI Agent:"
-echo "  1) Claude Code (recommended)"
-echo "  2) Cursor"
-echo "  3) GitHub Copilot"
-read -p "Choice [1]: " AI_CHOICE
-case $AI_CHOICE in
-  2) AI_AGENT="cursor" ;;
-  3) AI_AGENT="copilot" ;;
-  *) AI_AGENT="claude" ;;
-esac
-
-read -p "Primary Tech Stack (e.g., Node.js, Python, Go): " TECH_STACK
-TECH_STACK=${TECH_STACK:-"Not yet defined"}
-
-read -p "Cloud Provider (e.g., Vercel, AWS, GCP) [optional]: " CLOUD_PROVIDER
-CLOUD_PROVIDER=${CLOUD_PROVIDER:-"Not yet defined"}
+  if [[ ! -f "$file" ]]; then
+    echo -e "${RED}Config file not found: $file${NC}" >&2
+    exit 1
+  fi
+
+  # Only the config file decides values; ignore same-named environment variables
+  for var in "${TEMPLATE_VARS[@]}"; do
+    unset "$var"
+  done
+
+  while IFS= read -r line || [[ -n "$line" ]]; do
+    line="${line%$'\r'}"
+    [[ -z "$line" || "$line" =~ ^[[:space:]]*# ]] && continue
+    [[ "$line" == *=* ]] || continue
+
+    key="${line%%=*}"
+    key="${key//[[:space:]]/}"
+    value="${line#*=}"
+    value="${value#"${value%%[![:space:]]*}"}"
+    value="${value%"${value##*[![:space:]]}"}"
+    if [[ "$value" =~ ^\"(.*)\"$ || "$value" =~ ^\'(.*)\'$ ]]; then
+      value="${BASH_REMATCH[1]}"
+    fi
+
+    for var in "${TEMPLATE_VARS[@]}"; do
+      if [[ "$key" == "$var" ]]; then
+        printf -v "$var" '%s' "$value"
+      fi
+    done
+  done < "$file"
+
+  if [[ -z "${PROJECT_NAME:-}" ]]; then
+    echo -e "${RED}PROJECT_NAME is required in $file${NC}" >&2
+    exit 1
+  fi
+
+  GITHUB_REPO=${GITHUB_REPO:-$PROJECT_NAME}
+  case "${AI_AGENT:-claude}" in
+    cursor|copilot|claude) AI_AGENT=${AI_AGENT:-claude} ;;
+    *) echo -e "${RED}AI_AGENT must be one of: claude, cursor, copilot${NC}" >&2; exit 1 ;;
+  esac
+  TECH_STACK=${TECH_STACK:-"Not yet defined"}
+  CLOUD_PROVIDER=${CLOUD_PROVIDER:-"Not yet defined"}
+}
+
+prompt_config() {
+  read -p "Project Name: " PROJECT_NAME
+  read -p "Project Description: " PROJECT_DESCRIPTION
+  read -p "GitHub Organization: " GITHUB_ORG
+  read -p "GitHub Repository [$PROJECT_NAME]: " GITHUB_REPO
+  GITHUB_REPO=${GITHUB_REPO:-$PROJECT_NAME}
+
+  echo ""
+  echo "Select AI Agent:"
+  echo "  1) Claude Code (recommended)"
+  echo "  2) Cursor"
+  echo "  3) GitHub Copilot"
+  read -p "Choice [1]: " AI_CHOICE
+  case $AI_CHOICE in
+    2) AI_AGENT="cursor" ;;
+    3) AI_AGENT="copilot" ;;
+    *) AI_AGENT="claude" ;;
+  esac
+
+  read -p "Primary Tech Stack (e.g., Node.js, Python, Go): " TECH_STACK
+  TECH_STACK=${TECH_STACK:-"Not yet defined"}
+
+  read -p "Cloud Provider (e.g., Vercel, AWS, GCP) [optional]: " CLOUD_PROVIDER
+  CLOUD_PROVIDER=${CLOUD_PROVIDER:-"Not yet defined"}
+}
+
+if [[ -n "$CONFIG_FILE" ]]; then
+  load_config "$CONFIG_FILE"
+else
+  prompt_config
+fi
 
 # Confirmation
 echo ""
@@ -55,48 +155,112 @@ echo "  AI Agent:        $AI_AGENT"
 echo "  Tech Stack:      $TECH_STACK"
 echo "  Cloud Provider:  $CLOUD_PROVIDER"
 echo ""
-read -p "Proceed with initialization? [Y/n]: " CONFIRM
-if [[ $CONFIRM =~ ^[Nn]$ ]]; then
-  echo "Initialization cancelled."
-  exit 0
+if [[ -z "$CONFIG_FILE" ]]; then
+  read -p "Proceed with initialization? [Y/n]: " CONFIRM
+  if [[ $CONFIRM =~ ^[Nn]$ ]]; then
+    echo "Initialization cancelled."
+    exit 0
+  fi
+  echo ""
 fi
 
-echo ""
 echo -e "${YELLOW}🔄 Replacing template variables...${NC}"
 
-# Function to replace in files (cross-platform)
+# Escape a value for use as the replacement side of a sed s/// command
+sed_escape() {
+  printf '%s' "$1" | sed -e 's/[\/&\\]/\\&/g'
+}
+
+cpu_count() {
+  getconf _NPROCESSORS_ONLN 2>/dev/null || sysctl -n hw.ncpu 2>/dev/null || echo 4
+}
+
+# One s/// line per template variable; its checksum identifies the run
+write_sed_script() {
+  local var
+  for var in "${TEMPLATE_VARS[@]}"; do
+    printf 's/{{%s}}/%s/g\n' "$var" "$(sed_escape "${!var}")"
+  done
+}
+
+# Scan the tree once; emit "<file>\t<TOKEN,TOKEN>" for every file with a hit
+build_index() {
+  local pattern
+  pattern="\\{\\{($(IFS='|'; echo "${TEMPLATE_VARS[*]}"))\\}\\}"
+
+  { grep -rIoE \
+      --exclude-dir=.git \
+      --exclude-dir=node_modules \
+      "$pattern" . 2>/dev/null || true; } |
+    grep -v -e "^\./scripts/init\.sh:" -e "^\./${INIT_STATE_DIR}/" |
+    awk '{
+      i = index($0, ":{{")
+      file = substr($0, 1, i - 1)
+      token = substr($0, i + 3)
+      sub(/}}$/, "", token)
+      if (!(file in tokens)) { order[++n] = file; tokens[file] = token }
+      else if (index("," tokens[file] ",", "," token ",") == 0) tokens[file] = tokens[file] "," token
+    }
+    END { for (i = 1; i <= n; i++) printf "%s\t%s\n", order[i], tokens[order[i]] }'
+}
+
+# Rewrite one file atomically and record it in the manifest
+substitute_file() {
+  local file="$1" tmp
+  tmp="$(dirname "$file")/.init.$$.$(basename "$file")"
+
+  if cp -p "$file" "$tmp" && sed -f "$INIT_SED_FILE" "$file" > "$tmp" && mv -f "$tmp" "$file"; then
+    echo "$file" >> "$INIT_DONE_FILE"
+  else
+    rm -f "$tmp"
+    echo "Failed to rewrite: $file" >&2
+    return 1
+  fi
+}
+
 replace_in_files() {
-  if [[ "$OSTYPE" == "darwin"* ]]; then
-    # macOS
-    find . -type f \
-      -not -path "./.git/*" \
-      -not -path "./node_modules/*" \
-      -not -name "*.png" -not -name "*.jpg" -not -name "*.ico" \
-      -exec sed -i '' \
-        -e "s/{{PROJECT_NAME}}/$PROJECT_NAME/g" \
-        -e "s/{{PROJECT_DESCRIPTION}}/$PROJECT_DESCRIPTION/g" \
-        -e "s/{{GITHUB_ORG}}/$GITHUB_ORG/g" \
-        -e "s/{{GITHUB_REPO}}/$GITHUB_REPO/g" \
-        -e "s/{{AI_AGENT}}/$AI_AGENT/g" \
-        -e "s/{{TECH_STACK}}/$TECH_STACK/g" \
-        -e "s/{{CLOUD_PROVIDER}}/$CLOUD_PROVIDER/g" \
-        {} +
+  local config_sum pending hits
+
+  mkdir -p "$INIT_STATE_DIR"
+  config_sum=$(write_sed_script | cksum)
+
+  if [[ -f "$INIT_CONFIG_SUM_FILE" ]]; then
+    if [[ "$(cat "$INIT_CONFIG_SUM_FILE")" != "$config_sum" ]]; then
+      echo -e "${RED}A previous initialization with different values is incomplete.${NC}" >&2
+      echo -e "${RED}Re-run with the same configuration, or remove ${INIT_STATE_DIR}/ and restore the template.${NC}" >&2
+      exit 1
+    fi
+    echo -e "${YELLOW}Resuming previous initialization...${NC}"
   else
-    # Linux
-    find . -type f \
-      -not -path "./.git/*" \
-      -not -path "./node_modules/*" \
-      -not -name "*.png" -not -name "*.jpg" -not -name "*.ico" \
-      -exec sed -i \
-        -e "s/{{PROJECT_NAME}}/$PROJECT_NAME/g" \
-        -e "s/{{PROJECT_DESCRIPTION}}/$PROJECT_DESCRIPTION/g" \
-        -e "s/{{GITHUB_ORG}}/$GITHUB_ORG/g" \
-        -e "s/{{GITHUB_REPO}}/$GITHUB_REPO/g" \
-        -e "s/{{AI_AGENT}}/$AI_AGENT/g" \
-        -e "s/{{TECH_STACK}}/$TECH_STACK/g" \
-        -e "s/{{CLOUD_PROVIDER}}/$CLOUD_PROVIDER/g" \
-        {} +
+    echo "$config_sum" > "$INIT_CONFIG_SUM_FILE"
+  fi
+
+  write_sed_script > "$INIT_SED_FILE"
+  touch "$INIT_DONE_FILE"
+
+  if [[ ! -f "$INIT_INDEX_FILE" ]]; then
+    build_index > "${INIT_INDEX_FILE}.tmp"
+    mv -f "${INIT_INDEX_FILE}.tmp" "$INIT_INDEX_FILE"
+  fi
+
+  hits=$(wc -l < "$INIT_INDEX_FILE" | tr -d ' ')
+  pending=$(awk -F'\t' 'FILENAME == ARGV[1] { done[$0] = 1; next } !($1 in done) { print $1 }' \
+    "$INIT_DONE_FILE" "$INIT_INDEX_FILE")
+
+  echo "  Files with placeholders: $hits ($(echo -n "$pending" | grep -c '^' || true) pending)"
+
+  if [[ -n "$pending" ]]; then
+    export INIT_SED_FILE INIT_DONE_FILE
+    export -f substitute_file
+    printf '%s\n' "$pending" | tr '\n' '\0' |
+      xargs -0 -n 16 -P "${JOBS:-$(cpu_count)}" \
+        bash -c 'status=0; for f; do substitute_file "$f" || status=1; done; exit $status' _ || {
+        echo -e "${RED}Some files could not be rewritten. Fix the errors above and re-run to resume.${NC}" >&2
+        exit 1
+      }
   fi
+
+  rm -rf "$INIT_STATE_DIR"
 }
 
 replace_in_files
@@ -0,0 +1,423 @@
+#!/bin/bash
+# scripts/lint-specs.sh - Product-Led-Spec-Kit Spec Artifact Linter
+#
+# Structural checks over specs/ and docs/ markdown in a single awk pass:
+#   frontmatter  triad:/prd: frontmatter schema (sign-off fields, statuses,
+#                ISO dates), prd_reference target exists
+#   task-id      tasks.md IDs run T001..Tn with no gaps, repeats or reordering
+#   task-tag     tags after a task ID are [P] or [US<n>], each at most once
+#   link         relative markdown links resolve to an existing file/dir
+#   header       file headers (docs/standards/FILE_HEADER_STANDARDS.md) have
+#                all fields, the right filename, and ordered ISO dates;
+#                new files without a header are warned about
+#
+# Incremental modes lint only markdown files changed since the last commit,
+# plus files that may link to a deleted or renamed one.
+#
+# Usage:
+#   ./scripts/lint-specs.sh [--changed | --staged] [--strict] [FILE...]
+#     --changed  files modified, added or untracked relative to HEAD
+#     --staged   files in the index (default when run as a pre-commit hook);
+#                the staged content is linted and links resolve against the
+#                index, so unstaged fixes cannot hide what is committed
+#     --strict   treat warnings as errors
+#   SPEC_LINT_ROOT overrides the repository root (default: this script's repo)
+#
+# Pre-commit hook:
+#   ln -s ../../scripts/lint-specs.sh .git/hooks/pre-commit
+
+# Colors
+RED='\033[0;31m'
+GREEN='\033[0;32m'
+YELLOW='\033[1;33m'
+BLUE='\033[0;34m'
+NC='\033[0m' # No Color
+
+PROJECT_ROOT="${SPEC_LINT_ROOT:-$(cd "$(dirname "${BASH_SOURCE[0]}")/.." && pwd)}"
+
+# As a hook, $0 is .git/hooks/pre-commit; resolve the repo from git instead
+if [[ "$(basename "$0")" == "pre-commit" && -z "${SPEC_LINT_ROOT:-}" ]]; then
+  PROJECT_ROOT="$(git rev-parse --show-toplevel)"
+fi
+
+MODE="full"
+STRICT=false
+FILES=()
+
+[[ "$(basename "$0")" == "pre-commit" ]] && MODE="staged"
+
+while [[ $# -gt 0 ]]; do
+  case "$1" in
+    --changed) MODE="changed" ;;
+    --staged) MODE="staged" ;;
+    --strict) STRICT=true ;;
+    -h|--help)
+      sed -n '2,25p' "$0" | sed 's/^# \{0,1\}//'
+      exit 0
+      ;;
+    *) MODE="files"; FILES+=("$1") ;;
+  esac
+  shift
+done
+
+cd "$PROJECT_ROOT" || exit 1
+
+now_ms() {
+  local ns
+  ns=$(date +%s%N 2>/dev/null || true)
+  if [[ "$ns" =~ ^[0-9]+$ ]]; then
+    echo $((ns / 1000000))
+  else
+    echo $(($(date +%s) * 1000))
+  fi
+}
+
+START_MS=$(now_ms)
+WORK_DIR=$(mktemp -d)
+trap 'rm -rf "$WORK_DIR"' EXIT
+
+TARGETS="${WORK_DIR}/targets"
+NEW_FILES="${WORK_DIR}/new"
+: > "$NEW_FILES"
+
+in_scope() {
+  grep -E '^(specs|docs)/.*\.md$' || true
+}
+
+# ============================================================================
+# Target selection
+# ============================================================================
+
+case "$MODE" in
+  full)
+    find specs docs -name '*.md' -type f 2>/dev/null | LC_ALL=C sort > "$TARGETS"
+    ;;
+  files)
+    printf '%s\n' "${FILES[@]}" > "$TARGETS"
+    ;;
+  changed|staged)
+    if [[ "$MODE" == "staged" ]]; then
+      status=$(git diff --cached --name-status -M HEAD 2>/dev/null || git diff --cached --name-status)
+    else
+      status=$(git diff --name-status -M HEAD 2>/dev/null
+               git ls-files --others --exclude-standard | sed 's/^/A	/')
+    fi
+
+    # A/M/R rows are linted; A and R destinations count as new files
+    echo "$status" | awk -F'\t' '$1 ~ /^[AMR]/ { print $NF }' | in_scope | LC_ALL=C sort -u > "$TARGETS"
+    echo "$status" | awk -F'\t' '$1 ~ /^[AR]/ { print $NF }' | in_scope > "$NEW_FILES"
+
+    # Files that mention a deleted/renamed-away basename may now have broken links
+    gone=$(echo "$status" | awk -F'\t' '$1 ~ /^D/ { print $2 } $1 ~ /^R/ { print $2 }' | sed 's|.*/||' | sort -u)
+    if [[ -n "$gone" && "$MODE" == "staged" ]]; then
+      git grep --cached -lF -e "$gone" -- 'specs/*.md' 'docs/*.md' 2>/dev/null | in_scope >> "$TARGETS"
+      LC_ALL=C sort -u -o "$TARGETS" "$TARGETS"
+    elif [[ -n "$gone" ]]; then
+      grep -rlF --include='*.md' -e "$gone" specs docs 2>/dev/null | in_scope >> "$TARGETS"
+      LC_ALL=C sort -u -o "$TARGETS" "$TARGETS"
+    fi
+    ;;
+esac
+
+# Tree the checks read: the working tree, or a copy of the staged blobs
+LINT_ROOT="."
+if [[ "$MODE" == "staged" ]]; then
+  LINT_ROOT="${WORK_DIR}/index"
+  mkdir -p "$LINT_ROOT"
+  tr '\n' '\0' < "$TARGETS" | git checkout-index -z --stdin --prefix="${LINT_ROOT}/" 2>/dev/null || true
+fi
+
+# A link target exists in the tree being linted (index paths match directories too)
+link_exists() {
+  if [[ "$MODE" == "staged" ]]; then
+    git ls-files --error-unmatch -- "$1" &>/dev/null
+  else
+    [[ -e "$1" ]]
+  fi
+}
+
+# Drop paths that no longer exist (e.g. deleted in the working tree or index)
+while IFS= read -r f; do
+  [[ -f "${LINT_ROOT}/${f}" ]] && echo "$f"
+done < "$TARGETS" > "${TARGETS}.existing"
+mv "${TARGETS}.existing" "$TARGETS"
+
+FILE_COUNT=$(grep -c . "$TARGETS" || true)
+
+if [[ "$FILE_COUNT" -eq 0 ]]; then
+  echo -e "${GREEN}✓ Spec lint: no markdown files to check${NC}"
+  exit 0
+fi
+
+# ============================================================================
+# Single-pass checks
+# ============================================================================
+
+# Records on stdout:
+#   <error|warning>\t<file>\t<line>\t<rule>\t<message>
+#   LINK\t<file>\t<line>\t<resolved path>\t<raw target>
+tr '\n' '\0' < "$TARGETS" | (cd "$LINT_ROOT" && xargs -0 awk -v new_list="$NEW_FILES" '
+function report(sev, rule, msg, line) {
+  printf "%s\t%s\t%d\t%s\t%s\n", sev, FILENAME, (line ? line : FNR), rule, msg
+}
+
+function trim(s) { gsub(/^[ \t]+|[ \t]+$/, "", s); return s }
+
+function iso_date(s) { return s ~ /^[0-9][0-9][0-9][0-9]-[01][0-9]-[0-3][0-9]$/ }
+
+function normalize(p,    n, parts, out, i, k, abs) {
+  abs = (substr(p, 1, 1) == "/")
+  n = split(p, parts, "/")
+  k = 0
+  for (i = 1; i <= n; i++) {
+    if (parts[i] == "" || parts[i] == ".") continue
+    if (parts[i] == ".." && k > 0 && out[k] != "..") { k--; continue }
+    out[++k] = parts[i]
+  }
+  p = ""
+  for (i = 1; i <= k; i++) p = p (i > 1 ? "/" : "") out[i]
+  if (abs) return "/" p
+  return (p == "") ? "." : p
+}
+
+# Markdown links resolve against the file; frontmatter paths against the repo
+function link(target, line, from_root,    t) {
+  t = target
+  sub(/[ \t]+".*$/, "", t)
+  sub(/#.*$/, "", t)
+  if (t == "") return
+  if (t ~ /^\//) t = substr(t, 2)
+  else if (!from_root) t = dir "/" t
+  printf "LINK\t%s\t%d\t%s\t%s\n", FILENAME, line, normalize(t), target
+}
+
+# ---- end-of-file checks for the previous file ----
+function finish_file(    f, field) {
+  if (FILENAME_PREV == "") return
+  if (fm_open) report_at(FILENAME_PREV, fm_start, "error", "frontmatter", "frontmatter is not closed with ---")
+  finish_signoff()
+
+  if (has_header) {
+    for (f = 1; f <= 5; f++) {
+      field = header_fields[f]
+      if (!(field in header)) report_at(FILENAME_PREV, header_line, "error", "header", "header is missing \"" field ":\"")
+    }
+    if (("File" in header) && header["File"] != base)
+      report_at(FILENAME_PREV, header_line, "error", "header", "header File: \"" header["File"] "\" does not match filename \"" base "\"")
+    if (("Created" in header) && !iso_date(header["Created"]))
+      report_at(FILENAME_PREV, header_line, "error", "header", "Created: \"" header["Created"] "\" is not YYYY-MM-DD")
+    if (("Last Updated" in header) && !iso_date(header["Last Updated"]))
+      report_at(FILENAME_PREV, header_line, "error", "header", "Last Updated: \"" header["Last Updated"] "\" is not YYYY-MM-DD")
+    if (iso_date(header["Created"]) && iso_date(header["Last Updated"]) && header["Created"] > header["Last Updated"])
+      report_at(FILENAME_PREV, header_line, "error", "header", "Created is after Last Updated")
+  } else if (FILENAME_PREV in is_new) {
+    report_at(FILENAME_PREV, 1, "warning", "header", "new file has no header (see docs/standards/FILE_HEADER_STANDARDS.md)")
+  }
+}
+
+function report_at(file, line, sev, rule, msg) {
+  printf "%s\t%s\t%d\t%s\t%s\n", sev, file, line, rule, msg
+}
+
+function finish_signoff(    k) {
+  if (signoff == "") return
+  if (!signoff_null) {
+    if (!("agent" in sf)) report_at(FILENAME_PREV, signoff_line, "error", "frontmatter", signoff " is missing agent")
+    if (!("status" in sf)) report_at(FILENAME_PREV, signoff_line, "error", "frontmatter", signoff " is missing status")
+    if (!("date" in sf)) report_at(FILENAME_PREV, signoff_line, "error", "frontmatter", signoff " is missing date")
+  }
+  for (k in sf) delete sf[k]
+  signoff = ""
+}
+
+BEGIN {
+  while ((getline f < new_list) > 0) is_new[f] = 1
+  close(new_list)
+  header_fields[1] = "File"; header_fields[2] = "Description"; header_fields[3] = "Author/Agent"
+  header_fields[4] = "Created"; header_fields[5] = "Last Updated"
+  split("APPROVED APPROVED_WITH_CONCERNS CHANGES_REQUESTED BLOCKED NOT_FEASIBLE PENDING", st, " ")
+  for (i in st) valid_status[st[i]] = 1
+}
+
+FNR == 1 {
+  if (FILENAME_PREV != "") finish_file()
+  FILENAME_PREV = FILENAME
+
+  dir = FILENAME; if (!sub(/\/[^\/]*$/, "", dir)) dir = "."
+  base = FILENAME; sub(/^.*\//, "", base)
+  is_tasks = (base == "tasks.md")
+  fence = 0; fm_open = 0; fm_start = 0; fm_section = ""
+  has_header = 0; in_header = 0; header_line = 0
+  for (k in header) delete header[k]
+  for (k in task_seen) delete task_seen[k]
+  last_task = 0
+  signoff = ""
+
+  if ($0 ~ /^---[ \t]*$/) { fm_open = 1; fm_start = 1; next }
+}
+
+# ---- frontmatter ----
+fm_open && /^---[ \t]*$/ { finish_signoff(); fm_open = 0; next }
+fm_open {
+  line = $0
+  sub(/[ \t]+#.*$/, "", line)
+  if (line ~ /^[ \t]*$/ || line ~ /^[ \t]*#/) next
+
+  if (line ~ /^[A-Za-z_]+:/) {
+    finish_signoff()
+    key = line; sub(/:.*$/, "", key)
+    val = trim(substr(line, length(key) + 2))
+    fm_section = key
+    if (key == "prd_reference") {
+      if (val == "") report("error", "frontmatter", "prd_reference is empty")
+      else link(val, FNR, 1)
+    }
+    next
+  }
+
+  if (fm_section == "triad" && line ~ /^  [A-Za-z_]+:/) {
+    finish_signoff()
+    key = trim(line); sub(/:.*$/, "", key)
+    val = trim(substr(trim(line), length(key) + 2))
+    if (key !~ /^(pm|architect|techlead)_signoff$/) {
+      report("error", "frontmatter", "unknown triad key \"" key "\" (expected pm_signoff, architect_signoff, techlead_signoff)")
+      next
+    }
+    signoff = key; signoff_line = FNR
+    signoff_null = (val == "null" || val == "~")
+    next
+  }
+
+  if (line ~ /^    [A-Za-z_]+:/) {
+    key = trim(line); sub(/:.*$/, "", key)
+    val = trim(substr(trim(line), length(key) + 2))
+    if (val ~ /^".*"$/) val = substr(val, 2, length(val) - 2)
+
+    if (fm_section == "triad" && signoff != "") {
+      sf[key] = val
+      if (key == "status" && !(val in valid_status))
+        report("error", "frontmatter", signoff " status \"" val "\" is not one of APPROVED, APPROVED_WITH_CONCERNS, CHANGES_REQUESTED, BLOCKED, NOT_FEASIBLE, PENDING")
+      if (key == "date" && !iso_date(val))
+        report("error", "frontmatter", signoff " date \"" val "\" is not YYYY-MM-DD")
+    }
+    next
+  }
+
+  if (fm_section == "prd" && line ~ /^  [A-Za-z_]+:/) {
+    key = trim(line); sub(/:.*$/, "", key)
+    val = trim(substr(trim(line), length(key) + 2))
+    if (key == "number" && val !~ /^[0-9]+$/) report("error", "frontmatter", "prd.number \"" val "\" is not a number")
+    if (key == "created" && !iso_date(val)) report("error", "frontmatter", "prd.created \"" val "\" is not YYYY-MM-DD")
+    if (key == "topic" && val !~ /^[a-z0-9]+(-[a-z0-9]+)*$/) report("error", "frontmatter", "prd.topic \"" val "\" is not kebab-case")
+  }
+  next
+}
+
+# ---- file header (first HTML comment with File: fields) ----
+FNR <= 12 && !has_header && /^<!--[ \t]*$/ { in_header = 1; header_line = FNR; next }
+in_header {
+  if ($0 ~ /-->/) {
+    in_header = 0
+    if ("File" in header) has_header = 1
+    next
+  }
+  if (match($0, /^(File|Description|Author\/Agent|Created|Last Updated):/)) {
+    key = substr($0, 1, RLENGTH - 1)
+    header[key] = trim(substr($0, RLENGTH + 1))
+  }
+  next
+}
+
+# ---- code fences ----
+/^[ \t]*(```|~~~)/ { fence = !fence; next }
+fence { next }
+
+{
+  line = $0
+  gsub(/`[^`]*`/, "", line)
+
+  # ---- links ----
+  rest = line
+  while (match(rest, /\]\([^)]+\)/)) {
+    target = substr(rest, RSTART + 2, RLENGTH - 3)
+    rest = substr(rest, RSTART + RLENGTH)
+    if (target ~ /^[A-Za-z][A-Za-z0-9+.-]*:/ || target ~ /^#/ || target ~ /^</ || target ~ /[{}<>*]/) continue
+    link(target, FNR, 0)
+  }
+}
+
+# ---- tasks ----
+is_tasks && /^[ \t]*[-*] \[[ xX]\] T[0-9]/ {
+  item = $0
+  sub(/^[ \t]*[-*] \[[ xX]\] /, "", item)
+  id = item; sub(/[^A-Za-z0-9].*$/, "", id)
+
+  if (id !~ /^T[0-9][0-9][0-9]+$/) {
+    report("error", "task-id", "task ID \"" id "\" is not T followed by 3+ digits")
+  } else {
+    num = substr(id, 2) + 0
+    if (id in task_seen)
+      report("error", "task-id", id " is repeated (first on line " task_seen[id] ")")
+    else if (num != last_task + 1)
+      report("error", "task-id", id " follows " (last_task ? sprintf("T%03d", last_task) : "start of file") \
+        (num > last_task + 1 ? " (missing " sprintf("T%03d", last_task + 1) ")" : " (out of order)"))
+    if (!(id in task_seen)) task_seen[id] = FNR
+    if (num > last_task) last_task = num
+  }
+
+  # Tags: bracket tokens right after the ID, before the description
+  rest = substr(item, length(id) + 1)
+  for (k in tag_seen) delete tag_seen[k]
+  while (match(rest, /^[ \t]*\[[^\]]*\]/)) {
+    tag = substr(rest, RSTART, RLENGTH)
+    rest = substr(rest, RSTART + RLENGTH)
+    if (rest ~ /^\(/) break
+    sub(/^[ \t]*\[/, "", tag); sub(/\]$/, "", tag)
+    if (tag !~ /^(P|US[0-9]+)$/)
+      report("error", "task-tag", id " has malformed tag \"[" tag "]\" (expected [P] or [US<n>])")
+    else if (tag in tag_seen)
+      report("error", "task-tag", id " repeats tag [" tag "]")
+    tag_seen[tag] = 1
+  }
+  if (rest ~ /^[ \t]*\((P|US[0-9]+)\)/)
+    report("error", "task-tag", id " uses parentheses for a tag; use square brackets")
+}
+
+END { finish_file() }
+') > "${WORK_DIR}/records"
+
+# ============================================================================
+# Link resolution and report
+# ============================================================================
+
+ERRORS=0
+WARNINGS=0
+
+while IFS=$'\t' read -r kind file line rule message; do
+  if [[ "$kind" == "LINK" ]]; then
+    # rule = resolved path, message = raw target
+    link_exists "$rule" && continue
+    kind="error"
+    message="broken link \"${message}\" (${rule} not found)"
+    rule="link"
+  fi
+
+  if [[ "$kind" == "error" ]]; then
+    ERRORS=$((ERRORS + 1))
+    echo -e "${file}:${line}: ${RED}error${NC} [${rule}] ${message}"
+  else
+    WARNINGS=$((WARNINGS + 1))
+    echo -e "${file}:${line}: ${YELLOW}warning${NC} [${rule}] ${message}"
+  fi
+done < "${WORK_DIR}/records"
+
+ELAPSED=$(( $(now_ms) - START_MS ))
+SUMMARY="${FILE_COUNT} file(s) checked (${MODE}), ${ERRORS} error(s), ${WARNINGS} warning(s) in ${ELAPSED} ms"
+
+if [[ $ERRORS -gt 0 ]] || [[ "$STRICT" == "true" && $WARNINGS -gt 0 ]]; then
+  echo -e "${RED}✗ Spec lint: ${SUMMARY}${NC}"
+  exit 1
+fi
+
+echo -e "${GREEN}✓ Spec lint: ${SUMMARY}${NC}"
+exit 0
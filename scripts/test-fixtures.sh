@@ -0,0 +1,329 @@
+#!/bin/bash
+# scripts/test-fixtures.sh - Product-Led-Spec-Kit Test Fixture Runner
+#
+# Discovers every specs/*/test-fixtures/*-test.sh, runs them concurrently
+# with a bounded worker pool, and aggregates per-test results and timings.
+#
+# Passing results are cached under .claude/cache/test-fixtures/, keyed by a
+# checksum of the fixture, its spec directory, every ${PROJECT_ROOT}/... path
+# it references (files, or whole directories), and all shared code under
+# .claude/lib/ and scripts/ - libraries source each other, so any change
+# there invalidates every fixture. A fixture whose inputs are unchanged is
+# reported from cache instead of being re-run.
+#
+# Inputs a fixture reads some other way are declared in its header:
+#   # cache-inputs: README.md docs/product @tracked
+# Paths are relative to the project root; @tracked stands for every file
+# tracked by git (for fixtures that copy the tree), including uncommitted
+# edits.
+#
+# Usage:
+#   ./scripts/test-fixtures.sh [--jobs N] [--no-cache] [--junit FILE] [--json FILE] [PATTERN...]
+#
+# PATTERN filters fixtures by substring of their path (e.g. "scheduler").
+
+# Colors
+RED='\033[0;31m'
+GREEN='\033[0;32m'
+YELLOW='\033[1;33m'
+BLUE='\033[0;34m'
+NC='\033[0m' # No Color
+
+PROJECT_ROOT="$(cd "$(dirname "${BASH_SOURCE[0]}")/.." && pwd)"
+HELPERS_FILE="${PROJECT_ROOT}/.claude/lib/testing/fixture-helpers.sh"
+CACHE_DIR="${FIXTURE_CACHE_DIR:-${PROJECT_ROOT}/.claude/cache/test-fixtures}"
+
+cpu_count() {
+  getconf _NPROCESSORS_ONLN 2>/dev/null || sysctl -n hw.ncpu 2>/dev/null || echo 4
+}
+
+now_ms() {
+  local ns
+  ns=$(date +%s%N 2>/dev/null || true)
+  if [[ "$ns" =~ ^[0-9]+$ ]]; then
+    echo $((ns / 1000000))
+  else
+    echo $(($(date +%s) * 1000))
+  fi
+}
+
+# Checksum of everything a fixture depends on
+# Path + content stream of every file under the given paths (sorted)
+hash_paths() {
+  local path
+  for path in "$@"; do
+    path="${path%/}"
+    if [[ -e "$path" ]]; then
+      find "$path" -type f -not -path '*/.git/*' | LC_ALL=C sort | while read -r file; do
+        echo "file:${file#"${PROJECT_ROOT}/"}"
+        cat "$file"
+      done
+    else
+      echo "missing:${path#"${PROJECT_ROOT}/"}"
+    fi
+  done
+}
+
+# Content of every tracked file, from the index plus uncommitted edits
+hash_tracked_tree() {
+  if git -C "$PROJECT_ROOT" rev-parse --git-dir &>/dev/null; then
+    git -C "$PROJECT_ROOT" ls-files -s
+    git -C "$PROJECT_ROOT" diff --no-ext-diff --binary
+  else
+    echo "missing:@tracked"
+  fi
+}
+
+# Checksum of the shared code every fixture may load, computed once per run
+shared_code_key() {
+  hash_paths "${PROJECT_ROOT}/.claude/lib" "${PROJECT_ROOT}/scripts" | cksum | tr ' ' '-'
+}
+
+fixture_cache_key() {
+  local fixture="$1"
+  local path
+
+  {
+    echo "fixture:${fixture#"${PROJECT_ROOT}/"}"
+    echo "shared:${SHARED_KEY:-$(shared_code_key)}"
+
+    # The fixture's own spec directory (its contracts, plans, fixtures)
+    hash_paths "$(dirname "$(dirname "$fixture")")"
+
+    # Other paths the fixture references relative to the project root,
+    # written as ${PROJECT_ROOT}/... or "${PROJECT_ROOT}"/...
+    grep -oE '\$\{PROJECT_ROOT\}"?/[A-Za-z0-9_./*-]+' "$fixture" | sort -u |
+      while read -r path; do
+        path="${path#\$\{PROJECT_ROOT\}}"
+        path="${path#\"}"
+        path="${path%%\**}"
+        hash_paths "${PROJECT_ROOT}/${path#/}"
+      done
+
+    # Inputs declared with "# cache-inputs:"
+    sed -n 's/^# cache-inputs://p' "$fixture" | tr ' \t' '\n\n' | grep . |
+      while read -r path; do
+        if [[ "$path" == "@tracked" ]]; then
+          hash_tracked_tree
+        else
+          hash_paths "${PROJECT_ROOT}/${path#/}"
+        fi
+      done
+  } | cksum | tr ' ' '-'
+}
+
+# Run (or restore from cache) a single fixture into $RESULTS_DIR/<slug>/
+run_one() {
+  local fixture="$1"
+  local rel="${fixture#"${PROJECT_ROOT}/"}"
+  local slug out key started status
+
+  slug=$(echo "$rel" | tr '/' '_')
+  out="${RESULTS_DIR}/${slug}"
+  mkdir -p "$out"
+  echo "$rel" > "${out}/name"
+
+  key=$(fixture_cache_key "$fixture")
+
+  if [[ "$USE_CACHE" == "true" && -f "${CACHE_DIR}/${key}/status" ]]; then
+    cp "${CACHE_DIR}/${key}/"* "$out/"
+    echo "cached" > "${out}/source"
+    return 0
+  fi
+
+  : > "${out}/tests.tsv"
+  started=$(now_ms)
+  FIXTURE_RESULTS_FILE="${out}/tests.tsv" bash "$fixture" > "${out}/output" 2>&1
+  status=$?
+  echo $(( $(now_ms) - started )) > "${out}/duration"
+  echo "$status" > "${out}/status"
+  echo "run" > "${out}/source"
+
+  if [[ "$USE_CACHE" == "true" && $status -eq 0 ]]; then
+    mkdir -p "${CACHE_DIR}/${key}.tmp.$$"
+    cp "${out}/"{name,tests.tsv,output,duration,status} "${CACHE_DIR}/${key}.tmp.$$/"
+    rm -rf "${CACHE_DIR:?}/${key}"
+    mv "${CACHE_DIR}/${key}.tmp.$$" "${CACHE_DIR}/${key}"
+  fi
+}
+
+# Worker entry point used through xargs
+if [[ "${1:-}" == "--run-one" ]]; then
+  run_one "$2"
+  exit 0
+fi
+
+xml_escape() {
+  sed -e 's/&/\&amp;/g' -e 's/</\&lt;/g' -e 's/>/\&gt;/g' -e 's/"/\&quot;/g'
+}
+
+json_escape() {
+  sed -e 's/\\/\\\\/g' -e 's/"/\\"/g' -e 's/	/\\t/g'
+}
+
+write_junit() {
+  local file="$1"
+  local dir name status duration tests failures skipped
+
+  {
+    echo '<?xml version="1.0" encoding="UTF-8"?>'
+    echo "<testsuites name=\"test-fixtures\" tests=\"${TOTAL_TESTS}\" failures=\"${TOTAL_FAILED}\" time=\"$(awk -v ms="$WALL_MS" 'BEGIN { printf "%.3f", ms / 1000 }')\">"
+    for dir in "${RESULTS_DIR}"/*/; do
+      name=$(cat "${dir}name")
+      status=$(cat "${dir}status")
+      duration=$(cat "${dir}duration")
+      tests=$(grep -c . "${dir}tests.tsv")
+      failures=$(grep -c '^FAIL' "${dir}tests.tsv")
+      skipped=$(grep -c '^SKIP' "${dir}tests.tsv")
+      [[ $status -ne 0 && $failures -eq 0 ]] && { tests=$((tests + 1)); failures=1; }
+
+      echo "  <testsuite name=\"$(echo "$name" | xml_escape)\" tests=\"${tests}\" failures=\"${failures}\" skipped=\"${skipped}\" time=\"$(awk -v ms="$duration" 'BEGIN { printf "%.3f", ms / 1000 }')\">"
+      awk -F'\t' -v suite="$name" '
+        function esc(s) { gsub(/&/, "\\&amp;", s); gsub(/</, "\\&lt;", s); gsub(/>/, "\\&gt;", s); gsub(/"/, "\\&quot;", s); return s }
+        {
+          printf "    <testcase classname=\"%s\" name=\"%s\" time=\"%.3f\"", esc(suite "." $2), esc($3), $4 / 1000
+          if ($1 == "FAIL") printf ">\n      <failure message=\"%s\"/>\n    </testcase>\n", esc($5)
+          else if ($1 == "SKIP") printf ">\n      <skipped/>\n    </testcase>\n"
+          else printf "/>\n"
+        }
+      ' "${dir}tests.tsv"
+      if [[ $status -ne 0 && $(grep -c '^FAIL' "${dir}tests.tsv") -eq 0 ]]; then
+        echo "    <testcase classname=\"$(echo "$name" | xml_escape)\" name=\"exit status\" time=\"0.000\">"
+        echo "      <failure message=\"fixture exited with status ${status}\"><![CDATA[$(tail -20 "${dir}output" | sed 's/]]>/]]]]><![CDATA[>/g')]]></failure>"
+        echo "    </testcase>"
+      fi
+      echo "  </testsuite>"
+    done
+    echo "</testsuites>"
+  } > "$file"
+}
+
+write_json() {
+  local file="$1"
+  local dir first=true
+
+  {
+    echo "{"
+    echo "  \"summary\": {\"fixtures\": ${FIXTURE_COUNT}, \"failed_fixtures\": ${FAILED_FIXTURES}, \"cached\": ${CACHED_FIXTURES}, \"tests\": ${TOTAL_TESTS}, \"failed\": ${TOTAL_FAILED}, \"duration_ms\": ${WALL_MS}},"
+    echo "  \"fixtures\": ["
+    for dir in "${RESULTS_DIR}"/*/; do
+      $first || echo "    ,"
+      first=false
+      echo "    {\"name\": \"$(json_escape < "${dir}name")\", \"status\": \"$( [[ $(cat "${dir}status") -eq 0 ]] && echo passed || echo failed)\", \"exit_code\": $(cat "${dir}status"), \"cached\": $( [[ $(cat "${dir}source") == cached ]] && echo true || echo false), \"duration_ms\": $(cat "${dir}duration"),"
+      echo "     \"tests\": ["
+      json_escape < "${dir}tests.tsv" | awk -F'\\\\t' '
+        {
+          printf "%s      {\"status\": \"%s\", \"section\": \"%s\", \"name\": \"%s\", \"duration_ms\": %d, \"message\": \"%s\"}", (NR > 1 ? ",\n" : ""), $1, $2, $3, $4, $5
+        }
+        END { if (NR > 0) printf "\n" }
+      '
+      echo "     ]}"
+    done
+    echo "  ]"
+    echo "}"
+  } > "$file"
+}
+
+# ============================================================================
+# Main
+# ============================================================================
+
+JOBS=""
+USE_CACHE=true
+JUNIT_FILE=""
+JSON_FILE=""
+PATTERNS=()
+
+while [[ $# -gt 0 ]]; do
+  case "$1" in
+    --jobs) JOBS="$2"; shift ;;
+    --no-cache) USE_CACHE=false ;;
+    --junit) JUNIT_FILE="$2"; shift ;;
+    --json) JSON_FILE="$2"; shift ;;
+    -h|--help)
+      echo "Usage: $0 [--jobs N] [--no-cache] [--junit FILE] [--json FILE] [PATTERN...]"
+      exit 0
+      ;;
+    *) PATTERNS+=("$1") ;;
+  esac
+  shift
+done
+
+echo -e "${BLUE}🧪 Running test fixtures${NC}"
+echo ""
+
+FIXTURES=()
+for fixture in "${PROJECT_ROOT}"/specs/*/test-fixtures/*-test.sh; do
+  [[ -f "$fixture" ]] || continue
+  if [[ ${#PATTERNS[@]} -gt 0 ]]; then
+    matched=false
+    for pattern in "${PATTERNS[@]}"; do
+      [[ "$fixture" == *"$pattern"* ]] && matched=true
+    done
+    $matched || continue
+  fi
+  FIXTURES+=("$fixture")
+done
+
+if [[ ${#FIXTURES[@]} -eq 0 ]]; then
+  echo -e "${YELLOW}⚠ No test fixtures found${NC}"
+  exit 0
+fi
+
+RESULTS_DIR=$(mktemp -d)
+trap 'rm -rf "$RESULTS_DIR"' EXIT
+SHARED_KEY=$(shared_code_key)
+export RESULTS_DIR USE_CACHE CACHE_DIR SHARED_KEY
+
+STARTED=$(now_ms)
+printf '%s\0' "${FIXTURES[@]}" | xargs -0 -n 1 -P "${JOBS:-$(cpu_count)}" "$0" --run-one
+WALL_MS=$(( $(now_ms) - STARTED ))
+
+FIXTURE_COUNT=0
+FAILED_FIXTURES=0
+CACHED_FIXTURES=0
+TOTAL_TESTS=0
+TOTAL_FAILED=0
+
+for dir in "${RESULTS_DIR}"/*/; do
+  name=$(cat "${dir}name")
+  status=$(cat "${dir}status")
+  duration=$(cat "${dir}duration")
+  source=$(cat "${dir}source")
+  tests=$(grep -c '^PASS\|^FAIL' "${dir}tests.tsv")
+  failed=$(grep -c '^FAIL' "${dir}tests.tsv")
+
+  FIXTURE_COUNT=$((FIXTURE_COUNT + 1))
+  TOTAL_TESTS=$((TOTAL_TESTS + tests))
+  TOTAL_FAILED=$((TOTAL_FAILED + failed))
+  [[ "$source" == "cached" ]] && CACHED_FIXTURES=$((CACHED_FIXTURES + 1))
+
+  label="${duration} ms"
+  [[ "$source" == "cached" ]] && label="cached"
+
+  if [[ $status -eq 0 ]]; then
+    echo -e "${GREEN}✓ ${name}${NC} (${tests} tests, ${label})"
+  else
+    FAILED_FIXTURES=$((FAILED_FIXTURES + 1))
+    echo -e "${RED}✗ ${name}${NC} (${failed}/${tests} failed, exit ${status}, ${label})"
+    grep -E '❌ FAIL|Reason:' "${dir}output" | head -20 | sed 's/^/    /'
+    if [[ $failed -eq 0 ]]; then
+      tail -5 "${dir}output" | sed 's/^/    /'
+    fi
+  fi
+done
+
+[[ -n "$JUNIT_FILE" ]] && write_junit "$JUNIT_FILE"
+[[ -n "$JSON_FILE" ]] && write_json "$JSON_FILE"
+
+echo ""
+echo "  Fixtures: ${FIXTURE_COUNT} (${CACHED_FIXTURES} cached)  Tests: ${TOTAL_TESTS}  Failed: ${TOTAL_FAILED}  Wall clock: ${WALL_MS} ms"
+echo ""
+
+if [[ $FAILED_FIXTURES -eq 0 ]]; then
+  echo -e "${GREEN}🎉 All fixtures passed!${NC}"
+  exit 0
+else
+  echo -e "${RED}⚠ ${FAILED_FIXTURES} fixture(s) failed.${NC}"
+  exit 1
+fi
@@ -0,0 +1,199 @@
+#!/usr/bin/env bash
+# @-reference Import Resolver Validation Test
+# Feature: 001-claude-code-memory
+# Created: 2026-10-18
+#
+# Tests resolve-imports.sh against the @-reference validation rules in
+# data-model.md: missing files, circular references, 5-hop depth limit,
+# code-block exclusion, and per-file line/token budgets.
+
+set -euo pipefail
+
+# Test configuration
+readonly TEST_NAME="Import Resolver"
+readonly SCRIPT_DIR="$(cd "$(dirname "${BASH_SOURCE[0]}")" && pwd)"
+readonly PROJECT_ROOT="${SCRIPT_DIR}/../../.."
+readonly RESOLVER="${PROJECT_ROOT}/.claude/lib/memory/resolve-imports.sh"
+
+# Shared pass/fail/skip/section helpers
+source "${PROJECT_ROOT}/.claude/lib/testing/fixture-helpers.sh"
+
+readonly WORK_DIR="$(mktemp -d)"
+trap 'rm -rf "$WORK_DIR"' EXIT
+
+# Modular CLAUDE.md layout with one cycle, one missing file and ignored refs
+create_rules_tree() {
+    local dir="${WORK_DIR}/project"
+    mkdir -p "${dir}/.claude/rules/sub"
+
+    cat > "${dir}/CLAUDE.md" <<'EOF'
+# CLAUDE.md
+
+## Core Constraints
+See @.claude/rules/governance.md for details.
+
+## Scope Boundaries
+@.claude/rules/scope.md
+
+Ask @architect for review. Inline `@.claude/rules/inline.md` is ignored.
+Install with npm i -g @anthropic-ai/claude-code and add @types/node.
+
+```markdown
+@.claude/rules/fenced.md
+```
+
+@.claude/rules/missing.md
+EOF
+
+    printf '# Governance\n\n@sub/details.md\n@.claude/rules/scope.md\n' > "${dir}/.claude/rules/governance.md"
+    printf '# Details\nnested rule\n' > "${dir}/.claude/rules/sub/details.md"
+    printf '# Scope\n@CLAUDE.md\n' > "${dir}/.claude/rules/scope.md"
+
+    echo "$dir"
+}
+
+# A.md -> B.md -> ... -> G.md (6 hops)
+create_deep_chain() {
+    local dir="${WORK_DIR}/chain" letters="A B C D E F G" prev=""
+    mkdir -p "$dir"
+
+    for letter in $letters; do
+        echo "# ${letter}" > "${dir}/${letter}.md"
+        [[ -n "$prev" ]] && echo "@${letter}.md" >> "${dir}/${prev}.md"
+        prev="$letter"
+    done
+
+    echo "$dir"
+}
+
+# ============================================================================
+# Script File Tests
+# ============================================================================
+
+test_resolver_exists() {
+    if [[ -f "$RESOLVER" ]] && bash -n "$RESOLVER" 2>/dev/null; then
+        pass "resolve-imports.sh exists with valid syntax"
+    else
+        fail "resolve-imports.sh exists with valid syntax" "Missing or syntax errors"
+    fi
+}
+
+# ============================================================================
+# Traversal Tests
+# ============================================================================
+
+test_resolution() {
+    local dir records
+    dir=$(create_rules_tree)
+    records=$(cd "$dir" && "$RESOLVER" tsv CLAUDE.md || true)
+
+    if echo "$records" | grep -q "^OK	2	.claude/rules/sub/details.md	.claude/rules/governance.md	"; then
+        pass "Relative reference resolved against importing file"
+    else
+        fail "Importer-relative resolution" "Got: $records"
+    fi
+
+    if echo "$records" | grep -q "^OK	2	.claude/rules/scope.md	" && echo "$records" | grep -q "^SEEN	1	.claude/rules/scope.md	"; then
+        pass "Shared import loaded once"
+    else
+        fail "Shared import" "Got: $records"
+    fi
+
+    if echo "$records" | grep -qE "inline|fenced|architect"; then
+        fail "Code and mentions ignored" "Got: $records"
+    else
+        pass "References in code blocks, inline code and @mentions ignored"
+    fi
+
+    if echo "$records" | grep -qE "anthropic-ai|types/node"; then
+        fail "npm scopes ignored" "Got: $records"
+    else
+        pass "Non-markdown @scope/package prose is not an import"
+    fi
+}
+
+test_errors() {
+    local dir records
+    dir=$(create_rules_tree)
+
+    if records=$(cd "$dir" && "$RESOLVER" tsv CLAUDE.md); then
+        fail "Exit status on errors" "Expected non-zero exit"
+    else
+        pass "Non-zero exit when errors found"
+    fi
+
+    if echo "$records" | grep -q "^CIRCULAR	3	CLAUDE.md	.*CLAUDE.md -> .claude/rules/governance.md -> .claude/rules/scope.md -> CLAUDE.md$"; then
+        pass "Circular reference reported with import chain"
+    else
+        fail "Circular reference" "Got: $(echo "$records" | grep CIRCULAR)"
+    fi
+
+    if echo "$records" | grep -q "^MISSING	1	.claude/rules/missing.md	"; then
+        pass "Missing file reported"
+    else
+        fail "Missing file" "Got: $(echo "$records" | grep MISSING)"
+    fi
+}
+
+test_max_depth() {
+    local dir records
+    dir=$(create_deep_chain)
+    records=$(cd "$dir" && "$RESOLVER" tsv A.md || true)
+
+    if echo "$records" | grep -q "^OK	5	F.md	" && echo "$records" | grep -q "^MAX_DEPTH	6	G.md	"; then
+        pass "Sixth hop reported as MAX_DEPTH"
+    else
+        fail "Max depth" "Got: $records"
+    fi
+
+    if (cd "$dir" && "$RESOLVER" --max-depth 6 tsv A.md >/dev/null); then
+        pass "--max-depth raises the limit"
+    else
+        fail "--max-depth" "Chain of 6 hops should pass with --max-depth 6"
+    fi
+}
+
+# ============================================================================
+# Budget Tests
+# ============================================================================
+
+test_budget_report() {
+    local dir report
+    dir=$(create_rules_tree)
+    report=$(cd "$dir" && "$RESOLVER" report CLAUDE.md || true)
+
+    # governance (4 lines) + details (2) + scope (2) = 8 lines including imports
+    if echo "$report" | grep -qE "^  \.claude/rules/governance\.md +1 +4 +[0-9]+ +8 "; then
+        pass "Report rolls imported lines into the importing file"
+    else
+        fail "Budget roll-up" "Got: $report"
+    fi
+}
+
+# ============================================================================
+# Main Test Runner
+# ============================================================================
+
+main() {
+    echo "========================================"
+    echo "  ${TEST_NAME} Integration Tests"
+    echo "========================================"
+    echo "Project Root: ${PROJECT_ROOT}"
+    echo ""
+
+    section "Script File Tests"
+    test_resolver_exists
+
+    section "Traversal Tests"
+    test_resolution
+    test_errors
+    test_max_depth
+
+    section "Budget Tests"
+    test_budget_report
+
+    fixture_summary
+}
+
+# Run tests
+main "$@"
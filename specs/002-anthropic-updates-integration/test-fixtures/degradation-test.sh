@@ -14,37 +14,8 @@ readonly PROJECT_ROOT="${SCRIPT_DIR}/../../.."
 readonly VERSION_LIB="${PROJECT_ROOT}/.claude/lib/version"
 readonly COMMANDS_DIR="${PROJECT_ROOT}/.claude/commands"
 
-# Test counters
-TESTS_RUN=0
-TESTS_PASSED=0
-TESTS_FAILED=0
-
-# ============================================================================
-# Test Utilities
-# ============================================================================
-
-pass() {
-    local test_name="$1"
-    ((TESTS_PASSED++))
-    ((TESTS_RUN++))
-    echo "  ✅ PASS: $test_name"
-}
-
-fail() {
-    local test_name="$1"
-    local message="${2:-}"
-    ((TESTS_FAILED++))
-    ((TESTS_RUN++))
-    echo "  ❌ FAIL: $test_name"
-    if [[ -n "$message" ]]; then
-        echo "     Reason: $message"
-    fi
-}
-
-section() {
-    echo ""
-    echo "=== $1 ==="
-}
+# Shared pass/fail/skip/section helpers
+source "${PROJECT_ROOT}/.claude/lib/testing/fixture-helpers.sh"
 
 # ============================================================================
 # Triad Init Tests
@@ -286,23 +257,7 @@ main() {
     test_version_flow_integration
     test_graceful_degradation_path
 
-    # Summary
-    echo ""
-    echo "========================================"
-    echo "  Test Summary"
-    echo "========================================"
-    echo "  Tests Run:    ${TESTS_RUN}"
-    echo "  Tests Passed: ${TESTS_PASSED}"
-    echo "  Tests Failed: ${TESTS_FAILED}"
-    echo ""
-
-    if [[ ${TESTS_FAILED} -eq 0 ]]; then
-        echo "✅ All tests passed!"
-        exit 0
-    else
-        echo "❌ Some tests failed!"
-        exit 1
-    fi
+    fixture_summary
 }
 
 # Run tests
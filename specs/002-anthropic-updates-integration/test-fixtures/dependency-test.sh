@@ -14,37 +14,8 @@ readonly PROJECT_ROOT="${SCRIPT_DIR}/../../.."
 readonly LIB_DIR="${PROJECT_ROOT}/.claude/lib/dependencies"
 readonly TASKS_FILE="${PROJECT_ROOT}/specs/002-anthropic-updates-integration/tasks.md"
 
-# Test counters
-TESTS_RUN=0
-TESTS_PASSED=0
-TESTS_FAILED=0
-
-# ============================================================================
-# Test Utilities
-# ============================================================================
-
-pass() {
-    local test_name="$1"
-    ((TESTS_PASSED++))
-    ((TESTS_RUN++))
-    echo "  ✅ PASS: $test_name"
-}
-
-fail() {
-    local test_name="$1"
-    local message="${2:-}"
-    ((TESTS_FAILED++))
-    ((TESTS_RUN++))
-    echo "  ❌ FAIL: $test_name"
-    if [[ -n "$message" ]]; then
-        echo "     Reason: $message"
-    fi
-}
-
-section() {
-    echo ""
-    echo "=== $1 ==="
-}
+# Shared pass/fail/skip/section helpers
+source "${PROJECT_ROOT}/.claude/lib/testing/fixture-helpers.sh"
 
 # Create a temporary test tasks file
 create_test_tasks_file() {
@@ -395,7 +366,7 @@ test_generate_update_summary() {
 
 test_real_tasks_file() {
     if [[ ! -f "$TASKS_FILE" ]]; then
-        echo "  ⏭️ SKIP: Real tasks file not found"
+        skip "Real tasks file not found"
         return
     fi
 
@@ -451,23 +422,7 @@ main() {
     section "Integration Tests"
     test_real_tasks_file
 
-    # Summary
-    echo ""
-    echo "========================================"
-    echo "  Test Summary"
-    echo "========================================"
-    echo "  Tests Run:    ${TESTS_RUN}"
-    echo "  Tests Passed: ${TESTS_PASSED}"
-    echo "  Tests Failed: ${TESTS_FAILED}"
-    echo ""
-
-    if [[ ${TESTS_FAILED} -eq 0 ]]; then
-        echo "✅ All tests passed!"
-        exit 0
-    else
-        echo "❌ Some tests failed!"
-        exit 1
-    fi
+    fixture_summary
 }
 
 # Run tests
@@ -0,0 +1,144 @@
+#!/usr/bin/env bash
+# Fixture Runner Cache Validation Test
+# Feature: 002-anthropic-updates-integration
+# Created: 2026-10-18
+#
+# Tests that scripts/test-fixtures.sh reuses cached results only while
+# everything a fixture depends on is unchanged, including libraries that
+# its libraries source, paths written as "${PROJECT_ROOT}"/... globs and
+# inputs declared in a "# cache-inputs:" header.
+
+set -euo pipefail
+
+# Test configuration
+readonly TEST_NAME="Fixture Runner Cache"
+readonly SCRIPT_DIR="$(cd "$(dirname "${BASH_SOURCE[0]}")" && pwd)"
+readonly PROJECT_ROOT="${SCRIPT_DIR}/../../.."
+readonly RUNNER="${PROJECT_ROOT}/scripts/test-fixtures.sh"
+
+# Shared pass/fail/skip/section helpers
+source "${PROJECT_ROOT}/.claude/lib/testing/fixture-helpers.sh"
+
+readonly WORK_DIR="$(mktemp -d)"
+trap 'rm -rf "$WORK_DIR"' EXIT
+
+# Scratch git repo: one fixture -> lib a.sh -> lib b.sh (transitive source),
+# declaring docs/notes.md (untracked) and the tracked tree as extra inputs
+create_tree() {
+    local root="${WORK_DIR}/repo"
+    mkdir -p "${root}/scripts" "${root}/.claude/lib/testing" "${root}/.claude/lib/demo" \
+        "${root}/specs/900-demo/test-fixtures" "${root}/specs/901-other"
+
+    cp "$RUNNER" "${root}/scripts/"
+    cp "${PROJECT_ROOT}/.claude/lib/testing/fixture-helpers.sh" "${root}/.claude/lib/testing/"
+
+    printf '#!/usr/bin/env bash\nsource "$(dirname "${BASH_SOURCE[0]}")/b.sh"\n' > "${root}/.claude/lib/demo/a.sh"
+    printf '#!/usr/bin/env bash\ndemo_value() { echo ok; }\n' > "${root}/.claude/lib/demo/b.sh"
+    echo "- [ ] T001 Task" > "${root}/specs/901-other/tasks.md"
+    echo "# Plan" > "${root}/specs/900-demo/plan.md"
+
+    cat > "${root}/specs/900-demo/test-fixtures/demo-test.sh" <<'EOF'
+#!/usr/bin/env bash
+# cache-inputs: docs/notes.md @tracked
+set -euo pipefail
+readonly PROJECT_ROOT="$(cd "$(dirname "${BASH_SOURCE[0]}")/../../.." && pwd)"
+source "${PROJECT_ROOT}/.claude/lib/testing/fixture-helpers.sh"
+source "${PROJECT_ROOT}/.claude/lib/demo/a.sh"
+if [[ "$(demo_value)" == "ok" ]] && grep -q T001 "${PROJECT_ROOT}"/specs/*/tasks.md; then
+    pass "demo"
+else
+    fail "demo" "unexpected"
+fi
+fixture_summary
+EOF
+    chmod +x "${root}/scripts/test-fixtures.sh" "${root}/specs/900-demo/test-fixtures/demo-test.sh"
+
+    echo "# Demo" > "${root}/README.md"
+    (cd "$root" && git init -q && git add -A \
+        && git -c user.name=test -c user.email=test@example.com commit -qm init)
+    mkdir -p "${root}/docs"
+    echo "Notes" > "${root}/docs/notes.md"
+    echo "$root"
+}
+
+run_runner() {
+    FIXTURE_CACHE_DIR="${WORK_DIR}/cache" "${ROOT}/scripts/test-fixtures.sh" "$@" 2>&1 | sed 's/\x1b\[[0-9;]*m//g'
+}
+
+# Asserts whether the next run restores the fixture from cache
+expect_run() {
+    local description="$1" expected="$2" output
+    output=$(run_runner || true)
+
+    if echo "$output" | grep -q "Fixtures: 1 (${expected} cached)"; then
+        pass "$description"
+    else
+        fail "$description" "Expected ${expected} cached, got: $(echo "$output" | grep 'Fixtures:')"
+    fi
+}
+
+# ============================================================================
+# Cache Key Tests
+# ============================================================================
+
+test_runner_exists() {
+    if [[ -x "$RUNNER" ]] && bash -n "$RUNNER" 2>/dev/null; then
+        pass "test-fixtures.sh exists with valid syntax"
+    else
+        fail "test-fixtures.sh exists with valid syntax" "Missing, not executable, or syntax errors"
+    fi
+}
+
+test_cache_invalidation() {
+    expect_run "First run executes the fixture" 0
+    expect_run "Unchanged inputs are restored from cache" 1
+
+    echo "# comment" >> "${ROOT}/.claude/lib/demo/b.sh"
+    expect_run "Change in a transitively sourced library re-runs" 0
+
+    echo "- [ ] T002 Task" >> "${ROOT}/specs/901-other/tasks.md"
+    expect_run "Change matched by a \"\${PROJECT_ROOT}\"/specs/* glob re-runs" 0
+
+    echo "More plan" >> "${ROOT}/specs/900-demo/plan.md"
+    expect_run "Change in the fixture's spec directory re-runs" 0
+
+    echo "More notes" >> "${ROOT}/docs/notes.md"
+    expect_run "Change in a declared cache input re-runs" 0
+
+    echo "More readme" >> "${ROOT}/README.md"
+    expect_run "Uncommitted change in the tracked tree (@tracked) re-runs" 0
+
+    echo "exit 3" >> "${ROOT}/.claude/lib/demo/b.sh"
+    local output
+    output=$(run_runner || true)
+    if echo "$output" | grep -q "Failed:" && echo "$output" | grep -q "fixture(s) failed"; then
+        pass "Broken dependency is reported, not served from cache"
+    else
+        fail "Broken dependency" "Got: $output"
+    fi
+}
+
+# ============================================================================
+# Main Test Runner
+# ============================================================================
+
+main() {
+    echo "========================================"
+    echo "  ${TEST_NAME} Integration Tests"
+    echo "========================================"
+    echo "Project Root: ${PROJECT_ROOT}"
+    echo ""
+
+    ROOT=$(create_tree)
+
+    section "Script File Tests"
+    test_runner_exists
+
+    section "Cache Key Tests"
+    test_cache_invalidation
+
+    fixture_summary
+}
+
+# Run tests
+main "$@"
@@ -0,0 +1,214 @@
+#!/usr/bin/env bash
+# Project Initialization Validation Test
+# Feature: 002-anthropic-updates-integration
+# Created: 2026-10-18
+#
+# Tests that scripts/init.sh --config rewrites only the files holding
+# placeholders, substitutes values literally, resumes an interrupted run
+# from its manifest and refuses to resume with different values.
+#
+# cache-inputs: @tracked
+
+set -euo pipefail
+
+# Test configuration
+readonly TEST_NAME="Project Initialization"
+readonly SCRIPT_DIR="$(cd "$(dirname "${BASH_SOURCE[0]}")" && pwd)"
+readonly PROJECT_ROOT="${SCRIPT_DIR}/../../.."
+readonly INIT_SCRIPT="${PROJECT_ROOT}/scripts/init.sh"
+readonly PLACEHOLDER_PATTERN='\{\{(PROJECT_NAME|PROJECT_DESCRIPTION|GITHUB_ORG|GITHUB_REPO|AI_AGENT|TECH_STACK|CLOUD_PROVIDER)\}\}'
+
+# Shared pass/fail/skip/section helpers
+source "${PROJECT_ROOT}/.claude/lib/testing/fixture-helpers.sh"
+
+readonly WORK_DIR="$(mktemp -d)"
+trap 'rm -rf "$WORK_DIR"' EXIT
+
+# Values with every character that is special on the sed replacement side
+readonly NAME_VALUE='acme & co | labs/x'
+readonly DESCRIPTION_VALUE='a/b path, back\slash, pipe | and \1 & more'
+
+# Temp copy of the tracked tree (working-copy contents)
+copy_tree() {
+    local dest="${WORK_DIR}/$1"
+    mkdir -p "$dest"
+    (cd "$PROJECT_ROOT" && git ls-files -z | tar --null -T - -cf -) | tar -xf - -C "$dest"
+    cp "$INIT_SCRIPT" "${dest}/scripts/init.sh"
+    echo "$dest"
+}
+
+write_config() {
+    local file="$1" name="$2"
+    cat > "$file" <<EOF
+# init.conf
+PROJECT_NAME=${name}
+PROJECT_DESCRIPTION="${DESCRIPTION_VALUE}"
+AI_AGENT=claude
+EOF
+}
+
+# "<inode> <cksum> <path>" for every file, sorted by path
+snapshot() {
+    (cd "$1" && find . -type f ! -path './.specify/init/*' -print |
+        while IFS= read -r file; do
+            printf '%s %s %s\n' "$(ls -i "$file" | awk '{print $1}')" "$(cksum < "$file" | awk '{print $1}')" "$file"
+        done | LC_ALL=C sort -k3)
+}
+
+run_init() {
+    local root="$1"
+    shift
+    (cd "$root" && ./scripts/init.sh --config "${WORK_DIR}/init.conf" --jobs 2 "$@" 2>&1)
+}
+
+# ============================================================================
+# Script File Tests
+# ============================================================================
+
+test_init_exists() {
+    if [[ -x "$INIT_SCRIPT" ]] && bash -n "$INIT_SCRIPT" 2>/dev/null; then
+        pass "init.sh exists with valid syntax"
+    else
+        fail "init.sh exists with valid syntax" "Missing, not executable, or syntax errors"
+    fi
+}
+
+# ============================================================================
+# Substitution Tests
+# ============================================================================
+
+test_full_run() {
+    local root expected changed before after output rc=0
+    root=$(copy_tree full)
+    write_config "${WORK_DIR}/init.conf" "$NAME_VALUE"
+
+    expected=$(cd "$root" && grep -rlIE "$PLACEHOLDER_PATTERN" . | grep -v '^\./scripts/init\.sh$' | LC_ALL=C sort)
+    before=$(snapshot "$root")
+    output=$(run_init "$root") || rc=$?
+    after=$(snapshot "$root")
+
+    if [[ $rc -eq 0 ]] && [[ ! -e "${root}/scripts/init.sh" ]] && [[ ! -e "${root}/.specify/init" ]]; then
+        pass "init.sh --config completes and removes itself and its state"
+    else
+        fail "Full run" "rc=$rc, got: $output"
+        return
+    fi
+
+    # Files whose inode or checksum changed (init.sh itself is removed)
+    changed=$(LC_ALL=C join -1 3 -2 3 <(echo "$before") <(echo "$after") |
+        awk '$2 != $4 || $3 != $5 { print $1 }' | LC_ALL=C sort)
+    if [[ -n "$expected" && "$changed" == "$expected" ]]; then
+        pass "Only the $(echo "$expected" | wc -l | tr -d ' ') files with placeholders are rewritten"
+    else
+        fail "Only placeholder files change" "Unexpected: $(comm -3 <(echo "$expected") <(echo "$changed") | tr '\n' ' ')"
+    fi
+
+    if ! (cd "$root" && grep -rqIE "$PLACEHOLDER_PATTERN" .); then
+        pass "No placeholders left in the tree"
+    else
+        fail "Placeholders left" "$(cd "$root" && grep -rlIE "$PLACEHOLDER_PATTERN" . | head -3)"
+    fi
+
+    if grep -qF "$DESCRIPTION_VALUE" "${root}/README.md" \
+        && grep -qxF "# Product Vision - ${NAME_VALUE}" "${root}/docs/product/01_Product_Vision/README.md"; then
+        pass "Values with &, /, \\ and | are substituted literally"
+    else
+        fail "Literal substitution" "README.md: $(grep -n 'a/b path' "${root}/README.md" | head -1)"
+    fi
+}
+
+# ============================================================================
+# Resume Tests
+# ============================================================================
+
+# Interrupts a run by failing the atomic mv for one file
+test_resume() {
+    local root real_mv output rc=0 before after stuck="README.md"
+    root=$(copy_tree resume)
+    write_config "${WORK_DIR}/init.conf" "$NAME_VALUE"
+    real_mv=$(command -v mv)
+
+    mkdir -p "${WORK_DIR}/bin"
+    cat > "${WORK_DIR}/bin/mv" <<EOF
+#!/usr/bin/env bash
+for target; do :; done
+case "\$target" in ./${stuck}) echo "mv: simulated failure" >&2; exit 1 ;; esac
+exec "${real_mv}" "\$@"
+EOF
+    chmod +x "${WORK_DIR}/bin/mv"
+
+    output=$(PATH="${WORK_DIR}/bin:${PATH}" run_init "$root") || rc=$?
+    if [[ $rc -eq 1 ]] && echo "$output" | grep -q "Failed to rewrite: ./${stuck}" \
+        && [[ -s "${root}/.specify/init/manifest" ]] && [[ -x "${root}/scripts/init.sh" ]] \
+        && grep -q '{{PROJECT_NAME}}' "${root}/${stuck}"; then
+        pass "Interrupted run keeps its state and a partial manifest"
+    else
+        fail "Interrupted run" "rc=$rc, got: $output"
+        return
+    fi
+
+    # Different values against the leftover state
+    write_config "${WORK_DIR}/init.conf" "other name"
+    before=$(snapshot "$root")
+    rc=0
+    output=$(run_init "$root") || rc=$?
+    if [[ $rc -eq 1 ]] && echo "$output" | grep -q "different values is incomplete" \
+        && [[ "$(snapshot "$root")" == "$before" ]]; then
+        pass "Resume with different values is refused without touching files"
+    else
+        fail "Refused resume" "rc=$rc, got: $output"
+    fi
+
+    write_config "${WORK_DIR}/init.conf" "$NAME_VALUE"
+    rc=0
+    output=$(run_init "$root") || rc=$?
+    after=$(snapshot "$root")
+    if [[ $rc -eq 0 ]] && echo "$output" | grep -q "Resuming previous initialization" \
+        && echo "$output" | grep -q "(1 pending)"; then
+        pass "Same values resume with only the unfinished file pending"
+    else
+        fail "Resume" "rc=$rc, got: $output"
+        return
+    fi
+
+    # Everything but the stuck file (and the removed init.sh) is untouched
+    if [[ "$(echo "$after" | grep -v " \./${stuck}$")" == "$(echo "$before" | grep -v -e " \./${stuck}$" -e " \./scripts/init\.sh$")" ]] \
+        && grep -qF "$DESCRIPTION_VALUE" "${root}/${stuck}" \
+        && ! grep -qE "$PLACEHOLDER_PATTERN" "${root}/${stuck}"; then
+        pass "Resume rewrites only the unfinished file"
+    else
+        fail "Resume rewrites" "$(diff <(echo "$before") <(echo "$after") | head -5)"
+    fi
+}
+
+# ============================================================================
+# Main Test Runner
+# ============================================================================
+
+main() {
+    echo "========================================"
+    echo "  ${TEST_NAME} Integration Tests"
+    echo "========================================"
+    echo "Project Root: ${PROJECT_ROOT}"
+    echo ""
+
+    section "Script File Tests"
+    test_init_exists
+
+    if ! command -v node >/dev/null 2>&1 || ! git -C "$PROJECT_ROOT" rev-parse --git-dir >/dev/null 2>&1; then
+        skip "Substitution and resume tests (node or a git checkout not available)"
+        fixture_summary
+        return
+    fi
+
+    section "Substitution Tests"
+    test_full_run
+
+    section "Resume Tests"
+    test_resume
+
+    fixture_summary
+}
+
+# Run tests
+main "$@"
@@ -0,0 +1,224 @@
+#!/usr/bin/env bash
+# Cached Version Detection Validation Test
+# Feature: 002-anthropic-updates-integration
+# Created: 2026-10-18
+#
+# Tests that probe-cache.sh runs each tool's --version at most once,
+# invalidates on binary change, and derives FeatureFlags per the contract.
+
+set -euo pipefail
+
+# Test configuration
+readonly TEST_NAME="Version Probe Cache"
+readonly SCRIPT_DIR="$(cd "$(dirname "${BASH_SOURCE[0]}")" && pwd)"
+readonly PROJECT_ROOT="${SCRIPT_DIR}/../../.."
+readonly LIB_DIR="${PROJECT_ROOT}/.claude/lib/version"
+
+# Shared pass/fail/skip/section helpers
+source "${PROJECT_ROOT}/.claude/lib/testing/fixture-helpers.sh"
+
+# Fake `claude` binary that counts its invocations
+readonly WORK_DIR="$(mktemp -d)"
+trap 'rm -rf "$WORK_DIR"' EXIT
+
+create_fake_claude() {
+    local version="$1"
+
+    mkdir -p "${WORK_DIR}/bin"
+    cat > "${WORK_DIR}/bin/claude" <<EOF
+#!/bin/sh
+echo probe >> "${WORK_DIR}/calls"
+echo "${version} (Claude Code)"
+EOF
+    chmod +x "${WORK_DIR}/bin/claude"
+}
+
+probe_calls() {
+    if [[ -f "${WORK_DIR}/calls" ]]; then
+        wc -l < "${WORK_DIR}/calls" | tr -d ' '
+    else
+        echo 0
+    fi
+}
+
+# Run the library in a clean shell against the fake binary
+run_probe() {
+    env -u SPEC_KIT_CLAUDE_VERSION -u CLAUDECODE \
+        PATH="${WORK_DIR}/bin:${PATH}" SPEC_KIT_CACHE_DIR="${WORK_DIR}/cache" \
+        "$@"
+}
+
+# ============================================================================
+# Script File Tests
+# ============================================================================
+
+test_script_exists() {
+    if [[ -f "${LIB_DIR}/probe-cache.sh" ]] && bash -n "${LIB_DIR}/probe-cache.sh" 2>/dev/null; then
+        pass "probe-cache.sh exists with valid syntax"
+    else
+        fail "probe-cache.sh exists with valid syntax" "Missing or syntax errors"
+    fi
+}
+
+# ============================================================================
+# Cache Tests
+# ============================================================================
+
+test_single_probe() {
+    create_fake_claude "2.1.16"
+
+    run_probe bash -c "source '${LIB_DIR}/probe-cache.sh'; tool_version claude; has_feature context_forking; get_feature_flags" >/dev/null
+    run_probe bash "${LIB_DIR}/probe-cache.sh" version >/dev/null
+    run_probe bash "${LIB_DIR}/probe-cache.sh" flags >/dev/null
+
+    if [[ "$(probe_calls)" == "1" ]]; then
+        pass "claude --version runs once across lookups and processes"
+    else
+        fail "Single probe" "Expected 1 invocation, got $(probe_calls)"
+    fi
+
+    if grep -q "^claude	${WORK_DIR}/bin/claude	" "${WORK_DIR}/cache/tool-probes.tsv" 2>/dev/null; then
+        pass "Probe persisted with binary path"
+    else
+        fail "Probe persisted" "Cache row not found"
+    fi
+}
+
+test_invalidation_on_upgrade() {
+    # New content (and size) invalidates the row even within the same second
+    create_fake_claude "2.1.100"
+
+    local version
+    version=$(run_probe bash "${LIB_DIR}/probe-cache.sh" probe claude | cut -f2)
+
+    if [[ "$version" == "2.1.100" && "$(probe_calls)" == "2" ]]; then
+        pass "Upgraded binary re-probed"
+    else
+        fail "Invalidation on upgrade" "Version '$version', invocations $(probe_calls)"
+    fi
+}
+
+test_unparseable_version() {
+    local probe memory info flags
+
+    # No x.y.z in the output: the empty version must not shift later fields
+    create_fake_claude "weird build"
+    run_probe bash "${LIB_DIR}/probe-cache.sh" probe claude >/dev/null
+    probe=$(run_probe bash "${LIB_DIR}/probe-cache.sh" probe claude)
+    memory=$(run_probe bash -c "source '${LIB_DIR}/probe-cache.sh'; probe_tool claude; probe_tool claude; echo \"[\$PROBE_VERSION][\$PROBE_RAW]\"")
+    info=$(run_probe bash "${LIB_DIR}/probe-cache.sh" version)
+    flags=$(run_probe bash "${LIB_DIR}/probe-cache.sh" flags 2>&1) || flags="exit $?: $flags"
+
+    if [[ "$probe" == "claude	-	${WORK_DIR}/bin/claude" && "$memory" == "[][weird build (Claude Code)]" ]]; then
+        pass "Unparseable version cached as empty (disk and memory)"
+    else
+        fail "Unparseable version" "probe '$probe', memory '$memory'"
+    fi
+
+    if echo "$info" | grep -q '"version": null, "major": null' && echo "$info" | grep -q '"detection_method": "fallback"' \
+        && echo "$flags" | grep -q '"context_forking": false'; then
+        pass "VersionInfo and FeatureFlags stay valid without a version"
+    else
+        fail "Unparseable version output" "version: $info / flags: $flags"
+    fi
+}
+
+test_default_cache_location() {
+    local root="${WORK_DIR}/repo"
+    mkdir -p "${root}/.claude/lib/version" "${root}/sub"
+    cp "${LIB_DIR}/probe-cache.sh" "${root}/.claude/lib/version/"
+
+    # Sourced by a relative path, then called from another directory
+    (cd "$root" && env -u SPEC_KIT_CACHE_DIR PATH="${WORK_DIR}/bin:${PATH}" bash -c \
+        'source .claude/lib/version/probe-cache.sh; cd sub; tool_version claude' >/dev/null)
+    # Run from inside its own directory
+    (cd "${root}/.claude/lib/version" && env -u SPEC_KIT_CACHE_DIR PATH="${WORK_DIR}/bin:${PATH}" \
+        bash probe-cache.sh probe git >/dev/null)
+
+    if grep -q "^claude	" "${root}/.claude/cache/tool-probes.tsv" 2>/dev/null \
+        && grep -q "^git	" "${root}/.claude/cache/tool-probes.tsv" \
+        && [[ ! -e "${root}/sub/.claude" && ! -e "${root}/.claude/lib/version/.claude" ]]; then
+        pass "Default cache anchored to the project root, not the working directory"
+    else
+        fail "Default cache location" "$(cd "$root" && find . -name tool-probes.tsv)"
+    fi
+}
+
+# ============================================================================
+# FeatureDetector Contract Tests
+# ============================================================================
+
+test_version_info() {
+    local info
+    info=$(run_probe bash "${LIB_DIR}/probe-cache.sh" version)
+
+    if echo "$info" | grep -q '"major": 2, "minor": 1, "patch": 100' && echo "$info" | grep -q '"detection_method": "cli"'; then
+        pass "VersionInfo from CLI probe"
+    else
+        fail "VersionInfo (cli)" "Got: $info"
+    fi
+
+    info=$(run_probe env SPEC_KIT_CLAUDE_VERSION=2.0.5 bash "${LIB_DIR}/probe-cache.sh" version)
+    if echo "$info" | grep -q '"version": "2.0.5"' && echo "$info" | grep -q '"detection_method": "env_var"'; then
+        pass "SPEC_KIT_CLAUDE_VERSION overrides probe"
+    else
+        fail "VersionInfo (env_var)" "Got: $info"
+    fi
+
+    info=$(env -u SPEC_KIT_CLAUDE_VERSION PATH="/usr/bin:/bin" SPEC_KIT_CACHE_DIR="${WORK_DIR}/empty" \
+        bash "${LIB_DIR}/probe-cache.sh" version)
+    if echo "$info" | grep -q '"version": null' && echo "$info" | grep -q '"detection_method": "fallback"'; then
+        pass "Fallback when claude is not installed"
+    else
+        fail "VersionInfo (fallback)" "Got: $info"
+    fi
+}
+
+test_feature_flags() {
+    local flags
+    flags=$(run_probe env SPEC_KIT_CLAUDE_VERSION=2.1.5 bash "${LIB_DIR}/probe-cache.sh" flags)
+
+    if echo "$flags" | grep -q '"context_forking": true' && echo "$flags" | grep -q '"parallel_execution_fixes": false'; then
+        pass "Feature thresholds applied (2.1.0 / 2.1.16)"
+    else
+        fail "Feature thresholds" "Got: $flags"
+    fi
+
+    flags=$(run_probe env SPEC_KIT_CLAUDE_VERSION=2.1.5 SPEC_KIT_FORCE_PARALLEL=true SPEC_KIT_DISABLE_CONTEXT_FORK=true \
+        bash "${LIB_DIR}/probe-cache.sh" flags)
+    if echo "$flags" | grep -q '"context_forking": false' && echo "$flags" | grep -q '"parallel_execution_fixes": true'; then
+        pass "FORCE/DISABLE overrides applied"
+    else
+        fail "FORCE/DISABLE overrides" "Got: $flags"
+    fi
+}
+
+# ============================================================================
+# Main Test Runner
+# ============================================================================
+
+main() {
+    echo "========================================"
+    echo "  ${TEST_NAME} Integration Tests"
+    echo "========================================"
+    echo "Project Root: ${PROJECT_ROOT}"
+    echo ""
+
+    section "Script File Tests"
+    test_script_exists
+
+    section "Cache Tests"
+    test_single_probe
+    test_invalidation_on_upgrade
+    test_default_cache_location
+
+    section "FeatureDetector Contract Tests"
+    test_version_info
+    test_feature_flags
+    test_unparseable_version
+
+    fixture_summary
+}
+
+# Run tests
+main "$@"
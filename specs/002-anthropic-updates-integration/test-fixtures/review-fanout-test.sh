@@ -0,0 +1,334 @@
+#!/usr/bin/env bash
+# Review Fan-out Validation Test
+# Feature: 002-anthropic-updates-integration
+# Created: 2026-10-18
+#
+# Tests that review-fanout.sh runs N stub reviewers concurrently, enforces
+# per-reviewer deadlines, short-circuits on blocking results, de-duplicates
+# findings, and writes sign-offs into triad: frontmatter atomically.
+
+set -euo pipefail
+
+# Test configuration
+readonly TEST_NAME="Review Fan-out"
+readonly SCRIPT_DIR="$(cd "$(dirname "${BASH_SOURCE[0]}")" && pwd)"
+readonly PROJECT_ROOT="${SCRIPT_DIR}/../../.."
+readonly LIB_DIR="${PROJECT_ROOT}/.claude/lib/triad"
+readonly FANOUT="${LIB_DIR}/review-fanout.sh"
+readonly STUB="${LIB_DIR}/stub-agent.sh"
+
+# Shared pass/fail/skip/section helpers
+source "${PROJECT_ROOT}/.claude/lib/testing/fixture-helpers.sh"
+
+readonly WORK_DIR="$(mktemp -d)"
+trap 'rm -rf "$WORK_DIR"' EXIT
+
+export TIMING_STORE_FILE="${WORK_DIR}/timing-events.tsv"
+
+# Write a reviewers file; each argument is "agent|required|timeout_ms|stub args"
+reviewers() {
+    local file="${WORK_DIR}/reviewers-$1.tsv" row
+    shift
+    : > "$file"
+    for row in "$@"; do
+        IFS='|' read -r agent need timeout args <<< "$row"
+        printf '%s\t%s\t%s\t%s --agent %s %s\n' "$agent" "$need" "$timeout" "$STUB" "$agent" "$args" >> "$file"
+    done
+    echo "$file"
+}
+
+create_artifact() {
+    cat > "${WORK_DIR}/plan.md" <<'EOF'
+---
+prd_reference: docs/product/02_PRD/007-new-thing.md
+triad:
+  pm_signoff: null  # Added by /triad.plan
+  architect_signoff:
+    agent: architect
+    date: 2026-01-01
+    status: BLOCKED
+    notes: "Old review"
+  techlead_signoff: null
+---
+
+# Plan
+
+Body text stays untouched.
+EOF
+}
+
+now_ms() {
+    local ns
+    ns=$(date +%s%N 2>/dev/null || true)
+    if [[ "$ns" =~ ^[0-9]+$ ]]; then
+        echo $((ns / 1000000))
+    else
+        perl -MTime::HiRes=time -e 'printf "%d\n", time() * 1000'
+    fi
+}
+
+# ============================================================================
+# Script File Tests
+# ============================================================================
+
+test_scripts_exist() {
+    local script
+    for script in review-fanout.sh merge-results.sh stub-agent.sh; do
+        if [[ -f "${LIB_DIR}/${script}" ]] && bash -n "${LIB_DIR}/${script}" 2>/dev/null; then
+            pass "${script} exists with valid syntax"
+        else
+            fail "${script} exists with valid syntax" "Missing or syntax errors"
+        fi
+    done
+}
+
+# ============================================================================
+# Merger Tests
+# ============================================================================
+
+test_merge_n_reviewers() {
+    source "${LIB_DIR}/merge-results.sh"
+    local result
+
+    result=$(merge_review_statuses APPROVED APPROVED_WITH_CONCERNS APPROVED NOT_FEASIBLE APPROVED)
+    if [[ "$result" == "NOT_FEASIBLE" ]]; then
+        pass "Most severe of five statuses wins"
+    else
+        fail "N-way merge" "Expected NOT_FEASIBLE, got $result"
+    fi
+
+    result=$(create_merged_result PM=APPROVED Architect=APPROVED Team-Lead=CHANGES_REQUESTED)
+    if echo "$result" | grep -q "Final Status\*\*: CHANGES_REQUESTED" && echo "$result" | grep -q "| Team-Lead | CHANGES_REQUESTED |"; then
+        pass "create_merged_result with three reviewers"
+    else
+        fail "create_merged_result" "Got: $result"
+    fi
+}
+
+test_dedupe_findings() {
+    source "${LIB_DIR}/merge-results.sh"
+    local result
+
+    result=$(printf 'finding\tpm\tCONCERN\tNo rollback plan\nfinding\tarchitect\tBLOCKING\tno rollback plan.\nfinding\tarchitect\tINFO\tNice diagrams\nfinding\tteam-lead\tCONCERN\tNo  Rollback Plan\n' | dedupe_findings)
+
+    if [[ "$result" == "BLOCKING	pm,architect,team-lead	No rollback plan
+INFO	architect	Nice diagrams" ]]; then
+        pass "Findings de-duplicated with highest severity and all reporters"
+    else
+        fail "dedupe_findings" "Got: $result"
+    fi
+}
+
+# ============================================================================
+# Fan-out Tests
+# ============================================================================
+
+test_concurrent_latency() {
+    local file started elapsed output rc=0
+
+    file=$(reviewers concurrent \
+        "product-manager|required|5000|--duration-ms 300 --finding 'CONCERN|Scope is large' --recommend 'Split phase 2'" \
+        "architect|required|5000|--duration-ms 600 --verdict APPROVED_WITH_CONCERNS --finding 'CONCERN|scope is LARGE'" \
+        "team-lead|required|5000|--duration-ms 900" \
+        "security|optional|5000|--duration-ms 4000")
+
+    started=$(now_ms)
+    output=$("$FANOUT" --reviewers "$file") || rc=$?
+    elapsed=$(( $(now_ms) - started ))
+
+    if [[ $elapsed -ge 900 && $elapsed -lt 1700 ]]; then
+        pass "Latency bounded by slowest required reviewer (${elapsed} ms, sum 1800 ms)"
+    else
+        fail "Concurrent latency" "Took ${elapsed} ms (expected 900-1700)"
+    fi
+
+    if [[ $rc -eq 0 ]] && echo "$output" | grep -q "Final Status\*\*: APPROVED_WITH_CONCERNS" \
+        && echo "$output" | grep -q "| security | optional | cancelled |" \
+        && echo "$output" | sed -n '/^### Missing Optional Reviews/,$p' | grep -q "^- security cancelled$"; then
+        pass "Merged verdict approved; optional straggler cancelled and listed as missing"
+    else
+        fail "Merged verdict" "rc=$rc, got: $output"
+    fi
+
+    if [[ "$(echo "$output" | grep -ci "scope is large")" == "1" ]] && echo "$output" | grep -q "(product-manager,architect)"; then
+        pass "Duplicate concern reported once with both reviewers"
+    else
+        fail "Concern de-duplication" "Got: $output"
+    fi
+}
+
+test_short_circuit() {
+    local file started elapsed output rc=0
+
+    file=$(reviewers blocking \
+        "product-manager|required|5000|--duration-ms 3000 --finding 'BLOCKING|No rollback plan'" \
+        "architect|required|5000|--duration-ms 3000" \
+        "team-lead|required|5000|--duration-ms 3000")
+
+    started=$(now_ms)
+    output=$("$FANOUT" --reviewers "$file") || rc=$?
+    elapsed=$(( $(now_ms) - started ))
+
+    if [[ $rc -eq 1 && $elapsed -lt 1500 ]] && echo "$output" | grep -q "Final Status\*\*: CHANGES_REQUESTED" \
+        && echo "$output" | grep -q "Short-circuited\*\*: blocking result from product-manager"; then
+        pass "First blocking finding short-circuits to CHANGES_REQUESTED (${elapsed} ms)"
+    else
+        fail "Short-circuit" "rc=$rc, ${elapsed} ms, got: $output"
+    fi
+}
+
+test_deadlines() {
+    local file output rc=0
+
+    file=$(reviewers optional-timeout \
+        "architect|required|5000|--duration-ms 800" \
+        "security|optional|300|--duration-ms 3000")
+    output=$("$FANOUT" --reviewers "$file") || rc=$?
+
+    if [[ $rc -eq 0 ]] && echo "$output" | grep -q "Final Status\*\*: APPROVED$" \
+        && echo "$output" | grep -q "security timed out after 300 ms"; then
+        pass "Optional reviewer timeout reported without affecting verdict"
+    else
+        fail "Optional timeout" "rc=$rc, got: $output"
+    fi
+
+    file=$(reviewers required-timeout \
+        "architect|required|300|--duration-ms 3000" \
+        "team-lead|required|5000|--duration-ms 100")
+    rc=0
+    output=$("$FANOUT" --reviewers "$file") || rc=$?
+
+    if [[ $rc -eq 1 ]] && echo "$output" | grep -q "Final Status\*\*: CHANGES_REQUESTED" \
+        && echo "$output" | grep -q "^- architect timed out after 300 ms"; then
+        pass "Required reviewer timeout is a blocking issue"
+    else
+        fail "Required timeout" "rc=$rc, got: $output"
+    fi
+}
+
+test_optional_only() {
+    local file output rc=0
+
+    file=$(reviewers optional-only \
+        "security|optional|5000|--duration-ms 200 --verdict CHANGES_REQUESTED")
+    output=$("$FANOUT" --reviewers "$file") || rc=$?
+
+    if [[ $rc -eq 1 ]] && echo "$output" | grep -q "Final Status\*\*: CHANGES_REQUESTED" \
+        && echo "$output" | grep -q "| security | optional | completed | CHANGES_REQUESTED |"; then
+        pass "Without required reviewers, optional reviewers are waited on"
+    else
+        fail "Optional-only wait" "rc=$rc, got: $output"
+    fi
+
+    file=$(reviewers optional-failed \
+        "security|optional|5000|--duration-ms 10 --exit-code 3")
+    rc=0
+    output=$("$FANOUT" --reviewers "$file") || rc=$?
+
+    if [[ $rc -eq 1 ]] && echo "$output" | grep -q "Final Status\*\*: CHANGES_REQUESTED" \
+        && echo "$output" | grep -q "^- no reviewer returned a verdict$"; then
+        pass "No completed reviewer is never APPROVED"
+    else
+        fail "No verdict" "rc=$rc, got: $output"
+    fi
+}
+
+# ============================================================================
+# Frontmatter Tests
+# ============================================================================
+
+test_frontmatter_write() {
+    local file output
+
+    create_artifact
+    file=$(reviewers signoff \
+        "product-manager|required|5000|--duration-ms 100 --finding 'CONCERN|Quote \"this\"'" \
+        "architect|required|5000|--duration-ms 100 --verdict APPROVED_WITH_CONCERNS" \
+        "security|required|5000|--duration-ms 100")
+    "$FANOUT" --reviewers "$file" --artifact "${WORK_DIR}/plan.md" >/dev/null
+
+    output=$(cat "${WORK_DIR}/plan.md")
+    if echo "$output" | grep -q '^    notes: "Quote \\"this\\"; merged verdict APPROVED_WITH_CONCERNS"$' \
+        && echo "$output" | grep -A3 "^  architect_signoff:" | grep -q "status: APPROVED_WITH_CONCERNS" \
+        && ! echo "$output" | grep -q "BLOCKED\|Old review" \
+        && echo "$output" | grep -q "^  techlead_signoff: null$" \
+        && echo "$output" | grep -q "^Body text stays untouched.$"; then
+        pass "Sign-offs replaced in place; untouched keys and body preserved"
+    else
+        fail "Frontmatter write" "Got: $output"
+    fi
+
+    if ls "${WORK_DIR}" | grep -q "plan.md.tmp"; then
+        fail "Atomic write" "Temporary file left behind"
+    else
+        pass "Artifact rewritten atomically (no temp file left)"
+    fi
+
+    mkdir -p "${WORK_DIR}/repo/specs/007-new-thing" "${WORK_DIR}/repo/docs/product/02_PRD"
+    touch "${WORK_DIR}/repo/docs/product/02_PRD/007-new-thing.md"
+    cp "${WORK_DIR}/plan.md" "${WORK_DIR}/repo/specs/007-new-thing/plan.md"
+    if SPEC_LINT_ROOT="${WORK_DIR}/repo" "${PROJECT_ROOT}/scripts/lint-specs.sh" specs/007-new-thing/plan.md >/dev/null 2>&1; then
+        pass "Written frontmatter passes lint-specs.sh"
+    else
+        fail "Frontmatter lint" "$(SPEC_LINT_ROOT="${WORK_DIR}/repo" "${PROJECT_ROOT}/scripts/lint-specs.sh" specs/007-new-thing/plan.md 2>&1)"
+    fi
+}
+
+test_timing_records() {
+    local destroyed
+    destroyed=$(grep -c "	FORK_DESTROYED	" "$TIMING_STORE_FILE" || true)
+
+    # Without TIMING_STORE_FILE, a scratch copy of the libs writes under its
+    # own project root (never the real one) and not the caller's directory
+    local root="${WORK_DIR}/repo"
+    mkdir -p "${root}/.claude/lib" "${WORK_DIR}/elsewhere"
+    cp -R "$LIB_DIR" "${root}/.claude/lib/"
+    (cd "${WORK_DIR}/elsewhere" && env -u TIMING_STORE_FILE "${root}/.claude/lib/triad/review-fanout.sh" \
+        --reviewers "$(reviewers default-store "architect|required|5000|--duration-ms 10")" >/dev/null)
+    if [[ ! -e "${WORK_DIR}/elsewhere/.claude" ]] \
+        && grep -q "	FORK_DESTROYED	" "${root}/.claude/cache/timing-events.tsv" 2>/dev/null; then
+        pass "Default timing store anchored to the project root"
+    else
+        fail "Default timing store" "Events not in ${root}/.claude/cache or written to the working directory"
+    fi
+
+    if [[ "$destroyed" == "16" ]] && grep -q "	FORK_FAILED	.*	cancelled$" "$TIMING_STORE_FILE"; then
+        pass "Every reviewer fork recorded in the timing store"
+    else
+        fail "Timing records" "Expected 16 destroyed forks, got $destroyed"
+    fi
+}
+
+# ============================================================================
+# Main Test Runner
+# ============================================================================
+
+main() {
+    echo "========================================"
+    echo "  ${TEST_NAME} Integration Tests"
+    echo "========================================"
+    echo "Project Root: ${PROJECT_ROOT}"
+    echo ""
+
+    section "Script File Tests"
+    test_scripts_exist
+
+    section "Merger Tests"
+    test_merge_n_reviewers
+    test_dedupe_findings
+
+    section "Fan-out Tests"
+    test_concurrent_latency
+    test_short_circuit
+    test_deadlines
+    test_optional_only
+
+    section "Frontmatter Tests"
+    test_frontmatter_write
+    test_timing_records
+
+    fixture_summary
+}
+
+# Run tests
+main "$@"
@@ -0,0 +1,369 @@
+#!/usr/bin/env bash
+# Parallel Task Scheduler Validation Test
+# Feature: 002-anthropic-updates-integration
+# Created: 2026-10-18
+#
+# Tests tasks.md DAG parsing, cycle detection, wave scheduling and the
+# DependencyResolver contract functions in scheduler.sh.
+
+set -euo pipefail
+
+# Test configuration
+readonly TEST_NAME="Task Scheduler"
+readonly SCRIPT_DIR="$(cd "$(dirname "${BASH_SOURCE[0]}")" && pwd)"
+readonly PROJECT_ROOT="${SCRIPT_DIR}/../../.."
+readonly LIB_DIR="${PROJECT_ROOT}/.claude/lib/dependencies"
+readonly SPECS_DIR="${PROJECT_ROOT}/specs"
+
+# Shared pass/fail/skip/section helpers
+source "${PROJECT_ROOT}/.claude/lib/testing/fixture-helpers.sh"
+
+# Tasks file mixing [P] groups, inline dependencies and a dependency table
+create_parallel_tasks_file() {
+    local tmpfile
+    tmpfile=$(mktemp)
+
+    cat > "$tmpfile" <<'EOF'
+# Test Tasks
+
+## Phase 1
+
+- [x] T001 Setup
+- [ ] T002 [P] Create file A
+- [ ] T003 [P] Create file B
+- [ ] T004 [P] Create file C
+- [ ] T005 Verify files
+
+## Phase 2
+
+- [ ] T006 [P] Document A
+- [ ] T007 [P] Document B (Depends on: T002)
+
+## Dependencies
+
+| Task | Depends On | Reason |
+|------|------------|--------|
+| T007 | T003-T004 | Range reference |
+EOF
+
+    echo "$tmpfile"
+}
+
+create_cyclic_tasks_file() {
+    local tmpfile
+    tmpfile=$(mktemp)
+
+    cat > "$tmpfile" <<'EOF'
+# Test Tasks with Cycle
+
+- [ ] T001 First task (Depends on: T003)
+- [ ] T002 Second task (Depends on: T001)
+- [ ] T003 Third task (Depends on: T002)
+- [ ] T004 Fourth task depends_on: [T004, T099]
+EOF
+
+    echo "$tmpfile"
+}
+
+create_unknown_dependency_tasks_file() {
+    local tmpfile
+    tmpfile=$(mktemp)
+
+    cat > "$tmpfile" <<'EOF'
+# Test Tasks with Unknown Dependency
+
+- [x] T001 Setup
+- [ ] T002 [P] Build (Depends on: T099)
+- [ ] T003 [P] Document
+EOF
+
+    echo "$tmpfile"
+}
+
+# ============================================================================
+# Script File Tests
+# ============================================================================
+
+test_scheduler_script_exists() {
+    if [[ -f "${LIB_DIR}/scheduler.sh" ]]; then
+        pass "scheduler.sh exists"
+    else
+        fail "scheduler.sh exists" "File not found"
+    fi
+}
+
+test_scheduler_syntax() {
+    if bash -n "${LIB_DIR}/scheduler.sh" 2>/dev/null; then
+        pass "scheduler.sh has valid syntax"
+    else
+        fail "scheduler.sh has valid syntax" "Syntax errors"
+    fi
+}
+
+# ============================================================================
+# Parser Tests
+# ============================================================================
+
+test_parse_task_graph() {
+    source "${LIB_DIR}/scheduler.sh"
+
+    local tmpfile graph
+    tmpfile=$(create_parallel_tasks_file)
+    graph=$(parse_task_graph "$tmpfile")
+    rm -f "$tmpfile"
+
+    if echo "$graph" | grep -qE "^T001	Phase 1	0	completed	$"; then
+        pass "parse_task_graph records phase and completion"
+    else
+        fail "parse_task_graph (T001)" "Got: $(echo "$graph" | head -1)"
+    fi
+
+    if echo "$graph" | grep -qE "^T003	Phase 1	1	pending	T001$"; then
+        pass "parse_task_graph marks [P] tasks"
+    else
+        fail "parse_task_graph ([P])" "Got: $(echo "$graph" | grep '^T003')"
+    fi
+
+    if echo "$graph" | grep -qE "^T005	.*	T002,T003,T004$"; then
+        pass "Non-[P] task waits for the whole [P] group"
+    else
+        fail "Implicit [P] group ordering" "Got: $(echo "$graph" | grep '^T005')"
+    fi
+
+    if echo "$graph" | grep '^T007' | grep -q "T004"; then
+        pass "Dependency table ranges expanded"
+    else
+        fail "Dependency table ranges" "Got: $(echo "$graph" | grep '^T007')"
+    fi
+}
+
+# ============================================================================
+# Schedule Tests
+# ============================================================================
+
+test_waves() {
+    source "${LIB_DIR}/scheduler.sh"
+
+    local tmpfile waves
+    tmpfile=$(create_parallel_tasks_file)
+    schedule_load "$tmpfile"
+    waves=$(schedule_waves)
+    rm -f "$tmpfile"
+
+    if [[ "$(echo "$waves" | sed -n 2p)" == "2	T002 T003 T004" ]]; then
+        pass "[P] group scheduled as one wave"
+    else
+        fail "[P] group wave" "Got: $waves"
+    fi
+
+    if [[ "$(echo "$waves" | wc -l | tr -d ' ')" == "4" ]]; then
+        pass "Wave count equals critical path length"
+    else
+        fail "Wave count" "Expected 4 waves, got: $waves"
+    fi
+}
+
+test_pending_waves() {
+    source "${LIB_DIR}/scheduler.sh"
+
+    local tmpfile first
+    tmpfile=$(create_parallel_tasks_file)
+    schedule_load "$tmpfile"
+    first=$(schedule_waves 1 | head -1)
+    rm -f "$tmpfile"
+
+    if [[ "$first" == "1	T002 T003 T004" ]]; then
+        pass "Pending schedule skips completed tasks"
+    else
+        fail "Pending schedule" "Got: $first"
+    fi
+}
+
+test_json_report() {
+    source "${LIB_DIR}/scheduler.sh"
+
+    local tmpfile report
+    tmpfile=$(create_parallel_tasks_file)
+    schedule_load "$tmpfile"
+    report=$(schedule_report --json)
+    rm -f "$tmpfile"
+
+    if echo "$report" | grep -q '"max_concurrency": 3' && echo "$report" | grep -q '"critical_path_length": 4'; then
+        pass "JSON report includes concurrency and critical path"
+    else
+        fail "JSON report" "Got: $report"
+    fi
+}
+
+# ============================================================================
+# DependencyResolver Contract Tests
+# ============================================================================
+
+test_can_start_and_blockers() {
+    source "${LIB_DIR}/scheduler.sh"
+
+    local tmpfile blockers
+    tmpfile=$(create_parallel_tasks_file)
+    schedule_load "$tmpfile"
+
+    if schedule_can_start "T002"; then
+        pass "canStart true when dependencies completed"
+    else
+        fail "canStart (T002)" "T001 is completed, T002 should be startable"
+    fi
+
+    if ! schedule_can_start "T005"; then
+        pass "canStart false while [P] group pending"
+    else
+        fail "canStart (T005)" "T005 should be blocked"
+    fi
+
+    blockers=$(schedule_get_blockers "T005" | tr '\n' ' ')
+    if [[ "$blockers" == "T002 T003 T004 " ]]; then
+        pass "getBlockers lists incomplete dependencies"
+    else
+        fail "getBlockers (T005)" "Got: $blockers"
+    fi
+
+    rm -f "$tmpfile"
+}
+
+test_ready_tasks() {
+    source "${LIB_DIR}/scheduler.sh"
+
+    local tmpfile ready
+    tmpfile=$(create_parallel_tasks_file)
+    schedule_load "$tmpfile"
+    ready=$(schedule_ready_tasks | tr '\n' ' ')
+    rm -f "$tmpfile"
+
+    if [[ "$ready" == "T002 T003 T004 " ]]; then
+        pass "getReadyTasks returns the startable batch"
+    else
+        fail "getReadyTasks" "Got: $ready"
+    fi
+}
+
+test_ready_agrees_with_can_start() {
+    source "${LIB_DIR}/scheduler.sh"
+
+    local tmpfile ready task mismatches=""
+    tmpfile=$(create_unknown_dependency_tasks_file)
+    schedule_load "$tmpfile"
+    ready=" $(schedule_ready_tasks | tr '\n' ' ')"
+
+    for task in T002 T003; do
+        if [[ "$ready" == *" ${task} "* ]] && ! schedule_can_start "$task"; then
+            mismatches="${mismatches} ${task}"
+        elif [[ "$ready" != *" ${task} "* ]] && schedule_can_start "$task"; then
+            mismatches="${mismatches} ${task}"
+        fi
+    done
+    rm -f "$tmpfile"
+
+    if [[ -z "$mismatches" && "$ready" == " T003 " ]]; then
+        pass "getReadyTasks and canStart agree on unknown dependencies"
+    else
+        fail "getReadyTasks vs canStart" "ready:${ready}, disagree on:${mismatches}"
+    fi
+}
+
+test_sourcing_leaves_caller_shell() {
+    local tmpfile output
+    tmpfile=$(create_parallel_tasks_file)
+
+    output=$(bash -c '
+        set +euo pipefail
+        trap "echo caller trap ran" EXIT
+        source "$1/scheduler.sh"
+        schedule_load "$2"
+        schedule_waves >/dev/null
+        shopt -o errexit nounset pipefail | grep -c "on$" || true
+    ' _ "$LIB_DIR" "$tmpfile")
+    rm -f "$tmpfile"
+
+    if [[ "$output" == $'0\ncaller trap ran' ]]; then
+        pass "Sourcing keeps the caller's shell options and EXIT trap"
+    else
+        fail "Sourcing side effects" "Got: $output"
+    fi
+}
+
+test_validate_cycle() {
+    source "${LIB_DIR}/scheduler.sh"
+
+    local tmpfile errors
+    tmpfile=$(create_cyclic_tasks_file)
+    schedule_load "$tmpfile"
+    errors=$(schedule_validate || true)
+    rm -f "$tmpfile"
+
+    if echo "$errors" | grep -q "^CIRCULAR	T001	T001 -> T003 -> T002 -> T001"; then
+        pass "validateDependencyGraph reports cycle path"
+    else
+        fail "Cycle detection" "Got: $errors"
+    fi
+
+    if echo "$errors" | grep -q "^SELF_DEPENDENCY	T004" && echo "$errors" | grep -q "^MISSING_TASK	T004	.*T099"; then
+        pass "validateDependencyGraph reports self and missing references"
+    else
+        fail "Self/missing references" "Got: $errors"
+    fi
+}
+
+test_real_tasks_files_valid() {
+    source "${LIB_DIR}/scheduler.sh"
+
+    local tasks_file all_valid=true
+
+    for tasks_file in "${SPECS_DIR}"/*/tasks.md; do
+        schedule_load "$tasks_file"
+        if ! schedule_validate >/dev/null; then
+            fail "$(basename "$(dirname "$tasks_file")") schedule" "$(schedule_validate || true)"
+            all_valid=false
+        fi
+    done
+
+    if [[ "$all_valid" == "true" ]]; then
+        pass "All specs/*/tasks.md files schedule without errors"
+    fi
+}
+
+# ============================================================================
+# Main Test Runner
+# ============================================================================
+
+main() {
+    echo "========================================"
+    echo "  ${TEST_NAME} Integration Tests"
+    echo "========================================"
+    echo "Project Root: ${PROJECT_ROOT}"
+    echo ""
+
+    section "Script File Tests"
+    test_scheduler_script_exists
+    test_scheduler_syntax
+
+    section "Parser Tests"
+    test_parse_task_graph
+
+    section "Schedule Tests"
+    test_waves
+    test_pending_waves
+    test_json_report
+
+    section "DependencyResolver Contract Tests"
+    test_can_start_and_blockers
+    test_ready_tasks
+    test_ready_agrees_with_can_start
+    test_sourcing_leaves_caller_shell
+    test_validate_cycle
+
+    section "Integration Tests"
+    test_real_tasks_files_valid
+
+    fixture_summary
+}
+
+# Run tests
+main "$@"
@@ -0,0 +1,287 @@
+#!/usr/bin/env bash
+# Spec Artifact Linter Validation Test
+# Feature: 002-anthropic-updates-integration
+# Created: 2026-10-18
+#
+# Tests scripts/lint-specs.sh rules (frontmatter, task-id, task-tag, link,
+# header) and its incremental --changed / --staged / pre-commit modes.
+
+set -euo pipefail
+
+# Test configuration
+readonly TEST_NAME="Spec Linter"
+readonly SCRIPT_DIR="$(cd "$(dirname "${BASH_SOURCE[0]}")" && pwd)"
+readonly PROJECT_ROOT="${SCRIPT_DIR}/../../.."
+readonly LINTER="${PROJECT_ROOT}/scripts/lint-specs.sh"
+
+# Shared pass/fail/skip/section helpers
+source "${PROJECT_ROOT}/.claude/lib/testing/fixture-helpers.sh"
+
+readonly WORK_DIR="$(mktemp -d)"
+trap 'rm -rf "$WORK_DIR"' EXIT
+
+# Small repository with one clean and one broken artifact of each kind
+create_repo() {
+    local root="${WORK_DIR}/repo"
+    mkdir -p "${root}/specs/001-good" "${root}/specs/002-bad" "${root}/docs/product/02_PRD"
+
+    cat > "${root}/specs/001-good/tasks.md" <<'EOF'
+---
+triad:
+  pm_signoff:
+    agent: product-manager
+    date: 2026-03-01
+    status: APPROVED
+    notes: "Fine"
+  architect_signoff: null  # Added by /triad.plan
+  techlead_signoff: null
+---
+
+# Tasks
+
+- [x] T001 [P] Setup
+- [ ] T002 [P] [US1] Build [the thing](spec.md)
+- [ ] T003 [US2] Document it
+
+```bash
+- [ ] T999 [bad] not a task, inside a code block
+```
+EOF
+    echo "# Spec" > "${root}/specs/001-good/spec.md"
+
+    cat > "${root}/specs/002-bad/tasks.md" <<'EOF'
+---
+triad:
+  pm_signoff:
+    agent: product-manager
+    date: 03/01/2026
+    status: LGTM
+  architect_signoff:
+    agent: architect
+    status: APPROVED
+---
+
+- [ ] T001 [p] Lower-case tag
+- [ ] T003 [US 1] Gap and malformed story tag
+- [ ] T003 [P] [P] Repeated ID and tag
+EOF
+
+    cat > "${root}/docs/product/02_PRD/INDEX.md" <<'EOF'
+<!--
+File: index.md
+Description: PRD registry
+Author/Agent: product-manager
+Created: 2026-03-02
+Last Updated: 2026-03-01
+-->
+
+| ID | Title | Related Spec |
+|----|-------|--------------|
+| 001 | Good | [Spec](../../../specs/001-good/spec.md) |
+| 002 | Bad | [Spec](../../../specs/002-bad/spec.md) |
+
+See [the web](https://example.com) and [anchor](#prd-registry).
+EOF
+
+    (cd "$root" && git init -q && git add -A && git -c user.name=t -c user.email=t@t commit -qm init)
+    echo "$root"
+}
+
+run_lint() {
+    SPEC_LINT_ROOT="$ROOT" "$LINTER" "$@" 2>&1 | sed 's/\x1b\[[0-9;]*m//g'
+}
+
+# ============================================================================
+# Script File Tests
+# ============================================================================
+
+test_linter_exists() {
+    if [[ -x "$LINTER" ]] && bash -n "$LINTER" 2>/dev/null; then
+        pass "lint-specs.sh exists with valid syntax"
+    else
+        fail "lint-specs.sh exists with valid syntax" "Missing, not executable, or syntax errors"
+    fi
+}
+
+# ============================================================================
+# Rule Tests
+# ============================================================================
+
+test_clean_file() {
+    local output
+    output=$(run_lint specs/001-good/tasks.md specs/001-good/spec.md)
+
+    if echo "$output" | grep -q "0 error(s), 0 warning(s)"; then
+        pass "Well-formed tasks.md passes (code blocks and link tags ignored)"
+    else
+        fail "Clean file" "Got: $output"
+    fi
+}
+
+test_rules() {
+    local output
+    output=$(run_lint || true)
+
+    expect() {
+        local description="$1" pattern="$2"
+        if echo "$output" | grep -qE "$pattern"; then
+            pass "$description"
+        else
+            fail "$description" "No line matching: $pattern"
+        fi
+    }
+
+    expect "Invalid sign-off status" '^specs/002-bad/tasks.md:6: error \[frontmatter\] pm_signoff status "LGTM"'
+    expect "Non-ISO sign-off date" '^specs/002-bad/tasks.md:5: error \[frontmatter\] pm_signoff date'
+    expect "Sign-off missing date" '^specs/002-bad/tasks.md:7: error \[frontmatter\] architect_signoff is missing date'
+    expect "Task ID gap" '^specs/002-bad/tasks.md:13: error \[task-id\] T003 follows T001 \(missing T002\)'
+    expect "Repeated task ID" '^specs/002-bad/tasks.md:14: error \[task-id\] T003 is repeated'
+    expect "Malformed [P] tag" 'error \[task-tag\] T001 has malformed tag "\[p\]"'
+    expect "Malformed [US] tag" 'error \[task-tag\] T003 has malformed tag "\[US 1\]"'
+    expect "Repeated tag" 'error \[task-tag\] T003 repeats tag \[P\]'
+    expect "Broken ../../../specs link" '^docs/product/02_PRD/INDEX.md:12: error \[link\] broken link "../../../specs/002-bad/spec.md"'
+    expect "Header filename mismatch" 'error \[header\] header File: "index.md" does not match filename "INDEX.md"'
+    expect "Header date order" 'error \[header\] Created is after Last Updated'
+
+    if echo "$output" | grep -qE "INDEX.md:11:|example.com|#prd-registry|T999"; then
+        fail "No false positives" "Got: $output"
+    else
+        pass "Valid links, URLs, anchors and fenced tasks not reported"
+    fi
+
+    if run_lint >/dev/null; then
+        fail "Exit status" "Expected non-zero exit with errors"
+    else
+        pass "Non-zero exit when errors found"
+    fi
+}
+
+# ============================================================================
+# Incremental Mode Tests
+# ============================================================================
+
+test_changed_mode() {
+    local output
+
+    echo "- [ ] T004 Follow-up" >> "${ROOT}/specs/001-good/tasks.md"
+    printf '# New doc\n' > "${ROOT}/docs/new-doc.md"
+
+    output=$(run_lint --changed)
+    if echo "$output" | grep -q "2 file(s) checked (changed), 0 error(s), 1 warning(s)" \
+        && echo "$output" | grep -q "^docs/new-doc.md:1: warning \[header\] new file has no header"; then
+        pass "--changed lints only modified/untracked files"
+    else
+        fail "--changed" "Got: $output"
+    fi
+
+    if run_lint --changed --strict >/dev/null; then
+        fail "--strict" "Expected warnings to fail with --strict"
+    else
+        pass "--strict turns warnings into failures"
+    fi
+}
+
+test_deleted_target() {
+    local output
+
+    (cd "$ROOT" && git rm -q specs/001-good/spec.md)
+    output=$(run_lint --staged || true)
+
+    if echo "$output" | grep -q "^docs/product/02_PRD/INDEX.md:11: error \[link\]" \
+        && echo "$output" | grep -q "^specs/001-good/tasks.md:.*error \[link\]"; then
+        pass "Deleting a file re-lints files that link to it"
+    else
+        fail "Deleted link target" "Got: $output"
+    fi
+}
+
+test_staged_content() {
+    local output tasks="${ROOT}/specs/001-good/tasks.md"
+
+    (cd "$ROOT" && git reset -q --hard && git clean -qfd)
+    cp "$tasks" "${WORK_DIR}/tasks.md.orig"
+    grep -v "T002" "${WORK_DIR}/tasks.md.orig" > "$tasks"
+    (cd "$ROOT" && git add specs/001-good/tasks.md && git rm -q --cached specs/001-good/spec.md)
+    cp "${WORK_DIR}/tasks.md.orig" "$tasks"
+
+    output=$(run_lint --staged || true)
+    if echo "$output" | grep -q "^specs/001-good/tasks.md:.*error \[task-id\] T003 follows T001 (missing T002)"; then
+        pass "--staged lints the index, not the working-tree fix"
+    else
+        fail "--staged content" "Got: $output"
+    fi
+
+    if echo "$output" | grep -q "^docs/product/02_PRD/INDEX.md:11: error \[link\]"; then
+        pass "--staged resolves links against the index"
+    else
+        fail "--staged links" "Got: $output"
+    fi
+}
+
+test_pre_commit_hook() {
+    local output
+
+    (cd "$ROOT" && git reset -q --hard && git clean -qfd)
+    ln -s "$LINTER" "${ROOT}/.git/hooks/pre-commit"
+    sed -i.bak 's/status: APPROVED$/status: MAYBE/' "${ROOT}/specs/001-good/tasks.md"
+    rm -f "${ROOT}/specs/001-good/tasks.md.bak"
+
+    if output=$(cd "$ROOT" && git add -A && git -c user.name=t -c user.email=t@t commit -qm bad 2>&1); then
+        fail "pre-commit hook" "Commit with invalid status was accepted"
+    elif echo "$output" | grep -q "(staged)"; then
+        pass "Pre-commit hook blocks commits with errors in staged files"
+    else
+        fail "pre-commit hook" "Got: $output"
+    fi
+}
+
+test_repository_tasks() {
+    local output
+    output=$("$LINTER" "${PROJECT_ROOT}"/specs/*/tasks.md 2>&1 | sed 's/\x1b\[[0-9;]*m//g' | grep -E "\[task-(id|tag)\]" || true)
+
+    if [[ -z "$output" ]]; then
+        pass "Repository tasks.md files have continuous IDs and valid tags"
+    else
+        fail "Repository tasks.md" "$output"
+    fi
+}
+
+# ============================================================================
+# Main Test Runner
+# ============================================================================
+
+main() {
+    echo "========================================"
+    echo "  ${TEST_NAME} Integration Tests"
+    echo "========================================"
+    echo "Project Root: ${PROJECT_ROOT}"
+    echo ""
+
+    if ! command -v git &>/dev/null; then
+        skip "git not available"
+        fixture_summary
+    fi
+
+    ROOT=$(create_repo)
+
+    section "Script File Tests"
+    test_linter_exists
+
+    section "Rule Tests"
+    test_clean_file
+    test_rules
+
+    section "Incremental Mode Tests"
+    test_changed_mode
+    test_deleted_target
+    test_staged_content
+    test_pre_commit_hook
+
+    section "Integration Tests"
+    test_repository_tasks
+
+    fixture_summary
+}
+
+# Run tests
+main "$@"
@@ -0,0 +1,261 @@
+#!/usr/bin/env bash
+# Timing Store and Benchmark Validation Test
+# Feature: 002-anthropic-updates-integration
+# Created: 2026-10-18
+#
+# Tests fork lifecycle recording, duration/percentile reporting and the
+# sequential vs parallel benchmark harness against the stub agent.
+
+set -euo pipefail
+
+# Test configuration
+readonly TEST_NAME="Timing Store"
+readonly SCRIPT_DIR="$(cd "$(dirname "${BASH_SOURCE[0]}")" && pwd)"
+readonly PROJECT_ROOT="${SCRIPT_DIR}/../../.."
+readonly LIB_DIR="${PROJECT_ROOT}/.claude/lib/triad"
+
+# Shared pass/fail/skip/section helpers
+source "${PROJECT_ROOT}/.claude/lib/testing/fixture-helpers.sh"
+
+# ============================================================================
+# Script File Tests
+# ============================================================================
+
+test_scripts_have_valid_syntax() {
+    local all_valid=true
+
+    for script in timing-store.sh timing-metrics.sh benchmark.sh stub-agent.sh; do
+        if [[ ! -f "${LIB_DIR}/${script}" ]] || ! bash -n "${LIB_DIR}/${script}" 2>/dev/null; then
+            fail "${script} exists with valid syntax" "Missing or syntax errors"
+            all_valid=false
+        fi
+    done
+
+    if [[ "$all_valid" == "true" ]]; then
+        pass "All timing scripts exist with valid syntax"
+    fi
+}
+
+# ============================================================================
+# Timing Store Tests
+# ============================================================================
+
+test_fork_lifecycle_recorded() {
+    local store
+    store=$(mktemp)
+
+    TIMING_STORE_FILE="$store"
+    source "${LIB_DIR}/timing-store.sh"
+
+    local fork_id
+    fork_id=$(fork_create "architect" "parent-1")
+    fork_start "$fork_id"
+    fork_complete "$fork_id" "APPROVED"
+    fork_destroy "$fork_id"
+
+    local events
+    events=$(awk -F'\t' -v f="$fork_id" '$3 == f { printf "%s ", $4 }' "$store")
+    if [[ "$events" == "FORK_CREATED FORK_STARTED FORK_COMPLETED FORK_DESTROYED " ]]; then
+        pass "Fork lifecycle events appended in order"
+    else
+        fail "Fork lifecycle events" "Got: $events"
+    fi
+
+    if awk -F'\t' 'NF != 7 { bad = 1 } END { exit bad }' "$store"; then
+        pass "Every record has 7 tab-separated fields"
+    else
+        fail "Record format" "Unexpected field count"
+    fi
+
+    if ! record_fork_event "FORK_EXPLODED" "$fork_id" 2>/dev/null; then
+        pass "Unknown lifecycle events rejected"
+    else
+        fail "Unknown lifecycle events" "FORK_EXPLODED was accepted"
+    fi
+
+    rm -f "$store"
+}
+
+test_fork_durations() {
+    local store
+    store=$(mktemp)
+
+    printf '%s\n' \
+        "1000	s1	f1	FORK_CREATED	architect	-	-" \
+        "1200	s1	f1	FORK_STARTED	-	-	-" \
+        "4200	s1	f1	FORK_COMPLETED	-	-	APPROVED" \
+        "4300	s1	f1	FORK_DESTROYED	-	-	-" \
+        "1000	s1	f2	FORK_CREATED	product-manager	-	-" \
+        "1100	s1	f2	FORK_STARTED	-	-	-" \
+        "1600	s1	f2	FORK_FAILED	-	-	timeout" > "$store"
+
+    source "${LIB_DIR}/timing-store.sh"
+
+    local durations
+    durations=$(fork_durations "$store")
+
+    if echo "$durations" | grep -q "^s1	f1	architect	completed	200	3000	3300$"; then
+        pass "Queue, run and total durations computed"
+    else
+        fail "fork_durations (f1)" "Got: $(echo "$durations" | head -1)"
+    fi
+
+    if echo "$durations" | grep -q "^s1	f2	product-manager	failed	100	500	600$"; then
+        pass "Failed forks measured up to FORK_FAILED"
+    else
+        fail "fork_durations (f2)" "Got: $(echo "$durations" | tail -1)"
+    fi
+
+    rm -f "$store"
+}
+
+test_percentiles() {
+    source "${LIB_DIR}/timing-store.sh"
+
+    local p50 p95
+    p50=$(printf '%s\n' 10 20 30 40 50 60 70 80 90 100 | timing_percentile 50)
+    p95=$(printf '%s\n' 100 90 80 70 60 50 40 30 20 10 | timing_percentile 95)
+
+    if [[ "$p50" == "50" && "$p95" == "100" ]]; then
+        pass "Nearest-rank p50/p95"
+    else
+        fail "Percentiles" "Expected 50/100, got $p50/$p95"
+    fi
+}
+
+test_sourcing_leaves_caller_shell() {
+    local store output
+    store=$(mktemp)
+
+    output=$(TIMING_STORE_FILE="$store" bash -c '
+        source "$1/timing-metrics.sh"
+        start_timer "triad.plan" "parallel"
+        stop_timer
+        shopt -o errexit nounset pipefail | grep -c "on$" || true
+    ' _ "$LIB_DIR")
+
+    if [[ "$output" =~ ^[0-9]+\.[0-9][0-9]$'\n'0$ ]]; then
+        pass "timing-metrics.sh works sourced and keeps the caller's shell options"
+    else
+        fail "Sourcing side effects" "Got: $output"
+    fi
+
+    if [[ "$(awk -F'\t' '$4 == "FORK_CREATED" { print $5, $6, $7 }' "$store")" == "triad.plan - mode=parallel" ]]; then
+        pass "start_timer records the mode as detail, not as parent_id"
+    else
+        fail "start_timer record" "Got: $(grep FORK_CREATED "$store")"
+    fi
+    rm -f "$store"
+}
+
+# ============================================================================
+# Benchmark Tests
+# ============================================================================
+
+test_benchmark_parallel_faster() {
+    local workload baseline output
+    workload=$(mktemp)
+    baseline=$(mktemp)
+    rm -f "$baseline"
+
+    printf '%s\n' \
+        "review	product-manager	200" \
+        "review	architect	300" > "$workload"
+
+    if output=$(bash "${LIB_DIR}/benchmark.sh" run --workload "$workload" --iterations 1 --scale 1 \
+        --baseline "$baseline" --save-baseline 2>&1); then
+        pass "Benchmark run completes"
+    else
+        fail "Benchmark run" "$output"
+    fi
+
+    local seq par
+    seq=$(awk -F'\t' '$1 == "sequential" { print $2 }' "$baseline" 2>/dev/null || true)
+    par=$(awk -F'\t' '$1 == "parallel" { print $2 }' "$baseline" 2>/dev/null || true)
+
+    if [[ -n "$seq" && -n "$par" ]] && (( par < seq )); then
+        pass "Parallel replay faster than sequential (${par} < ${seq} ms)"
+    else
+        fail "Parallel vs sequential" "sequential=${seq:-none} parallel=${par:-none}"
+    fi
+
+    if [[ "$(cut -f4 "$baseline" 2>/dev/null | sort -u)" == "$(bash "${PROJECT_ROOT}/.claude/lib/version/kit-version.sh")" ]]; then
+        pass "Baseline rows tagged with the kit version"
+    else
+        fail "Baseline kit version" "Got: $(cut -f4 "$baseline" 2>/dev/null | tr '\n' ' ')"
+    fi
+
+    rm -f "$workload" "$baseline"
+}
+
+test_kit_version() {
+    source "${PROJECT_ROOT}/.claude/lib/version/kit-version.sh"
+
+    local changelog
+    changelog=$(mktemp)
+    printf '# Changelog\n\n## [Unreleased]\n\n## [1.2.3] - 2026-01-01\n\n## [1.2.2] - 2025-12-01\n' > "$changelog"
+
+    if [[ "$(kit_version "$changelog")" == "1.2.3" ]]; then
+        pass "kit_version reads the latest release heading"
+    else
+        fail "kit_version" "Got: $(kit_version "$changelog")"
+    fi
+
+    printf '# Changelog\n\n## [Unreleased]\n' > "$changelog"
+    if [[ "$(kit_version "$changelog")" == "unknown" && "$(kit_version /nonexistent/CHANGELOG.md)" == "unknown" ]]; then
+        pass "kit_version falls back to \"unknown\" without a release"
+    else
+        fail "kit_version fallback" "Got: '$(kit_version "$changelog")'"
+    fi
+
+    rm -f "$changelog"
+}
+
+test_benchmark_detects_regression() {
+    local workload baseline
+    workload=$(mktemp)
+    baseline=$(mktemp)
+
+    printf '%s\n' "review	architect	100" > "$workload"
+    printf '%s\n' "sequential	1	1	0.0.0	2026-01-01	1" > "$baseline"
+
+    if ! bash "${LIB_DIR}/benchmark.sh" run --workload "$workload" --iterations 1 --scale 1 \
+        --baseline "$baseline" >/dev/null 2>&1; then
+        pass "Regression against baseline fails the run"
+    else
+        fail "Regression detection" "Run passed despite exceeding baseline"
+    fi
+
+    rm -f "$workload" "$baseline"
+}
+
+# ============================================================================
+# Main Test Runner
+# ============================================================================
+
+main() {
+    echo "========================================"
+    echo "  ${TEST_NAME} Integration Tests"
+    echo "========================================"
+    echo "Project Root: ${PROJECT_ROOT}"
+    echo ""
+
+    section "Script File Tests"
+    test_scripts_have_valid_syntax
+
+    section "Timing Store Tests"
+    test_fork_lifecycle_recorded
+    test_fork_durations
+    test_percentiles
+    test_sourcing_leaves_caller_shell
+
+    section "Benchmark Tests"
+    test_benchmark_parallel_faster
+    test_benchmark_detects_regression
+    test_kit_version
+
+    fixture_summary
+}
+
+# Run tests
+main "$@"
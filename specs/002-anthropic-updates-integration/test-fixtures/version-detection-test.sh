@@ -13,37 +13,8 @@ readonly SCRIPT_DIR="$(cd "$(dirname "${BASH_SOURCE[0]}")" && pwd)"
 readonly PROJECT_ROOT="${SCRIPT_DIR}/../../.."
 readonly LIB_DIR="${PROJECT_ROOT}/.claude/lib/version"
 
-# Test counters
-TESTS_RUN=0
-TESTS_PASSED=0
-TESTS_FAILED=0
-
-# ============================================================================
-# Test Utilities
-# ============================================================================
-
-pass() {
-    local test_name="$1"
-    ((TESTS_PASSED++))
-    ((TESTS_RUN++))
-    echo "  ✅ PASS: $test_name"
-}
-
-fail() {
-    local test_name="$1"
-    local message="${2:-}"
-    ((TESTS_FAILED++))
-    ((TESTS_RUN++))
-    echo "  ❌ FAIL: $test_name"
-    if [[ -n "$message" ]]; then
-        echo "     Reason: $message"
-    fi
-}
-
-section() {
-    echo ""
-    echo "=== $1 ==="
-}
+# Shared pass/fail/skip/section helpers
+source "${PROJECT_ROOT}/.claude/lib/testing/fixture-helpers.sh"
 
 # ============================================================================
 # Test Cases
@@ -255,7 +226,7 @@ test_config_json_valid() {
             fail "feature-flags.json has 'version_thresholds' key" "Missing thresholds"
         fi
     else
-        echo "  ⏭️ SKIP: jq not available for JSON validation"
+        skip "jq not available for JSON validation"
     fi
 }
 
@@ -294,23 +265,7 @@ main() {
     section "Configuration Tests"
     test_config_json_valid
 
-    # Summary
-    echo ""
-    echo "========================================"
-    echo "  Test Summary"
-    echo "========================================"
-    echo "  Tests Run:    ${TESTS_RUN}"
-    echo "  Tests Passed: ${TESTS_PASSED}"
-    echo "  Tests Failed: ${TESTS_FAILED}"
-    echo ""
-
-    if [[ ${TESTS_FAILED} -eq 0 ]]; then
-        echo "✅ All tests passed!"
-        exit 0
-    else
-        echo "❌ Some tests failed!"
-        exit 1
-    fi
+    fixture_summary
 }
 
 # Run tests
@@ -0,0 +1,235 @@
+#!/usr/bin/env bash
+# Agent Prompt Profiler Validation Test
+# Feature: 003-agent-refactoring
+# Created: 2026-10-18
+#
+# Tests that prompt-profile.sh expands agents with their skills and
+# @-imported rules, attributes tokens to sections, enforces budgets and
+# tracks sizes in the baseline.
+
+set -euo pipefail
+
+# Test configuration
+readonly TEST_NAME="Agent Prompt Profiler"
+readonly SCRIPT_DIR="$(cd "$(dirname "${BASH_SOURCE[0]}")" && pwd)"
+readonly PROJECT_ROOT="${SCRIPT_DIR}/../../.."
+readonly PROFILER="${PROJECT_ROOT}/.claude/lib/agents/prompt-profile.sh"
+
+# Shared pass/fail/skip/section helpers
+source "${PROJECT_ROOT}/.claude/lib/testing/fixture-helpers.sh"
+
+readonly WORK_DIR="$(mktemp -d)"
+trap 'rm -rf "$WORK_DIR"' EXIT
+
+# Two agents sharing a rule through a skill and a direct import
+create_agents() {
+    local root="${WORK_DIR}/repo"
+    mkdir -p "${root}/.claude/agents" "${root}/.claude/skills/prd-create" "${root}/.claude/rules"
+
+    cat > "${root}/.claude/agents/architect.md" <<'EOF'
+---
+name: architect
+skills: prd-create, [review-checklist]
+---
+
+# Architect
+
+See @.claude/rules/governance.md
+
+## Responsibilities
+
+Design systems, review plans, and keep the architecture documentation current.
+Design systems, review plans, and keep the architecture documentation current.
+
+```markdown
+## Not a section
+```
+
+## Tools
+
+- Read
+EOF
+
+    cat > "${root}/.claude/agents/tester.md" <<'EOF'
+---
+name: tester
+skills:
+  - review-checklist
+  - missing-skill
+---
+
+# Tester
+EOF
+
+    printf '# PRD Create\n\nFollow @.claude/rules/governance.md\n' > "${root}/.claude/skills/prd-create/SKILL.md"
+    printf '# Checklist\n\n- item\n' > "${root}/.claude/skills/review-checklist.md"
+    printf '# Governance\n\nRules.\n' > "${root}/.claude/rules/governance.md"
+
+    echo "$root"
+}
+
+run_profile() {
+    PROMPT_ROOT="$ROOT" "$PROFILER" "$@"
+}
+
+# Expected estimate for a set of files: bytes / 4, rounded up, per file
+expected_tokens() {
+    local file total=0 bytes
+    for file in "$@"; do
+        bytes=$(wc -c < "${ROOT}/${file}" | tr -d ' ')
+        total=$((total + (bytes + 3) / 4))
+    done
+    echo "$total"
+}
+
+# ============================================================================
+# Script File Tests
+# ============================================================================
+
+test_profiler_exists() {
+    if [[ -x "$PROFILER" ]] && bash -n "$PROFILER" 2>/dev/null; then
+        pass "prompt-profile.sh exists with valid syntax"
+    else
+        fail "prompt-profile.sh exists with valid syntax" "Missing, not executable, or syntax errors"
+    fi
+}
+
+# ============================================================================
+# Expansion Tests
+# ============================================================================
+
+test_expanded_size() {
+    local summary expected
+    summary=$(cd "$ROOT" && source "$PROFILER" && profile_agent .claude/agents/architect.md)
+    expected=$(expected_tokens .claude/agents/architect.md .claude/rules/governance.md \
+        .claude/skills/prd-create/SKILL.md .claude/skills/review-checklist.md)
+
+    if [[ "$summary" == "architect	4	$(cat "${ROOT}"/.claude/agents/architect.md "${ROOT}"/.claude/rules/governance.md \
+        "${ROOT}"/.claude/skills/prd-create/SKILL.md "${ROOT}"/.claude/skills/review-checklist.md | wc -l | tr -d ' ')	${expected}	0" ]]; then
+        pass "Agent + skills + imports counted, shared rule counted once (${expected} tokens)"
+    else
+        fail "Expanded size" "Expected 4 files / ${expected} tokens, got: $summary"
+    fi
+}
+
+test_missing_skill() {
+    local output
+    output=$(run_profile report tester)
+
+    if echo "$output" | grep -q "^tester .*(1 missing)"; then
+        pass "Missing skill reported"
+    else
+        fail "Missing skill" "Got: $output"
+    fi
+}
+
+test_sections() {
+    local output
+    output=$(run_profile sections architect)
+
+    if echo "$output" | sed -n 2p | grep -q "\.claude/agents/architect.md#Responsibilities$" \
+        && echo "$output" | grep -q "architect.md#(frontmatter)$" \
+        && echo "$output" | grep -q "governance.md#Governance$" \
+        && ! echo "$output" | grep -q "Not a section\|(preamble)"; then
+        pass "Tokens attributed to sections, largest first (fences and blank preamble skipped)"
+    else
+        fail "Section attribution" "Got: $output"
+    fi
+
+    if [[ "$(run_profile sections architect --top 2 | wc -l | tr -d ' ')" == "4" ]]; then
+        pass "sections --top N limits rows"
+    else
+        fail "sections --top" "Got: $(run_profile sections architect --top 2)"
+    fi
+}
+
+# ============================================================================
+# Budget Tests
+# ============================================================================
+
+test_budgets() {
+    local output rc=0
+
+    if run_profile check >/dev/null; then
+        pass "Agents within default budget pass"
+    else
+        fail "Default budget" "$(run_profile check)"
+    fi
+
+    output=$(PROMPT_BUDGET_TOKENS=40 run_profile check) || rc=$?
+    if [[ $rc -eq 1 ]] && echo "$output" | grep -q "^architect .*❌" && ! echo "$output" | grep -q "^tester"; then
+        pass "Over-budget agent fails check (PROMPT_BUDGET_TOKENS)"
+    else
+        fail "Budget env" "rc=$rc, got: $output"
+    fi
+
+    mkdir -p "${ROOT}/.claude/metrics"
+    printf '# agent\tmax_tokens\narchitect\t5000\n*\t5\n' > "${ROOT}/.claude/metrics/prompt-budgets.tsv"
+    rc=0
+    output=$(run_profile check) || rc=$?
+    if [[ $rc -eq 1 ]] && echo "$output" | grep -q "^tester .* 5 .*❌" && ! echo "$output" | grep -q "^architect"; then
+        pass "Per-agent budget file overrides the default"
+    else
+        fail "Budget file" "rc=$rc, got: $output"
+    fi
+    rm -f "${ROOT}/.claude/metrics/prompt-budgets.tsv"
+}
+
+# ============================================================================
+# Baseline Tests
+# ============================================================================
+
+test_baseline() {
+    local output
+
+    run_profile seed "${PROJECT_ROOT}/specs/003-agent-refactoring/baseline-metrics.md" >/dev/null
+    run_profile baseline >/dev/null
+    printf '\nMore responsibilities.\n' >> "${ROOT}/.claude/agents/architect.md"
+
+    output=$(run_profile history team-lead)
+    if echo "$output" | grep -q "^2026-01-31 seed .*team-lead .*1346 .*-$"; then
+        pass "Hand counts seeded from baseline-metrics.md"
+    else
+        fail "Seed" "Got: $output"
+    fi
+
+    output=$(run_profile report architect)
+    if echo "$output" | grep -q "^architect .* +6 ✅"; then
+        pass "Report shows token delta against the stored baseline"
+    else
+        fail "Baseline delta" "Got: $output"
+    fi
+}
+
+# ============================================================================
+# Main Test Runner
+# ============================================================================
+
+main() {
+    echo "========================================"
+    echo "  ${TEST_NAME} Integration Tests"
+    echo "========================================"
+    echo "Project Root: ${PROJECT_ROOT}"
+    echo ""
+
+    ROOT=$(create_agents)
+
+    section "Script File Tests"
+    test_profiler_exists
+
+    section "Expansion Tests"
+    test_expanded_size
+    test_missing_skill
+    test_sections
+
+    section "Budget Tests"
+    test_budgets
+
+    section "Baseline Tests"
+    test_baseline
+
+    fixture_summary
+}
+
+# Run tests
+main "$@"